@@ -0,0 +1,404 @@
+# analytics.py
+"""
+Streaming analytics over session stats and telemetry from one or more
+data/ folders (e.g. copied from many kiosks).
+
+    python -m analytics                          # ./data, CSV to stdout
+    python -m analytics kiosk1/data kiosk2/data --format json --out report.json
+    python -m analytics --full                   # ignore the checkpoint index
+
+Files are read with generators, never loaded whole. The checkpoint index
+stores how far each source was read (stats.db row id, telemetry byte
+offset at a gzip member boundary, legacy JSON files seen) together with
+the aggregate state, so a re-run only processes data added since.
+"""
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import sqlite3
+import sys
+import time
+import zlib
+
+from settings import ANALYTICS_INDEX, ANALYTICS_ACCURACY
+from utils import atomic_write
+
+INDEX_VERSION = 1
+READ_CHUNK = 1 << 20
+
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch: values land in log-spaced buckets, so
+    any quantile is within ANALYTICS_ACCURACY relative error, memory grows
+    with the value range rather than the count, and sketches merge by
+    adding bucket counts. Values <= 0 are counted in a zero bucket.
+    """
+    def __init__(self, accuracy=ANALYTICS_ACCURACY):
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value):
+        self.count += 1
+        if value <= 0:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other):
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+
+    def quantile(self, q):
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                # Titik tengah bucket: error relatif <= accuracy
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self):
+        return {"accuracy": self.accuracy, "zeros": self.zeros, "count": self.count,
+                "buckets": {str(k): v for k, v in self.buckets.items()}}
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["accuracy"])
+        sketch.zeros = data["zeros"]
+        sketch.count = data["count"]
+        sketch.buckets = {int(k): v for k, v in data["buckets"].items()}
+        return sketch
+
+
+class LevelStats:
+    """Running aggregates for one level"""
+    FIELDS = ("sessions", "decided", "wins", "score_sum", "score_min", "score_max",
+              "questions", "correct", "timeouts")
+
+    def __init__(self):
+        self.sessions = 0
+        self.decided = 0       # sesi yang tahu menang/kalah (file lama tidak)
+        self.wins = 0
+        self.score_sum = 0
+        self.score_min = None
+        self.score_max = None
+        self.scores = QuantileSketch()
+        self.questions = 0
+        self.correct = 0
+        self.timeouts = 0
+        self.latency = QuantileSketch()
+
+    def add_session(self, score, completed):
+        self.sessions += 1
+        if completed is not None:
+            self.decided += 1
+            self.wins += bool(completed)
+        if score is not None:
+            self.score_sum += score
+            self.score_min = score if self.score_min is None else min(self.score_min, score)
+            self.score_max = score if self.score_max is None else max(self.score_max, score)
+            self.scores.add(score)
+
+    def add_answer(self, correct, timed_out, latency):
+        self.questions += 1
+        self.correct += bool(correct)
+        self.timeouts += bool(timed_out)
+        if latency is not None:
+            self.latency.add(latency)
+
+    def row(self):
+        def ratio(a, b):
+            return round(a / b, 4) if b else None
+
+        def q(sketch, p):
+            value = sketch.quantile(p)
+            return None if value is None else round(value, 2)
+
+        return {
+            "sessions": self.sessions,
+            "wins": self.wins,
+            "win_rate": ratio(self.wins, self.decided),
+            "score_mean": ratio(self.score_sum, self.scores.count),
+            "score_min": self.score_min,
+            "score_p50": q(self.scores, 0.5),
+            "score_p90": q(self.scores, 0.9),
+            "score_p99": q(self.scores, 0.99),
+            "score_max": self.score_max,
+            "questions": self.questions,
+            "accuracy": ratio(self.correct, self.questions),
+            "timeouts": self.timeouts,
+            "latency_p50": q(self.latency, 0.5),
+            "latency_p90": q(self.latency, 0.9),
+        }
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FIELDS}
+        data["scores"] = self.scores.to_dict()
+        data["latency"] = self.latency.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for field in cls.FIELDS:
+            setattr(stats, field, data[field])
+        stats.scores = QuantileSketch.from_dict(data["scores"])
+        stats.latency = QuantileSketch.from_dict(data["latency"])
+        return stats
+
+
+class Report:
+    def __init__(self):
+        self.levels = {}     # level (str, "unknown" untuk file lama) -> LevelStats
+        self.bug_kills = {}  # bug type -> count
+        self.records = 0
+
+    def level(self, level):
+        key = "unknown" if level is None else str(level)
+        stats = self.levels.get(key)
+        if stats is None:
+            stats = self.levels[key] = LevelStats()
+        return stats
+
+    def add_session(self, session):
+        self.records += 1
+        self.level(session.get("level")).add_session(session.get("score"),
+                                                     session.get("completed"))
+
+    def add_event(self, event):
+        self.records += 1
+        kind = event.get("type")
+        if kind == "question_answer":
+            self.level(event.get("level")).add_answer(
+                event.get("correct"), event.get("timed_out"), event.get("latency"))
+        elif kind == "bug_kill":
+            bug = event.get("bug")
+            self.bug_kills[bug] = self.bug_kills.get(bug, 0) + 1
+
+    def rows(self):
+        for level in sorted(self.levels):
+            yield {"level": level, **self.levels[level].row()}
+
+    def to_dict(self):
+        return {"levels": {k: v.to_dict() for k, v in self.levels.items()},
+                "bug_kills": self.bug_kills, "records": self.records}
+
+    @classmethod
+    def from_dict(cls, data):
+        report = cls()
+        report.levels = {k: LevelStats.from_dict(v) for k, v in data["levels"].items()}
+        report.bug_kills = data["bug_kills"]
+        report.records = data["records"]
+        return report
+
+
+# ===============================
+# SOURCES (generators)
+# ===============================
+def stats_db_sessions(path, after_id):
+    """Yield (row id, source, session dict) for stats.db rows newer than after_id"""
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = db.execute("SELECT id, source, level, score, extra FROM sessions WHERE id > ? "
+                            "ORDER BY id", (after_id,))
+        for row_id, source, level, score, extra in cursor:
+            session = json.loads(extra) if extra else {}
+            session["level"] = level
+            session["score"] = score
+            yield row_id, source, session
+    finally:
+        db.close()
+
+
+def stats_db_sources(path):
+    """File names of the stats_*.json files migrated into stats.db"""
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return {source for (source,) in
+                db.execute("SELECT source FROM sessions WHERE source IS NOT NULL")}
+    finally:
+        db.close()
+
+
+def gzip_members(path, offset):
+    """
+    Yield (end offset, decompressed bytes) for each complete gzip member
+    from offset. A member still being written at the end is left for the
+    next run.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        position = offset
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        parts = []
+        while True:
+            data = f.read(READ_CHUNK)
+            if not data:
+                return
+            while data:
+                parts.append(decompressor.decompress(data))
+                if not decompressor.eof:
+                    position += len(data)
+                    break
+                unused = decompressor.unused_data
+                position += len(data) - len(unused)
+                yield position, b"".join(parts)
+                parts = []
+                decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+                data = unused
+
+
+def parse_lines(data):
+    """JSON lines of one member; parsed as one array (much faster than per line)"""
+    try:
+        return json.loads(b"[" + data.rstrip(b"\n").replace(b"\n", b",") + b"]")
+    except ValueError:
+        # Ada baris rusak: ambil baris yang masih valid saja
+        events = []
+        for line in data.splitlines():
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                pass
+        return events
+
+
+class Analytics:
+    def __init__(self, index_path=ANALYTICS_INDEX, full=False):
+        self.index_path = index_path
+        self.files = {}
+        self.report = Report()
+        if not full and index_path and os.path.exists(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                self.files = index["files"]
+                self.report = Report.from_dict(index["report"])
+
+    def scan(self, directory):
+        """Process everything new under one data/ directory"""
+        db_path = os.path.join(directory, "stats.db")
+        migrated = set()
+        if os.path.exists(db_path):
+            migrated = self.scan_stats_db(db_path)
+        for path in sorted(glob.glob(os.path.join(directory, "stats_*.json"))):
+            self.scan_stats_json(path, migrated)
+        for path in sorted(glob.glob(os.path.join(directory, "telemetry", "*.jsonl.gz"))):
+            self.scan_telemetry(path)
+
+    def scan_stats_db(self, path):
+        """
+        Add new rows; returns the sources (JSON file names) of every row.
+        A migrated row whose JSON file an earlier run already counted is
+        skipped, so a session is counted once whichever copy came first.
+        """
+        key = os.path.abspath(path)
+        directory = os.path.dirname(key)
+        last_id = self.files.get(key, {}).get("row_id", 0)
+        for row_id, source, session in stats_db_sessions(path, last_id):
+            if source is None or os.path.join(directory, source) not in self.files:
+                self.report.add_session(session)
+            last_id = row_id
+        self.files[key] = {"row_id": last_id}
+        return stats_db_sources(path)
+
+    def scan_stats_json(self, path, migrated=()):
+        key = os.path.abspath(path)
+        if key in self.files:
+            return  # file lama tidak pernah berubah
+        if os.path.basename(path) in migrated:
+            return  # sudah dihitung dari baris stats.db-nya
+        with open(path) as f:
+            try:
+                self.report.add_session(json.load(f))
+            except ValueError:
+                pass
+        self.files[key] = {"mtime": os.path.getmtime(path)}
+
+    def scan_telemetry(self, path):
+        key = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self.files.get(key, {})
+        offset = entry.get("offset", 0)
+        if stat.st_size < offset:
+            offset = 0  # file lain dengan nama yang sama
+        if stat.st_size == offset and entry.get("mtime") == stat.st_mtime:
+            return
+        add_event = self.report.add_event
+        for offset, data in gzip_members(path, offset):
+            for event in parse_lines(data):
+                add_event(event)
+        self.files[key] = {"offset": offset, "mtime": stat.st_mtime}
+
+    def save(self):
+        if not self.index_path:
+            return
+        directory = os.path.dirname(self.index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        index = {"version": INDEX_VERSION, "files": self.files, "report": self.report.to_dict()}
+        atomic_write(self.index_path, [json.dumps(index)])
+
+
+def write_csv(report, out):
+    rows = list(report.rows())
+    if not rows:
+        return
+    writer = csv.DictWriter(out, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def write_json(report, out):
+    json.dump({"records": report.records,
+               "levels": {row.pop("level"): row for row in report.rows()},
+               "bug_kills": report.bug_kills}, out, indent=2)
+    out.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("dirs", nargs="*", default=["data"], help="data/ folders to scan")
+    parser.add_argument("--index", default=ANALYTICS_INDEX, help="checkpoint index file")
+    parser.add_argument("--full", action="store_true", help="ignore the index, rescan everything")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv")
+    parser.add_argument("--out", help="write the report here instead of stdout")
+    args = parser.parse_args()
+
+    analytics = Analytics(args.index, full=args.full)
+    before = analytics.report.records
+    start = time.perf_counter()
+    for directory in args.dirs:
+        analytics.scan(directory)
+    elapsed = time.perf_counter() - start
+    analytics.save()
+
+    write = write_csv if args.format == "csv" else write_json
+    if args.out:
+        with open(args.out, "w", newline="") as out:
+            write(analytics.report, out)
+    else:
+        write(analytics.report, sys.stdout)
+    new = analytics.report.records - before
+    print(f"{new} new records in {elapsed:.2f} s ({new / max(elapsed, 1e-9):,.0f}/s)",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+# asset_pack.py
+"""
+Runtime assets in one memory-mapped file, so startup opens a single file
+instead of every sound plus questions.json (slow per-file open/seek on
+SD cards).
+
+    python -m asset_pack build [--force]   # (re)build ASSET_PACK
+    python -m asset_pack list
+
+Layout: MAGIC, uint32 version, uint32 index length, the JSON index, then
+the data section starting at the next ALIGN boundary, each entry ALIGN
+aligned. WAV files are stored as PCM already in the mixer format
+(Sound.get_raw), so loading one is Sound(buffer=...) on a slice of the
+map; other files (music, JSON) are stored as they are. The index keeps
+each source's sha256: a rebuild reuses unchanged entries from the old
+pack and doesn't rewrite it at all when nothing changed. It also keeps
+each source's size and mtime, so at load time an entry whose loose file
+changed since the build counts as missing and the file is used instead.
+
+The game uses the pack when it exists and falls back to the loose files
+otherwise; rebuild it after changing sounds or questions.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+
+from settings import ASSET_PACK, MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER
+from utils import atomic_write
+
+MAGIC = b"DGPK"
+VERSION = 2  # 2: size/mtime sumber di index
+HEADER = struct.Struct("<4sII")
+ALIGN = 64
+SOURCES = ("sounds/*.wav", "sounds/*.mp3", "sounds/*.ogg", "data/questions.json")
+PCM_SUFFIXES = (".wav",)  # didecode ke PCM saat build; sisanya disimpan apa adanya
+MIXER_FORMAT = [MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS]
+
+
+def align(n):
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+class AssetPack:
+    """Read side: entries are memoryview slices of one read-only mmap"""
+    def __init__(self, path=ASSET_PACK):
+        self.path = path
+        with open(path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, index_len = HEADER.unpack_from(self.map)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a version {VERSION} asset pack")
+            self.index = json.loads(self.map[HEADER.size:HEADER.size + index_len])
+        except (ValueError, struct.error):
+            self.map.close()
+            raise
+        self.entries = self.index["entries"]
+        self.base = align(HEADER.size + index_len)
+        self.view = memoryview(self.map)
+        self.checked = {}  # name -> sumber tidak berubah sejak build
+
+    def __contains__(self, name):
+        """Packed and still current (see fresh())"""
+        return name in self.entries and self.fresh(name)
+
+    def fresh(self, name):
+        """False if the loose source changed since the pack was built"""
+        ok = self.checked.get(name)
+        if ok is None:
+            entry = self.entries[name]
+            try:
+                ok = source_stat(name) == (entry["source_size"], entry["mtime_ns"])
+            except OSError:
+                ok = True  # hanya pack yang dikirim, tanpa file lepas
+            if not ok:
+                print(f"Asset pack: {name} changed since the pack was built, using the file "
+                      f"(run python -m asset_pack build)")
+            self.checked[name] = ok
+        return ok
+
+    def data(self, name):
+        """Zero-copy view of an entry's bytes"""
+        entry = self.entries[name]
+        start = self.base + entry["offset"]
+        return self.view[start:start + entry["size"]]
+
+    def pcm(self, name):
+        """PCM view of a sound, or None if it isn't packed in the current mixer format"""
+        import pygame
+
+        entry = self.entries.get(name)
+        if entry is None or entry["kind"] != "pcm" or not self.fresh(name):
+            return None
+        if list(pygame.mixer.get_init() or ()) != self.index["mixer"]:
+            return None
+        return self.data(name)
+
+    def close(self):
+        """Unmap (every view from data() must be released first)"""
+        self.view.release()
+        self.map.close()
+
+
+# ===============================
+# BUILD
+# ===============================
+def source_paths(patterns=SOURCES):
+    paths = []
+    for pattern in patterns:
+        paths.extend(sorted(glob.glob(pattern)))
+    return [path.replace(os.sep, "/") for path in paths]
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def source_stat(path):
+    st = os.stat(path)
+    return st.st_size, st.st_mtime_ns
+
+
+def convert(path):
+    """(kind, bytes) of one source as stored in the pack"""
+    if path.endswith(PCM_SUFFIXES):
+        import pygame
+
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE,
+                              channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
+        return "pcm", pygame.mixer.Sound(path).get_raw()
+    with open(path, "rb") as f:
+        return "raw", f.read()
+
+
+def open_previous(path):
+    try:
+        old = AssetPack(path)
+    except (OSError, ValueError):
+        return None
+    if old.index["mixer"] != MIXER_FORMAT:
+        old.close()
+        return None
+    return old
+
+
+def build(path=ASSET_PACK, sources=None, force=False):
+    """
+    Write the pack from sources (SOURCES globs by default).
+    Returns (converted, reused) entry names, or None if it was up to date.
+    """
+    sources = source_paths() if sources is None else sources
+    hashes = {name: file_hash(name) for name in sources}
+    stats = {name: source_stat(name) for name in sources}
+    old = None if force else open_previous(path)
+
+    blobs = []
+    converted, reused = [], []
+    try:
+        if old is not None and {n: (e["sha256"], e["source_size"], e["mtime_ns"])
+                                for n, e in old.entries.items()} == \
+                {name: (hashes[name], *stats[name]) for name in sources}:
+            return None
+        for name in sources:
+            entry = old.entries.get(name) if old is not None else None
+            if entry is not None and entry["sha256"] == hashes[name]:
+                # Tidak berubah: salin dari pack lama, tanpa decode ulang
+                blobs.append((name, entry["kind"], bytes(old.data(name))))
+                reused.append(name)
+            else:
+                blobs.append((name, *convert(name)))
+                converted.append(name)
+    finally:
+        if old is not None:
+            old.close()  # Windows tidak bisa mengganti file yang masih di-map
+
+    entries = {}
+    offset = 0
+    for name, kind, data in blobs:
+        entries[name] = {"kind": kind, "offset": offset, "size": len(data),
+                         "sha256": hashes[name], "source_size": stats[name][0],
+                         "mtime_ns": stats[name][1]}
+        offset = align(offset + len(data))
+    index = json.dumps({"mixer": MIXER_FORMAT, "entries": entries}).encode()
+
+    def chunks():
+        yield HEADER.pack(MAGIC, VERSION, len(index))
+        yield index
+        written = HEADER.size + len(index)
+        yield bytes(align(written) - written)
+        for _, _, data in blobs:
+            yield data
+            yield bytes(align(len(data)) - len(data))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    atomic_write(path, chunks(), mode="wb")
+    return converted, reused
+
+
+_pack = None
+_opened = False
+_lock = threading.Lock()  # audio loader dan warm-up worker bisa membuka bersamaan
+
+
+def pack():
+    """Shared pack, mapped on first use; None if there is none (loose files are used)"""
+    global _pack, _opened
+    with _lock:
+        if not _opened:
+            _opened = True
+            try:
+                _pack = AssetPack()
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                print(f"Asset pack ignored: {e}")
+    return _pack
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pack", default=ASSET_PACK)
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_parser = sub.add_parser("build", help="build or update the pack")
+    build_parser.add_argument("--force", action="store_true", help="convert every asset again")
+    sub.add_parser("list", help="print the pack index")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")  # konversi saja, tanpa device
+        result = build(args.pack, force=args.force)
+        if result is None:
+            print(f"{args.pack} is up to date")
+        else:
+            converted, reused = result
+            print(f"{args.pack}: {len(converted)} converted, {len(reused)} unchanged "
+                  f"({os.path.getsize(args.pack):,} bytes)")
+    else:
+        assets = AssetPack(args.pack)
+        for name, entry in assets.entries.items():
+            print(f"{entry['kind']:4} {entry['size']:>10,}  {entry['sha256'][:12]}  {name}")
+        assets.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,61 @@
 # audio_manager.py
 import pygame
+import io
 import os
-import numpy as np
+import threading
+import time
+
+from cache_registry import ManagedCache
+from settings import MIXER_FREQUENCY, MIXER_SIZE, MIXER_CHANNELS, MIXER_BUFFER
 
 class AudioManager:
+    """
+    Mixer init and sound loading run on a loader thread (start()), so the
+    first frame never waits for audio. Until it is ready, play() is silent
+    and play_music() only remembers the track.
+    """
     def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-        self.sounds = {}
+        self.sounds = ManagedCache("sounds", pinned=True)  # dihitung di budget, tidak dievict
         self.music_volume = 0.3
         self.sfx_volume = 0.7
-        self.load_sounds()
+        self.ready = threading.Event()
+        self.lock = threading.Lock()  # urutan play_music vs loader
+        self.pending_music = None
+        self.loader = None
+        self.ready_at = None  # perf_counter saat siap (benchmark startup)
+        self.pack = None      # asset pack, dibuka oleh loader
+
+    def start(self):
+        """Initialise the mixer and load sounds in the background"""
+        if self.loader is None:
+            self.loader = threading.Thread(target=self.load, name="audio-loader", daemon=True)
+            self.loader.start()
+
+    def wait(self):
+        """Block until the loader thread is done (used before pygame.quit)"""
+        if self.loader is not None:
+            self.loader.join()
+
+    def load(self):
+        try:
+            pygame.mixer.init(frequency=MIXER_FREQUENCY, size=MIXER_SIZE,
+                              channels=MIXER_CHANNELS, buffer=MIXER_BUFFER)
+        except pygame.error as e:
+            print(f"Audio disabled: {e}")
+            return
+        try:
+            import asset_pack  # di thread loader: hashlib/mmap tidak ikut startup
+            self.pack = asset_pack.pack()
+            self.load_sounds()
+        finally:
+            # Error apa pun tetap terlihat (traceback thread), tapi suara yang
+            # sudah dimuat dan musik tetap jalan, bukan bisu sepanjang sesi
+            with self.lock:
+                self.ready_at = time.perf_counter()
+                self.ready.set()
+                if self.pending_music is not None:
+                    self._start_music(*self.pending_music)
+                    self.pending_music = None
     
     def load_sounds(self):
         """Load semua efek suara"""
@@ -35,32 +81,44 @@ class AudioManager:
             'button_click': 'sounds/button_click.wav',
             'menu_select': 'sounds/menu_select.wav',
             'hover': 'sounds/hover.wav',
-            
-            'music_background': 'sounds/background_music.mp3'
         }
+        # Musik latar di-stream lewat pygame.mixer.music (play_music),
+        # tidak didecode penuh jadi Sound
         
-        # Buat folder sounds jika belum ada
-        if not os.path.exists('sounds'):
+        # Asset pack: PCM siap pakai dari satu file yang di-map, tanpa decode
+        pack = self.pack
+        if pack is None and not os.path.exists('sounds'):
+            # Buat folder sounds jika belum ada
             os.makedirs('sounds')
             print("Folder 'sounds' created. Please add your sound files!")
         
         # Load sounds
         for name, path in sound_files.items():
             try:
+                pcm = pack.pcm(path) if pack is not None else None
+                if pcm is not None:
+                    self.sounds[name] = pygame.mixer.Sound(buffer=pcm)
+                    self.sounds[name].set_volume(self.sfx_volume)
+                    continue
                 if os.path.exists(path):
                     self.sounds[name] = pygame.mixer.Sound(path)
                     self.sounds[name].set_volume(self.sfx_volume)
-                else:
-                    # Create placeholder sound
-                    self.create_placeholder_sound(name)
-                    print(f"Created placeholder sound: {name}")
+                    continue
             except Exception as e:
                 print(f"Error loading {path}: {e}")
+            # File tidak ada atau rusak: placeholder (sekali saja)
+            try:
                 self.create_placeholder_sound(name)
+                print(f"Created placeholder sound: {name}")
+            except Exception as e:
+                print(f"No sound for {name}: {e}")
     
     def create_placeholder_sound(self, name):
         """Create simple placeholder sound"""
-        sample_rate = 22050
+        # Hanya untuk placeholder; tidak ikut startup (lihat main.py)
+        import numpy as np
+        import pygame.sndarray
+        sample_rate = MIXER_FREQUENCY
         
         # Tentukan parameter berdasarkan jenis suara
         if 'hit' in name:
@@ -172,14 +230,17 @@ class AudioManager:
         
         # Convert to pygame sound
         sound_array = np.int16(wave * 32767)
-        sound = pygame.sndarray.make_sound(sound_array.reshape(-1, 1))
+        if MIXER_CHANNELS > 1:
+            # Mono yang sama di setiap channel mixer
+            sound_array = np.repeat(sound_array.reshape(-1, 1), MIXER_CHANNELS, axis=1)
+        sound = pygame.sndarray.make_sound(sound_array)
         
         self.sounds[name] = sound
         self.sounds[name].set_volume(self.sfx_volume)
     
     def play(self, sound_name, volume_mult=1.0):
-        """Play a sound effect"""
-        if sound_name in self.sounds:
+        """Play a sound effect (silent until the loader is done)"""
+        if self.ready.is_set() and sound_name in self.sounds:
             current_volume = self.sfx_volume * volume_mult
             self.sounds[sound_name].set_volume(min(1.0, current_volume))
             self.sounds[sound_name].play()
@@ -193,11 +254,26 @@ class AudioManager:
     def set_music_volume(self, volume):
         """Set music volume (0.0 to 1.0)"""
         self.music_volume = max(0.0, min(1.0, volume))
-        pygame.mixer.music.set_volume(self.music_volume)
+        if self.ready.is_set():
+            pygame.mixer.music.set_volume(self.music_volume)
     
     def play_music(self, filepath, loops=-1):
-        """Play background music"""
-        if os.path.exists(filepath):
+        """Play background music (starts once the mixer is ready)"""
+        with self.lock:
+            if self.ready.is_set():
+                self._start_music(filepath, loops)
+            else:
+                self.pending_music = (filepath, loops)
+
+    def _start_music(self, filepath, loops):
+        pack = self.pack
+        if pack is not None and filepath in pack:
+            # Dari pack ke memori: tidak ada baca SD card selama musik diputar
+            music = io.BytesIO(pack.data(filepath))
+            pygame.mixer.music.load(music, os.path.splitext(filepath)[1].lstrip("."))
+            pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.music.play(loops)
+        elif os.path.exists(filepath):
             pygame.mixer.music.load(filepath)
             pygame.mixer.music.set_volume(self.music_volume)
             pygame.mixer.music.play(loops)
@@ -206,12 +282,15 @@ class AudioManager:
     
     def stop_music(self):
         """Stop background music"""
-        pygame.mixer.music.stop()
+        if self.ready.is_set():
+            pygame.mixer.music.stop()
     
     def pause_music(self):
         """Pause background music"""
-        pygame.mixer.music.pause()
+        if self.ready.is_set():
+            pygame.mixer.music.pause()
     
     def resume_music(self):
         """Resume background music"""
-        pygame.mixer.music.unpause()
\ No newline at end of file
+        if self.ready.is_set():
+            pygame.mixer.music.unpause()
\ No newline at end of file
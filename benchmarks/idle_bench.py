@@ -0,0 +1,102 @@
+# benchmarks/idle_bench.py
+"""
+Idle power benchmark: runs the real game loop on the home screen in each
+idle mode and prints CPU use (and package energy where RAPL is readable)
+as a JSON summary.
+
+    python -m benchmarks.idle_bench                 # 10 s per mode
+    python -m benchmarks.idle_bench --seconds 60 --out idle.json
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import time
+
+import pygame
+
+RAPL_DIR = "/sys/class/powercap/intel-rapl:0"
+
+# mode -> event yang dipost sebelum loop jalan
+MODES = {
+    "full_rate": None,          # menu dipaksa 60 FPS (perilaku lama)
+    "menu": None,               # redraw event-driven + cadence ambient
+    "unfocused": pygame.WINDOWFOCUSLOST,
+    "minimized": pygame.WINDOWMINIMIZED,
+}
+
+
+def read_energy_uj():
+    """Package energy counter in microjoules, or None without RAPL access"""
+    try:
+        with open(os.path.join(RAPL_DIR, "energy_uj")) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def energy_range_uj():
+    try:
+        with open(os.path.join(RAPL_DIR, "max_energy_range_uj")) as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+def bench_mode(mode, seconds):
+    from main import Game
+    game = Game()
+    if mode == "full_rate":
+        game.scene.ambient_fps = None
+    if MODES[mode] is not None:
+        pygame.event.post(pygame.event.Event(MODES[mode]))
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), loops=1)
+
+    energy_start = read_energy_uj()
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    game.run()
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    energy_end = read_energy_uj()
+
+    result = {
+        "mode": mode,
+        "wall_s": round(wall, 3),
+        "cpu_s": round(cpu, 3),
+        "cpu_percent": round(100.0 * cpu / wall, 2),
+        "frames": game.profiler.frame_number,
+        "fps": round(game.profiler.frame_number / wall, 2),
+        "energy_j": None,
+        "watts": None,
+    }
+    if energy_start is not None and energy_end is not None:
+        used = energy_end - energy_start
+        if used < 0:  # counter wrap
+            used += energy_range_uj() or 0
+        # RAPL mengukur seluruh package, bukan hanya proses ini
+        result["energy_j"] = round(used / 1e6, 3)
+        result["watts"] = round(used / 1e6 / wall, 3)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=10.0, help="run time per mode")
+    parser.add_argument("--modes", nargs="*", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--out", help="write the JSON summary to this file")
+    args = parser.parse_args()
+
+    report = {"rapl": read_energy_uj() is not None,
+              "runs": [bench_mode(mode, args.seconds) for mode in args.modes]}
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
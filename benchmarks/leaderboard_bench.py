@@ -0,0 +1,110 @@
+# benchmarks/leaderboard_bench.py
+"""
+Leaderboard submission benchmark: per-submission cost against history size,
+next to the old read-sort-rewrite approach.
+
+    python -m benchmarks.leaderboard_bench
+    python -m benchmarks.leaderboard_bench --history 0 10000 1000000 --out lb.json
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from leaderboard import Leaderboard
+
+
+def legacy_append(path, name, score):
+    """The old utils.append_leaderboard: parse everything, sort, rewrite"""
+    entries = []
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line.strip()))
+                except ValueError:
+                    pass
+    entries.append({"name": name, "score": score, "ts": int(time.time())})
+    entries = sorted(entries, key=lambda x: x["score"], reverse=True)[:10]
+    with open(path, "w") as f:
+        for e in entries:
+            f.write(json.dumps(e) + "\n")
+    return entries
+
+
+def write_history(log_path, count, rng):
+    """Fill a log with `count` past submissions spread over three levels"""
+    with open(log_path, "w") as f:
+        for i in range(count):
+            f.write(json.dumps({"name": f"p{i}", "score": rng.randrange(10000),
+                                "level": rng.randint(1, 3), "ts": i, "id": f"h{i}"}) + "\n")
+
+
+def timings(submit, count, rng):
+    samples = []
+    for i in range(count):
+        start = time.perf_counter()
+        submit(f"bench{i}", rng.randrange(10000))
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return {
+        "mean_us": round(sum(samples) / len(samples), 1),
+        "p50_us": round(samples[len(samples) // 2], 1),
+        "p99_us": round(samples[int(len(samples) * 0.99)], 1),
+        "max_us": round(samples[-1], 1),
+    }
+
+
+def bench_history(history, submissions, seed):
+    rng = random.Random(seed)
+    directory = tempfile.mkdtemp(prefix="lb_bench_")
+    try:
+        path = os.path.join(directory, "leaderboard.txt")
+        log_path = os.path.join(directory, "leaderboard.log")
+        write_history(log_path, history, rng)
+
+        start = time.perf_counter()
+        board = Leaderboard(path, log_path)
+        load_ms = (time.perf_counter() - start) * 1000
+        result = {"history": history, "load_ms": round(load_ms, 2)}
+        # Submit pertama bisa memicu compaction dari history; tetap dihitung (max_us)
+        result["submit"] = timings(lambda name, score: board.submit(name, score, rng.randint(1, 3)),
+                                   submissions, rng)
+        return result
+    finally:
+        shutil.rmtree(directory)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--history", type=int, nargs="*", default=[0, 1000, 10000, 100000],
+                        help="past submissions already in the log")
+    parser.add_argument("--submissions", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", help="write the JSON summary to this file")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="lb_legacy_")
+    try:
+        legacy_path = os.path.join(directory, "leaderboard.txt")
+        legacy = timings(lambda name, score: legacy_append(legacy_path, name, score),
+                         args.submissions, random.Random(args.seed))
+    finally:
+        shutil.rmtree(directory)
+
+    report = {
+        "legacy_submit": legacy,
+        "runs": [bench_history(h, args.submissions, args.seed) for h in args.history],
+    }
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/memory_bench.py
+"""
+Entity memory benchmark: builds COUNT instances of each entity type and
+reports the Python heap bytes per instance measured with tracemalloc
+(the instance, its Rect and whatever it allocates), as JSON. Pixel
+buffers of surfaces live in SDL's heap and are not included.
+
+    python -m benchmarks.memory_bench
+    python -m benchmarks.memory_bench --count 50000 --out memory.json
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+
+import pygame
+
+COUNT = 10000
+
+
+def entity_types():
+    """name -> factory(i) for every entity type in a level"""
+    from entities.bug import Bug, ChatBug, NotifBadge, PopupBug
+    from entities.floworb import FlowOrb
+    from entities.particle import Particle
+    from entities.plant import Plant
+    from entities.player import Player
+
+    kinds = ("spark", "leaf", "pop", "flow")
+    return {
+        "Bug": lambda i: Bug(i % 1000, i // 1000),
+        "ChatBug": lambda i: ChatBug(i % 1000, i // 1000),
+        "NotifBadge": lambda i: NotifBadge(i % 1000, i // 1000),
+        "PopupBug": lambda i: PopupBug(i % 1000, i // 1000),
+        "Particle": lambda i: Particle(i % 1000, i // 1000, kinds[i % len(kinds)]),
+        "Plant": lambda i: Plant(i % 1000, i // 1000),
+        "FlowOrb": lambda i: FlowOrb(i % 1000, i // 1000),
+        "Player": lambda i: Player(i % 1000, i // 1000),
+    }
+
+
+def measure(factory, count):
+    """(bytes per instance, instance has a __dict__)"""
+    gc.collect()
+    gc.disable()
+    try:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        items = [factory(i) for i in range(count)]
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    finally:
+        gc.enable()
+    # Tanpa list yang menampung instance
+    per_entity = (after - before - sys.getsizeof(items)) / count
+    return per_entity, hasattr(items[0], "__dict__")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=COUNT, help="instances per type")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", help="write the JSON summary to this file")
+    args = parser.parse_args()
+
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))  # Player membuat surface dalam format display
+    random.seed(args.seed)
+
+    types = entity_types()
+    for factory in types.values():
+        factory(0)  # sprite/font cache dan import tidak ikut terhitung
+
+    report = {"count": args.count, "entities": {}}
+    for name, factory in types.items():
+        per_entity, has_dict = measure(factory, args.count)
+        report["entities"][name] = {"bytes_per_entity": round(per_entity, 1),
+                                    "has_dict": has_dict}
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
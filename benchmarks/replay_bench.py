@@ -0,0 +1,88 @@
+# benchmarks/replay_bench.py
+"""
+Deterministic frame-time benchmark: plays replays headless with the frame
+profiler attached and prints a JSON summary.
+
+    python -m benchmarks.replay_bench                  # synthetic run per level
+    python -m benchmarks.replay_bench data/replays/x.dgr --out bench.json
+    python -m benchmarks.replay_bench --cache-mb 4     # under cache memory pressure
+    python -m benchmarks.replay_bench --speed 1        # real time: GC runs in frame slack
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import time
+
+import pygame
+import cache_registry
+import gc_policy
+from profiler import FrameProfiler, WORK_PHASES
+from replay import Replay, Replayer
+
+
+def summarize(profiler):
+    return {
+        "frames": profiler.count,
+        "mean_ms": round(sum(profiler.samples()) / max(1, profiler.count), 3),
+        "p50_ms": round(profiler.percentile(50), 3),
+        "p99_ms": round(profiler.percentile(99), 3),
+        "max_ms": round(max(profiler.samples(), default=0.0), 3),
+        "phases_ms": {p: round(profiler.phase_average(p), 3) for p in WORK_PHASES},
+        "gc_total_ms": round(sum(profiler.samples(profiler.gc_ms)), 3),
+        "gc_max_ms": round(max(profiler.samples(profiler.gc_ms), default=0.0), 3),
+    }
+
+
+def bench_replay(game, replay, render=True, speed=0):
+    # History besar supaya semua tick masuk ke ring buffer
+    profiler = FrameProfiler(history=len(replay.ticks), spike_log=None)
+    start = time.perf_counter()
+    ticks = Replayer(game, replay).run(render=render, speed=speed, profiler=profiler)
+    result = {
+        "level": replay.level_id,
+        "seed": replay.seed,
+        "ticks": ticks,
+        "wall_s": round(time.perf_counter() - start, 3),
+    }
+    result.update(summarize(profiler))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("replays", nargs="*", help="replay files; synthetic runs if omitted")
+    parser.add_argument("--ticks", type=int, default=3600, help="ticks per synthetic run")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--no-render", action="store_true", help="simulation only")
+    parser.add_argument("--speed", type=float, default=0, help="1.0 = real time, 0 = unthrottled")
+    parser.add_argument("--cache-mb", type=float, help="cache budget instead of CACHE_BUDGET_MB")
+    parser.add_argument("--out", help="write the JSON summary to this file")
+    args = parser.parse_args()
+
+    if args.cache_mb is not None:
+        cache_registry.registry.set_budget(args.cache_mb)
+    from main import Game
+    game = Game()
+
+    if args.replays:
+        replays = [Replay.load(path) for path in args.replays]
+    else:
+        replays = [Replay.synthetic(level, args.ticks, args.seed) for level in (1, 2, 3)]
+
+    report = {"runs": [bench_replay(game, r, render=not args.no_render, speed=args.speed)
+                       for r in replays]}
+    report["caches"] = cache_registry.stats()
+    report["gc"] = gc_policy.stats()
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
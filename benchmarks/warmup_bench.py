@@ -0,0 +1,114 @@
+# benchmarks/warmup_bench.py
+"""
+Warm-up benchmark: in a fresh process, optionally idles on the home screen
+until the warm-up is done, then starts a level twice (same replay) and
+compares the first run with the later one: scene construction, the first
+QuestionScene and frame times. Prints a JSON summary per mode.
+
+    python -m benchmarks.warmup_bench
+    python -m benchmarks.warmup_bench --ticks 1200 --out warmup.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+MODES = ("cold", "warm")
+
+
+def play(game, replay):
+    """Construct the level and its first question, then play the replay"""
+    from profiler import FrameProfiler
+    from replay import Replayer
+
+    start = time.perf_counter()
+    from scenes.game_scene import GameScene
+    scene = GameScene(game, replay.level_id, seed=replay.seed)
+    construct_ms = (time.perf_counter() - start) * 1000.0
+
+    from scenes.question_scene import QuestionScene
+    start = time.perf_counter()
+    QuestionScene(game, replay.level_id, lambda *args: None, scene)
+    question_ms = (time.perf_counter() - start) * 1000.0
+
+    profiler = FrameProfiler(history=len(replay.ticks), spike_log=None)
+    Replayer(game, replay).run(render=True, speed=0, profiler=profiler)
+    samples = profiler.samples()
+    return {
+        "construct_ms": round(construct_ms, 2),
+        "question_ms": round(question_ms, 2),
+        "first_frame_ms": round(samples[0], 3),
+        "p50_ms": round(profiler.percentile(50), 3),
+        "p99_ms": round(profiler.percentile(99), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def child(mode, level, ticks, seed):
+    import cache_registry
+    import main
+    import pygame
+    import warmup
+    from replay import Replay
+
+    game = main.Game()  # menyiapkan warm-up; tanpa step() tidak ada yang jalan
+    result = {"mode": mode}
+    if mode == "warm":
+        # Seperti Game.run di home screen: satu step warm-up per frame menu
+        start = time.perf_counter()
+        frames = 0
+        worst = 0.0
+        while not warmup.ready():
+            frame_start = time.perf_counter()
+            game.scene.update(1.0 / 60)
+            game.scene.render(game.screen)
+            pygame.display.flip()
+            warmup.step()
+            worst = max(worst, (time.perf_counter() - frame_start) * 1000.0)
+            frames += 1
+            time.sleep(0.001)  # waktu untuk thread worker, seperti pacer
+        result["warmup_ms"] = round((time.perf_counter() - start) * 1000.0, 1)
+        result["warmup_frames"] = frames
+        result["warmup_worst_frame_ms"] = round(worst, 2)
+
+    replay = Replay.synthetic(level, ticks, seed)
+    result["first"] = play(game, replay)
+    result["later"] = play(game, replay)
+    result["caches"] = cache_registry.stats()
+    print(json.dumps(result))
+
+
+def launch(mode, args):
+    env = dict(os.environ, SDL_VIDEODRIVER=os.environ.get("SDL_VIDEODRIVER", "dummy"),
+               SDL_AUDIODRIVER=os.environ.get("SDL_AUDIODRIVER", "dummy"),
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    command = [sys.executable, "-m", "benchmarks.warmup_bench", "--child", mode,
+               "--level", str(args.level), "--ticks", str(args.ticks), "--seed", str(args.seed)]
+    output = subprocess.run(command, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--level", type=int, default=1)
+    parser.add_argument("--ticks", type=int, default=1800)
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--out", help="write the JSON summary to this file")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.level, args.ticks, args.seed)
+        return
+
+    report = {"runs": [launch(mode, args) for mode in MODES]}
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text + "\n")
+
+
+if __name__ == "__main__":
+    main()
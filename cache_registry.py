@@ -0,0 +1,232 @@
+# cache_registry.py
+"""
+One memory budget for every asset cache (sprite frames, glow textures,
+gradients, text atlases, sounds).
+
+Each ManagedCache is a dict-like store that reports the bytes of its
+values: surfaces by width * height * bytes per pixel, sounds by their
+sample buffer size. The shared registry keeps the total under
+CACHE_BUDGET_MB; when a store goes over, it evicts across all caches with
+GreedyDual-Size (a cost-aware LRU): every entry gets the priority
+L + cost / bytes on insert and on each hit, the entry with the lowest
+priority goes first and L rises to its priority, so entries that were
+slow to build or are small stay longer and old ones age out. The cost is
+the time from the miss in get() to the store of that key, i.e. how long
+the caller took to rebuild it.
+
+Eviction only drops the cache's reference; a caller that kept the value
+(a HUD holding its atlas) keeps using it.
+"""
+import threading
+import time
+
+import pygame
+from settings import CACHE_BUDGET_MB, CACHE_LOW_WATER
+
+DEFAULT_COST_MS = 1.0  # value disimpan tanpa miss sebelumnya (mis. loader suara)
+
+
+def value_bytes(value):
+    """Approximate bytes held by a cached surface, sound, frame list or atlas"""
+    if isinstance(value, pygame.Surface):
+        return value.get_width() * value.get_height() * value.get_bytesize()
+    if isinstance(value, (list, tuple)):
+        return sum(value_bytes(item) for item in value)
+    if isinstance(value, pygame.mixer.Sound):
+        frequency, size, channels = pygame.mixer.get_init() or (0, 0, 0)
+        return int(value.get_length() * frequency) * channels * (abs(size) // 8)
+    surface = getattr(value, "surface", None)  # GlyphAtlas
+    return value_bytes(surface) if surface is not None else 0
+
+
+class ManagedCache:
+    """
+    Dict-like cache registered with the budget under `name`.
+    Pinned caches count toward the budget but are never evicted (sounds
+    are looked up by name and loaded only once).
+    """
+    def __init__(self, name, pinned=False, sizeof=value_bytes, manager=None):
+        self.name = name
+        self.pinned = pinned
+        self.sizeof = sizeof
+        self.manager = registry if manager is None else manager
+        self.entries = {}  # key -> [priority, value, bytes, credit]
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._missed = None  # (key, perf_counter) dari miss terakhir
+        self.manager.register(self)
+
+    def get(self, key, default=None):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            self._missed = (key, time.perf_counter())
+            return default
+        self.hits += 1
+        entry[0] = self.manager.inflation + entry[3]
+        return entry[1]
+
+    def __getitem__(self, key):
+        entry = self.entries[key]
+        self.hits += 1
+        entry[0] = self.manager.inflation + entry[3]
+        return entry[1]
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def values(self):
+        return [entry[1] for entry in list(self.entries.values())]
+
+    def put(self, key, value, cost_ms=None):
+        """Store value, then evict across caches if the budget is exceeded"""
+        if cost_ms is None:
+            missed = self._missed
+            if missed is not None and missed[0] == key:
+                cost_ms = (time.perf_counter() - missed[1]) * 1000.0
+            else:
+                cost_ms = DEFAULT_COST_MS
+        self._missed = None
+        nbytes = self.sizeof(value)
+        credit = cost_ms / max(1, nbytes)
+        with self.manager.lock:
+            old = self.entries.get(key)
+            if old is not None:
+                self.bytes -= old[2]
+            self.entries[key] = [self.manager.inflation + credit, value, nbytes, credit]
+            self.bytes += nbytes
+            self.manager.added(nbytes - (old[2] if old is not None else 0), self, key)
+        return value
+
+    def refresh(self, key):
+        """Re-measure a value that grew in place (atlas repacked with new glyphs)"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            with self.manager.lock:
+                nbytes = self.sizeof(entry[1])
+                self.bytes += nbytes - entry[2]
+                self.manager.added(nbytes - entry[2], self, key)
+                entry[3] = entry[3] * max(1, entry[2]) / max(1, nbytes)
+                entry[2] = nbytes
+
+    def pop(self, key, default=None):
+        with self.manager.lock:
+            entry = self.entries.pop(key, None)
+            if entry is None:
+                return default
+            self.bytes -= entry[2]
+            self.manager.total -= entry[2]
+        return entry[1]
+
+    def clear(self):
+        with self.manager.lock:
+            self.manager.total -= self.bytes
+            self.entries.clear()
+            self.bytes = 0
+
+    def evict(self, key):
+        entry = self.entries.pop(key)
+        self.bytes -= entry[2]
+        self.evictions += 1
+        return entry[2]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+class CacheRegistry:
+    """Byte total of every ManagedCache and the GreedyDual-Size eviction"""
+    def __init__(self, budget_mb=CACHE_BUDGET_MB, low_water=CACHE_LOW_WATER):
+        self.budget = int(budget_mb * 1024 * 1024)
+        self.low_water = low_water
+        self.caches = {}  # name -> ManagedCache
+        self.total = 0
+        self.inflation = 0.0  # L: priority of the last evicted entry
+        self.evictions = 0
+        self.evicted_bytes = 0
+        # Loader suara mengisi cache dari thread lain
+        self.lock = threading.RLock()
+
+    def register(self, cache):
+        with self.lock:
+            old = self.caches.get(cache.name)
+            if old is not None:
+                self.total -= old.bytes  # instance baru (mis. AudioManager baru) menggantikan
+            self.caches[cache.name] = cache
+
+    def set_budget(self, budget_mb):
+        with self.lock:
+            self.budget = int(budget_mb * 1024 * 1024)
+            self.enforce()
+
+    def added(self, nbytes, cache=None, key=None):
+        self.total += nbytes
+        if self.total > self.budget:
+            self.enforce(keep=(cache, key))
+
+    def enforce(self, keep=None):
+        """Evict lowest-priority entries until the total is under the low-water mark"""
+        if self.total <= self.budget:
+            return
+        target = self.budget * self.low_water
+        candidates = sorted(
+            ((entry[0], cache, key)
+             for cache in self.caches.values() if not cache.pinned
+             for key, entry in cache.entries.items()
+             if (cache, key) != keep),
+            key=lambda candidate: candidate[0])
+        for priority, cache, key in candidates:
+            if self.total <= target:
+                break
+            freed = cache.evict(key)
+            self.total -= freed
+            self.inflation = priority
+            self.evictions += 1
+            self.evicted_bytes += freed
+
+    def stats(self):
+        return {
+            "budget_bytes": self.budget,
+            "bytes": self.total,
+            "evictions": self.evictions,
+            "evicted_bytes": self.evicted_bytes,
+            "caches": {name: cache.stats() for name, cache in sorted(self.caches.items())},
+        }
+
+    def overlay_lines(self):
+        hits = sum(cache.hits for cache in self.caches.values())
+        lookups = hits + sum(cache.misses for cache in self.caches.values())
+        rate = f"{hits / lookups * 100:.1f}%" if lookups else "-"
+        biggest = sorted(self.caches.values(), key=lambda cache: -cache.bytes)[:4]
+        return [
+            f"cache {self.total / 1048576:.1f}/{self.budget / 1048576:.0f} MB  "
+            f"hit {rate}  evicted {self.evictions}",
+            "  ".join(f"{cache.name} {cache.bytes / 1048576:.1f}M" for cache in biggest),
+        ]
+
+
+registry = CacheRegistry()
+
+
+def stats():
+    return registry.stats()
+
+
+def overlay_lines():
+    return registry.overlay_lines()
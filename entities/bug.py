@@ -1,26 +1,51 @@
 # entities/bug.py
 import pygame, random, math
 from .entity import Entity
+from gfx import glow
+from gfx.fonts import sysfont
+from gfx.render_queue import LAYER_BUGS
+from gfx.sprites import bake_frames, get_frames, frame_index
+from settings import BUG_ANIM_FRAMES
+import quality
 
 class Bug(Entity):
+    __slots__ = ("speed", "wobble_timer", "wobble_amount", "swarm", "slot")
+
+    # Sprite frames dibake sekali; pad memberi ruang untuk antena/glow/ekor
+    sprite_pad = 8
+    layer = LAYER_BUGS
+    anim_period_ms = 2 * math.pi * 300  # satu ayunan antena penuh
+    # Sama untuk semua bug sejenis: atribut kelas, bukan per instance
+    value = 6
+    color = (220, 70, 70)
+
     def __init__(self, x, y, w=30, h=30):
         super().__init__(x, y, w, h)
         # Kecepatan dasar, akan diset di subclass
         self.speed = 1.5
-        self.target = None
-        self.value = 6
-        self.color = (220, 70, 70) 
         
         # Variasi gerakan
         self.wobble_timer = random.uniform(0, math.pi * 2)
         self.wobble_amount = random.uniform(0.5, 2.0)
 
+        # Diisi BugSwarm.add; posisi float dan gerakan lalu diurus swarm
+        self.swarm = None
+        self.slot = -1
+
+    def destroy(self):
+        super().destroy()
+        if self.swarm is not None:
+            self.swarm.kill(self.slot)
+
     def update(self, dt, scene):
+        if self.swarm is not None:
+            return  # kinematika di-batch oleh BugSwarm.step
+
         self.rect.y += self.speed * 60 * dt  # Convert speed ke pixels per second
         
         # Gerakan wobble horizontal
         self.wobble_timer += dt * 3
-        self.rect.x += math.sin(self.wobble_timer) * self.wobble_amount
+        self.rect.x += math.sin(self.wobble_timer) * self.wobble_amount * 60 * dt
         
         # Boundary check - jika keluar dari layar bawah, hancurkan
         if self.rect.top > scene.game.height:
@@ -35,47 +60,78 @@ class Bug(Entity):
                     scene.spawn_particles(self, "spark", 8)
                     break
 
+    # ===============================
+    # SPRITE FRAMES
+    # ===============================
+    def sprite_key(self):
+        return (self.__class__.__name__, self.color, self.rect.size)
+
+    def frames(self):
+        key = self.sprite_key()
+        frames = get_frames(key)
+        if frames is None:
+            pad = self.sprite_pad
+            w, h = self.rect.size
+            count = BUG_ANIM_FRAMES.get(self.__class__.__name__, 1)
+            frame_rect = pygame.Rect(pad, pad, w, h)
+            frames = bake_frames(key, (w + pad * 2, h + pad * 2), count,
+                                 lambda surface, phase: self.draw_frame(surface, frame_rect, phase))
+        return frames
+
+    def current_frame(self):
+        frames = self.frames()
+        ticks = quality.anim_ticks(pygame.time.get_ticks())
+        return frames[frame_index(len(frames), self.anim_period_ms, ticks)]
+
     def draw(self, surface):
+        surface.blit(self.current_frame(),
+                     (self.rect.x - self.sprite_pad, self.rect.y - self.sprite_pad))
+
+    def submit(self, queue):
+        queue.submit(self.current_frame(),
+                     (self.rect.x - self.sprite_pad, self.rect.y - self.sprite_pad), LAYER_BUGS)
+
+    def draw_frame(self, surface, rect, phase):
         # Badan bug utama
-        pygame.draw.circle(surface, self.color, self.rect.center, self.rect.width//2)
+        pygame.draw.circle(surface, self.color, rect.center, rect.width//2)
         
         # Highlight/glow effect
-        highlight_radius = self.rect.width//2 - 2
+        highlight_radius = rect.width//2 - 2
         highlight_color = (
             min(255, self.color[0] + 50),
             min(255, self.color[1] + 50),
             min(255, self.color[2] + 50)
         )
         pygame.draw.circle(surface, highlight_color, 
-                         (self.rect.centerx - 3, self.rect.centery - 3), 
+                         (rect.centerx - 3, rect.centery - 3), 
                          highlight_radius//2)
         
         # Mata bug
         eye_size = 3
-        eye_offset = self.rect.width//4
+        eye_offset = rect.width//4
         pygame.draw.circle(surface, (30, 30, 30), 
-                         (self.rect.centerx - eye_offset, self.rect.centery - eye_offset), 
+                         (rect.centerx - eye_offset, rect.centery - eye_offset), 
                          eye_size)
         pygame.draw.circle(surface, (30, 30, 30), 
-                         (self.rect.centerx + eye_offset, self.rect.centery - eye_offset), 
+                         (rect.centerx + eye_offset, rect.centery - eye_offset), 
                          eye_size)
         
         # Antena bug
-        antenna_length = self.rect.width//2
-        antenna_angle = math.sin(pygame.time.get_ticks() / 300) * 0.5
+        antenna_length = rect.width//2
+        antenna_angle = math.sin(phase * math.pi * 2) * 0.5
         
         # Antena kiri
-        left_antenna_x = self.rect.centerx - antenna_length * math.cos(math.pi/4 + antenna_angle)
-        left_antenna_y = self.rect.centery - antenna_length * math.sin(math.pi/4 + antenna_angle)
+        left_antenna_x = rect.centerx - antenna_length * math.cos(math.pi/4 + antenna_angle)
+        left_antenna_y = rect.centery - antenna_length * math.sin(math.pi/4 + antenna_angle)
         pygame.draw.line(surface, self.color, 
-                        (self.rect.centerx - 3, self.rect.centery - 3),
+                        (rect.centerx - 3, rect.centery - 3),
                         (left_antenna_x, left_antenna_y), 2)
         
         # Antena kanan
-        right_antenna_x = self.rect.centerx + antenna_length * math.cos(math.pi/4 - antenna_angle)
-        right_antenna_y = self.rect.centery - antenna_length * math.sin(math.pi/4 - antenna_angle)
+        right_antenna_x = rect.centerx + antenna_length * math.cos(math.pi/4 - antenna_angle)
+        right_antenna_y = rect.centery - antenna_length * math.sin(math.pi/4 - antenna_angle)
         pygame.draw.line(surface, self.color, 
-                        (self.rect.centerx + 3, self.rect.centery - 3),
+                        (rect.centerx + 3, rect.centery - 3),
                         (right_antenna_x, right_antenna_y), 2)
 
     def interact(self, player, scene):
@@ -86,21 +142,23 @@ class Bug(Entity):
 
 
 class ChatBug(Bug):
+    __slots__ = ()
+    value = 7
+    color = (255, 50, 50)
+
     def __init__(self, x, y):
         super().__init__(x, y, 32, 32)
-        self.value = 7
-        self.color = (255, 50, 50) 
         self.speed = random.uniform(0.8, 1.2) 
 
-    def draw(self, surface):
+    def draw_frame(self, surface, rect, phase):
         # Badan utama
-        pygame.draw.circle(surface, self.color, self.rect.center, self.rect.width//2)
+        pygame.draw.circle(surface, self.color, rect.center, rect.width//2)
         
         # Efek chat bubble
-        bubble_radius = self.rect.width//2 - 4
+        bubble_radius = rect.width//2 - 4
         bubble_color = (255, 255, 255)
         pygame.draw.circle(surface, bubble_color, 
-                         (self.rect.centerx, self.rect.centery), 
+                         (rect.centerx, rect.centery), 
                          bubble_radius)
         
         # Tanda chat (tiga titik)
@@ -108,21 +166,21 @@ class ChatBug(Bug):
         dot_spacing = 5
         for i in range(3):
             pygame.draw.circle(surface, dot_color,
-                             (self.rect.centerx - dot_spacing + i * dot_spacing,
-                              self.rect.centery),
+                             (rect.centerx - dot_spacing + i * dot_spacing,
+                              rect.centery),
                              2)
         
         # Ekor chat bubble
         points = [
-            (self.rect.centerx - 8, self.rect.centery + bubble_radius),
-            (self.rect.centerx, self.rect.centery + bubble_radius + 6),
-            (self.rect.centerx + 8, self.rect.centery + bubble_radius)
+            (rect.centerx - 8, rect.centery + bubble_radius),
+            (rect.centerx, rect.centery + bubble_radius + 6),
+            (rect.centerx + 8, rect.centery + bubble_radius)
         ]
         pygame.draw.polygon(surface, bubble_color, points)
         
         # Border chat bubble
         pygame.draw.circle(surface, (200, 200, 200), 
-                         (self.rect.centerx, self.rect.centery), 
+                         (rect.centerx, rect.centery), 
                          bubble_radius, 1)
 
     def interact(self, player, scene):
@@ -133,35 +191,38 @@ class ChatBug(Bug):
 
 
 class NotifBadge(Bug):
+    __slots__ = ("number",)
+    anim_period_ms = 2 * math.pi * 200  # satu denyut glow
+    value = 10
+    color = (50, 200, 50)
+
     def __init__(self, x, y):
         super().__init__(x, y, 28, 28)
-        self.value = 10
-        self.color = (50, 200, 50) 
         self.speed = random.uniform(1.2, 1.6)
+        # Angka notifikasi (acak 1-9), dipilih sekali agar draw tidak memakai RNG
+        self.number = random.randint(1, 9)
 
-    def draw(self, surface):
+    def sprite_key(self):
+        return super().sprite_key() + (self.number,)
+
+    def draw_frame(self, surface, rect, phase):
         # Badan utama (lingkaran dengan pinggiran)
-        pygame.draw.circle(surface, self.color, self.rect.center, self.rect.width//2)
+        pygame.draw.circle(surface, self.color, rect.center, rect.width//2)
         pygame.draw.circle(surface, (255, 255, 255), 
-                         self.rect.center, self.rect.width//2 - 2)
+                         rect.center, rect.width//2 - 2)
         pygame.draw.circle(surface, self.color, 
-                         self.rect.center, self.rect.width//2 - 4)
+                         rect.center, rect.width//2 - 4)
         
-        # Angka notifikasi (acak 1-9)
-        number_font = pygame.font.SysFont("arial", 12, bold=True)
-        number = random.randint(1, 9)
-        number_text = number_font.render(str(number), True, (255, 255, 255))
-        number_rect = number_text.get_rect(center=self.rect.center)
+        # Angka notifikasi
+        number_font = sysfont("arial", 12, bold=True)
+        number_text = number_font.render(str(self.number), True, (255, 255, 255))
+        number_rect = number_text.get_rect(center=rect.center)
         surface.blit(number_text, number_rect)
         
         # Efek glow/kilat
-        pulse = (math.sin(pygame.time.get_ticks() / 200) + 1) * 0.5
-        glow_radius = self.rect.width//2 + int(3 * pulse)
-        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surface, (*self.color, int(100 * pulse)), 
-                          (glow_radius, glow_radius), glow_radius)
-        surface.blit(glow_surface, (self.rect.centerx - glow_radius, 
-                                   self.rect.centery - glow_radius))
+        pulse = (math.sin(phase * math.pi * 2) + 1) * 0.5
+        glow.draw_disc(surface, rect.center, rect.width//2 + 3 * pulse,
+                       self.color, 100 * pulse)
 
     def interact(self, player, scene):
         """NotifBadge mengurangi fokus saat ditabrak"""
@@ -172,40 +233,56 @@ class NotifBadge(Bug):
 
 
 class PopupBug(Bug):
+    __slots__ = ()
+    anim_period_ms = 2 * math.pi * 150  # satu siklus kedip
+    value = 9
+    color = (255, 255, 50)
+
     def __init__(self, x, y):
         super().__init__(x, y, 36, 30)
-        self.value = 9
-        self.color = (255, 255, 50)  
         self.speed = random.uniform(1.0, 1.4) 
 
-    def draw(self, surface):
+    def draw_frame(self, surface, rect, phase):
         # Badan utama 
-        pygame.draw.rect(surface, self.color, self.rect, border_radius=8)
+        pygame.draw.rect(surface, self.color, rect, border_radius=8)
         
         # Efek pinggiran
         pygame.draw.rect(surface, (255, 255, 200), 
-                        (self.rect.x + 2, self.rect.y + 2, 
-                         self.rect.width - 4, self.rect.height - 4), 
+                        (rect.x + 2, rect.y + 2, 
+                         rect.width - 4, rect.height - 4), 
                         border_radius=6)
         
         # Ikon X (close button)
         x_color = (100, 100, 100)
         padding = 8
         pygame.draw.line(surface, x_color,
-                        (self.rect.left + padding, self.rect.top + padding),
-                        (self.rect.right - padding, self.rect.bottom - padding), 3)
+                        (rect.left + padding, rect.top + padding),
+                        (rect.right - padding, rect.bottom - padding), 3)
         pygame.draw.line(surface, x_color,
-                        (self.rect.right - padding, self.rect.top + padding),
-                        (self.rect.left + padding, self.rect.bottom - padding), 3)
+                        (rect.right - padding, rect.top + padding),
+                        (rect.left + padding, rect.bottom - padding), 3)
         
         # Efek berkedip
-        blink = math.sin(pygame.time.get_ticks() / 150) > 0
+        blink = math.sin(phase * math.pi * 2) > 0
         if blink:
             border_color = (255, 100, 100)
-            pygame.draw.rect(surface, border_color, self.rect, 2, border_radius=8)
+            pygame.draw.rect(surface, border_color, rect, 2, border_radius=8)
 
     def interact(self, player, scene):
         """Popup bug akan trigger question saat ditabrak"""
         self.destroy()
         scene.spawn_particles(self, "spark", 15)
-        return {"type": "popup_bug"}
\ No newline at end of file
+        return {"type": "popup_bug"}
+
+
+def prebake_bug_sprites():
+    """Bake the frames of every bug type with its default colors (scene load)"""
+    # Konstruktor bug memakai random; state disimpan agar replay tetap deterministik
+    state = random.getstate()
+    for cls in (Bug, ChatBug, PopupBug):
+        cls(0, 0).frames()
+    for number in range(1, 10):
+        badge = NotifBadge(0, 0)
+        badge.number = number
+        badge.frames()
+    random.setstate(state)
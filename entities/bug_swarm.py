@@ -0,0 +1,136 @@
+# entities/bug_swarm.py
+import numpy as np
+
+FIELDS = ("x", "y", "speed", "phase", "amount", "half_w", "half_h")
+
+
+class BugSwarm:
+    """
+    Batched kinematics for falling bugs.
+    Positions are kept as floats in parallel arrays (one slot per bug) and
+    stepped in one go; Bug objects stay the entities that draw and interact.
+    """
+    def __init__(self, capacity=64):
+        self.bugs = []
+        self.count = 0
+        self.capacity = 0
+        self.alive = np.zeros(0, dtype=bool)
+        for name in FIELDS:
+            setattr(self, name, np.zeros(0))
+        self._grow(capacity)
+
+    def _grow(self, capacity):
+        for name in FIELDS + ("alive",):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    # ===============================
+    # MEMBERSHIP
+    # ===============================
+    def add(self, bug):
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+        i = self.count
+        self.x[i], self.y[i] = bug.rect.center
+        self.speed[i] = bug.speed
+        self.phase[i] = bug.wobble_timer
+        self.amount[i] = bug.wobble_amount
+        self.half_w[i] = bug.rect.width / 2
+        self.half_h[i] = bug.rect.height / 2
+        self.alive[i] = bug.is_alive()
+        bug.swarm = self
+        bug.slot = i
+        self.bugs.append(bug)
+        self.count += 1
+
+    def kill(self, slot):
+        self.alive[slot] = False
+
+    def live_count(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def compact(self):
+        """Drop dead slots, keeping the survivors in order"""
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+        m = len(keep)
+        for name in FIELDS + ("alive",):
+            arr = getattr(self, name)
+            arr[:m] = arr[keep]
+        self.bugs = [self.bugs[i] for i in keep]
+        for slot, bug in enumerate(self.bugs):
+            bug.slot = slot
+        self.count = m
+
+    # ===============================
+    # SIMULATION
+    # ===============================
+    def step(self, dt, scene, plants):
+        self.compact()
+        n = self.count
+        if n == 0:
+            return
+        x, y = self.x[:n], self.y[:n]
+
+        # Jatuh + wobble horizontal, semuanya float (tidak ada truncation ke int)
+        y += self.speed[:n] * 60 * dt
+        phase = self.phase[:n]
+        phase += dt * 3
+        x += np.sin(phase) * self.amount[:n] * (60 * dt)
+
+        left = x - self.half_w[:n]
+        right = x + self.half_w[:n]
+        top = y - self.half_h[:n]
+        bottom = y + self.half_h[:n]
+
+        # Keluar dari layar bawah -> hancurkan
+        gone = top > scene.game.height
+        for i in np.flatnonzero(gone):
+            self.bugs[i].destroy()
+
+        # Plant hits: rect-overlap test bug x plant (plant cuma sedikit)
+        hits = None
+        if plants:
+            rects = np.array([tuple(p.rect) for p in plants], dtype=float)
+            pl, pt = rects[:, 0], rects[:, 1]
+            pr, pb = pl + rects[:, 2], pt + rects[:, 3]
+            overlap = ((left[:, None] < pr) & (right[:, None] > pl) &
+                       (top[:, None] < pb) & (bottom[:, None] > pt))
+            hits = np.flatnonzero(overlap.any(axis=1) & ~gone)
+
+        # Rect disinkronkan hanya untuk bug yang terlihat atau bertabrakan
+        visible = (bottom > 0) & ~gone
+        self.sync_rects(np.flatnonzero(visible))
+
+        if hits is not None:
+            for i in hits:
+                bug = self.bugs[i]
+                for j in np.flatnonzero(overlap[i]):
+                    plant = plants[j]
+                    if plant.is_alive():
+                        plant.damage(bug.value)
+                        bug.destroy()
+                        scene.spawn_particles(bug, "spark", 8)
+                        break
+
+    def sync_rects(self, slots):
+        cx = np.rint(self.x[slots]).astype(int).tolist()
+        cy = np.rint(self.y[slots]).astype(int).tolist()
+        for i, px, py in zip(slots.tolist(), cx, cy):
+            self.bugs[i].rect.center = (px, py)
+
+    def overlapping(self, rect):
+        """Live bugs whose float bounds overlap rect"""
+        n = self.count
+        if n == 0:
+            return []
+        x, y = self.x[:n], self.y[:n]
+        hw, hh = self.half_w[:n], self.half_h[:n]
+        mask = ((x - hw < rect.right) & (x + hw > rect.left) &
+                (y - hh < rect.bottom) & (y + hh > rect.top) & self.alive[:n])
+        return [self.bugs[i] for i in np.flatnonzero(mask)]
@@ -3,9 +3,21 @@ import pygame
 from abc import ABC, abstractmethod
 
 class Entity(ABC):
+    """
+    Base of everything in GameScene.entities. The hierarchy uses __slots__
+    (ABC itself has none), so an instance is its slots plus the Rect, with
+    no per-instance __dict__; data that is the same for every instance of
+    a type is a class attribute.
+    """
+    __slots__ = ("rect", "prev_center", "_alive")
+
+    # Render queue layer (lihat gfx/render_queue.py)
+    layer = 0
+
     def __init__(self, x, y, w, h):
         self.rect = pygame.Rect(0, 0, w, h)
         self.rect.center = (x, y)
+        self.prev_center = self.rect.center  # posisi step sebelumnya, untuk interpolasi render
         self._alive = True
 
     @abstractmethod
@@ -19,6 +31,13 @@ class Entity(ABC):
     def draw(self, surface):
         raise NotImplementedError
 
+    def submit(self, queue):
+        """
+        Queue this entity for GameScene's batched render.
+        Default runs draw() in layer order; sprite entities submit blits.
+        """
+        queue.call(self.draw, self.layer)
+
     def interact(self, player, scene):
         """
         Optional interaction hook
@@ -1,12 +1,18 @@
 # entities/floworb.py
 import pygame, math
 from .entity import Entity
+from gfx import glow
+from gfx.render_queue import LAYER_ORBS
+import quality
 
 class FlowOrb(Entity):
     """
     Flow state orb that appears when garden is calm.
     Collecting it boosts focus for a short time.
     """
+    __slots__ = ("timer",)
+    layer = LAYER_ORBS
+
     def __init__(self, x, y):
         super().__init__(x,y,20,20)
         self.timer = 10.0
@@ -18,6 +24,10 @@ class FlowOrb(Entity):
 
     def draw(self, surface):
         x,y = self.rect.center
+        # soft halo (tekstur radial dari glow cache)
+        if quality.tier()["glow"]:
+            halo = 0.5 + 0.5 * math.sin(pygame.time.get_ticks() / 300.0)
+            glow.draw_radial(surface, (x,y), 26, (120,200,255), 90 + 50 * halo)
         # outer rotating arc effect (simple)
         for s in range(3):
             r = 12 + s*4
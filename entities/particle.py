@@ -1,42 +1,45 @@
 # entities/particle.py
 import pygame, random, math
 from .entity import Entity
+from gfx.render_queue import LAYER_PARTICLES
+from gfx.surfaces import new_surface
+from cache_registry import ManagedCache
+import quality
+
+# kind -> (color, size range, glow); sama untuk semua partikel sejenis
+KINDS = {
+    "spark": ((255, 210, 100), (3, 6), True),
+    "leaf": ((100, 180, 100), (4, 8), False),
+    "pop": ((220, 100, 100), (2, 5), True),
+    "flow": ((100, 200, 255), (4, 7), True),
+}
+DEFAULT_KIND = ((220, 220, 220), (2, 4), False)
+
 
 class Particle(Entity):
-    def __init__(self, x, y, kind="spark"):
-        super().__init__(x, y, 4, 4)
-        self.vx = random.uniform(-120, 120)
-        self.vy = random.uniform(-160, -40)
-        self.life = random.uniform(0.4, 1.1)
+    __slots__ = ("vx", "vy", "life", "age", "kind", "rotation", "rotation_speed", "size")
+    layer = LAYER_PARTICLES
+
+    def __init__(self, x, y, kind="spark", rng=random):
+        self.vx = rng.uniform(-120, 120)
+        self.vy = rng.uniform(-160, -40)
+        self.life = rng.uniform(0.4, 1.1)
         self.age = 0.0
         self.kind = kind
-        self.rotation = random.uniform(0, math.pi * 2)
-        self.rotation_speed = random.uniform(-5, 5)
+        self.rotation = rng.uniform(0, math.pi * 2)
+        self.rotation_speed = rng.uniform(-5, 5)
         
-        # Set color and size based on kind
-        if kind == "spark":
-            self.color = (255, 210, 100)
-            self.size = random.randint(3, 6)
-            self.glow = True
-        elif kind == "leaf":
-            self.color = (100, 180, 100)
-            self.size = random.randint(4, 8)
-            self.glow = False
-        elif kind == "pop":
-            self.color = (220, 100, 100)
-            self.size = random.randint(2, 5)
-            self.glow = True
-        elif kind == "flow":
-            self.color = (100, 200, 255)
-            self.size = random.randint(4, 7)
-            self.glow = True
-        else:
-            self.color = (220, 220, 220)
-            self.size = random.randint(2, 4)
-            self.glow = False
-        
-        self.rect = pygame.Rect(0, 0, self.size * 2, self.size * 2)
-        self.rect.center = (x, y)
+        # Size based on kind (color and glow are looked up from KINDS)
+        self.size = rng.randint(*KINDS.get(kind, DEFAULT_KIND)[1])
+        super().__init__(x, y, self.size * 2, self.size * 2)
+
+    @property
+    def color(self):
+        return KINDS.get(self.kind, DEFAULT_KIND)[0]
+
+    @property
+    def glow(self):
+        return KINDS.get(self.kind, DEFAULT_KIND)[2]
 
     def update(self, dt, game):
         self.age += dt
@@ -48,102 +51,121 @@ class Particle(Entity):
         
         # Physics
         self.vy += 300 * dt
-        self.vx *= 0.99  # Air resistance
-        self.vy *= 0.99
+        drag = 0.99 ** (60 * dt)  # Air resistance (0.99 per 1/60 s)
+        self.vx *= drag
+        self.vy *= drag
         
         self.rect.x += int(self.vx * dt)
         self.rect.y += int(self.vy * dt)
         
         # Wobble effect
         if self.kind == "leaf":
-            self.rect.x += math.sin(self.age * 5) * 2
+            self.rect.x += math.sin(self.age * 5) * 2 * 60 * dt
 
-    def draw(self, surface):
-        x, y = self.rect.center
-        
-        # Calculate alpha based on remaining life
+    def sprite(self):
+        """Baked sprite for the current size/rotation/alpha and its top-left"""
         life_ratio = 1 - (self.age / self.life)
         alpha = int(255 * life_ratio)
-        
-        # Create particle surface
         particle_size = int(self.size * (0.5 + 0.5 * life_ratio))
         
-        if self.glow:
-            # Draw glow effect
-            glow_size = particle_size * 2
-            glow_surface = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-            
-            # Outer glow
-            for i in range(3, 0, -1):
-                glow_alpha = int(alpha * 0.3 / i)
-                glow_color = (*self.color[:3], glow_alpha)
-                pygame.draw.circle(glow_surface, glow_color, 
-                                 (glow_size, glow_size), 
-                                 particle_size + i)
-            
-            surface.blit(glow_surface, (x - glow_size, y - glow_size))
+        # Rotasi & alpha dikuantisasi supaya sprite bisa di-cache
+        steps = LEAF_ROTATIONS if self.kind == "leaf" else STAR_ROTATIONS
+        turn = 2 * math.pi if self.kind == "leaf" else 2 * math.pi / 5
+        rotation = int(self.rotation % turn / turn * steps) % steps
+        alpha_level = min(ALPHA_LEVELS, alpha * ALPHA_LEVELS // 255 + 1)
         
-        # Draw particle
-        if self.kind == "spark" or self.kind == "pop":
-            # Sparkle/star shape
-            particle_surface = pygame.Surface((particle_size * 2, particle_size * 2), 
-                                            pygame.SRCALPHA)
-            
-            # Star points
-            points = []
-            for i in range(5):
-                angle = self.rotation + i * math.pi * 2 / 5
-                radius = particle_size if i % 2 == 0 else particle_size * 0.5
-                px = particle_size + math.cos(angle) * radius
-                py = particle_size + math.sin(angle) * radius
-                points.append((px, py))
-            
-            pygame.draw.polygon(particle_surface, (*self.color[:3], alpha), points)
-            surface.blit(particle_surface, (x - particle_size, y - particle_size))
-            
-        elif self.kind == "leaf":
-            # Leaf shape
-            leaf_surface = pygame.Surface((particle_size * 3, particle_size * 2), 
-                                         pygame.SRCALPHA)
-            
-            # Leaf polygon
-            leaf_points = [
-                (particle_size * 1.5, particle_size),
-                (particle_size * 0.5, particle_size * 0.3),
-                (particle_size * 0.8, particle_size * 1.7),
-                (particle_size * 2.2, particle_size * 1.7),
-                (particle_size * 2.5, particle_size * 0.3)
-            ]
-            
-            # Apply rotation
-            rotated_points = []
-            for px, py in leaf_points:
-                cos_a = math.cos(self.rotation)
-                sin_a = math.sin(self.rotation)
-                rx = (px - particle_size * 1.5) * cos_a - (py - particle_size) * sin_a
-                ry = (px - particle_size * 1.5) * sin_a + (py - particle_size) * cos_a
-                rotated_points.append((rx + particle_size * 1.5, ry + particle_size))
-            
-            pygame.draw.polygon(leaf_surface, (*self.color[:3], alpha), rotated_points)
+        color, _, glow = KINDS.get(self.kind, DEFAULT_KIND)
+        glow = glow and quality.tier()["glow"]
+        image = particle_sprite(self.kind, color, glow,
+                                particle_size, rotation, alpha_level)
+        half = image.get_width() // 2
+        x, y = self.rect.center
+        return image, (x - half, y - half)
+
+    def draw(self, surface):
+        image, pos = self.sprite()
+        surface.blit(image, pos)
+
+    def submit(self, queue):
+        image, pos = self.sprite()
+        queue.submit(image, pos, LAYER_PARTICLES)
+
+
+# ===============================
+# SPRITE CACHE
+# ===============================
+STAR_ROTATIONS = 8    # per 1/5 putaran (bintang simetris lima)
+LEAF_ROTATIONS = 16
+ALPHA_LEVELS = 8
+
+_sprites = ManagedCache("particle")
+
+
+def particle_sprite(kind, color, glow, particle_size, rotation, alpha_level):
+    key = (kind, color, glow, particle_size, rotation, alpha_level)
+    image = _sprites.get(key)
+    if image is None:
+        image = _sprites[key] = bake_particle(*key)
+    return image
+
+
+def bake_particle(kind, color, glow, particle_size, rotation, alpha_level):
+    """Draw one particle centered on a square surface"""
+    alpha = int(255 * alpha_level / ALPHA_LEVELS)
+    half = max(particle_size + 3, particle_size * 3 // 2 + 1)
+    surface = new_surface((half * 2, half * 2))
+    
+    if glow:
+        # Outer glow
+        for i in range(3, 0, -1):
+            glow_alpha = int(alpha * 0.3 / i)
+            pygame.draw.circle(surface, (*color[:3], glow_alpha), 
+                             (half, half), particle_size + i)
+    
+    if kind == "spark" or kind == "pop":
+        # Sparkle/star shape
+        angle0 = rotation / STAR_ROTATIONS * math.pi * 2 / 5
+        points = []
+        for i in range(5):
+            angle = angle0 + i * math.pi * 2 / 5
+            radius = particle_size if i % 2 == 0 else particle_size * 0.5
+            points.append((half + math.cos(angle) * radius,
+                           half + math.sin(angle) * radius))
+        if particle_size > 0:
+            pygame.draw.polygon(surface, (*color[:3], alpha), points)
+        
+    elif kind == "leaf":
+        # Leaf polygon, diputar di sekitar pusat
+        leaf_points = [
+            (0, 0),
+            (-particle_size, -particle_size * 0.7),
+            (-particle_size * 0.7, particle_size * 0.7),
+            (particle_size * 0.7, particle_size * 0.7),
+            (particle_size, -particle_size * 0.7)
+        ]
+        angle = rotation / LEAF_ROTATIONS * math.pi * 2
+        cos_a, sin_a = math.cos(angle), math.sin(angle)
+        def rotate(px, py):
+            return (half + px * cos_a - py * sin_a, half + px * sin_a + py * cos_a)
+        if particle_size > 0:
+            pygame.draw.polygon(surface, (*color[:3], alpha),
+                                [rotate(px, py) for px, py in leaf_points])
             
             # Leaf vein
-            vein_color = (70, 130, 70, alpha)
-            vein_start = (particle_size * 1.5, particle_size * 0.5)
-            vein_end = (particle_size * 1.5, particle_size * 1.5)
-            pygame.draw.line(leaf_surface, vein_color, vein_start, vein_end, 1)
-            
-            surface.blit(leaf_surface, (x - particle_size * 1.5, y - particle_size))
-            
-        else:
-            # Simple circle
-            pygame.draw.circle(surface, (*self.color[:3], alpha), 
-                             (x, y), particle_size)
-            
-            # Inner circle for depth
-            if particle_size > 2:
-                inner_color = (min(255, self.color[0] + 50),
-                             min(255, self.color[1] + 50),
-                             min(255, self.color[2] + 50),
-                             alpha)
-                pygame.draw.circle(surface, inner_color, (x, y), 
-                                 max(1, particle_size // 2))
\ No newline at end of file
+            pygame.draw.line(surface, (70, 130, 70, alpha),
+                             (half, half - particle_size * 0.5),
+                             (half, half + particle_size * 0.5), 1)
+        
+    else:
+        # Simple circle
+        pygame.draw.circle(surface, (*color[:3], alpha), (half, half), particle_size)
+        
+        # Inner circle for depth
+        if particle_size > 2:
+            inner_color = (min(255, color[0] + 50),
+                         min(255, color[1] + 50),
+                         min(255, color[2] + 50),
+                         alpha)
+            pygame.draw.circle(surface, inner_color, (half, half), 
+                             max(1, particle_size // 2))
+    return surface
@@ -1,22 +1,41 @@
 # entities/plant.py
 import pygame, math, random
 from .entity import Entity
+from gfx import glow
+from gfx.render_queue import LAYER_PLANT_BACK, LAYER_PLANTS, LAYER_PLANT_UI
+from gfx.sprites import bake_frames, get_frames
+from cache_registry import ManagedCache
+from gfx.surfaces import new_surface
+from settings import PLANT_ANIM_FRAMES
+import quality
+
+# Semua gelombang animasi plant (sin t, sin 1.5t, sin 3t, ...) berulang tiap 4*pi detik
+PLANT_LOOP = 4 * math.pi
+FRAME_SIZE = (48, 56)
+FRAME_ORIGIN = (22, 32)  # posisi rect.center di dalam frame
+ARC_STEPS = 60
+
+_arcs = ManagedCache("plant_arc")
+_health_bars = ManagedCache("health_bar")
 
 class Plant(Entity):
     """
     Focus Blossom - grows through attention and can be damaged by bugs.
     Levels: 0 (seed) -> 1 -> 2 -> 3 (bloom)
     """
+    __slots__ = ("level", "growth", "health", "animation_timer", "level_up_timer",
+                 "wobble_offset")
+    layer = LAYER_PLANTS
+    max_growth = 100.0
+
     def __init__(self, x, y):
         super().__init__(x, y, 28, 44)
         self.level = 1
         self.growth = 0.0
-        self.max_growth = 100.0
         self.health = 100.0  # if 0 -> destroyed
         self.animation_timer = 0
         self.level_up_timer = 0
         self.wobble_offset = random.uniform(0, math.pi * 2)
-        self.particles = []
 
     def update(self, dt, game):
         self.animation_timer += dt
@@ -40,103 +59,164 @@ class Plant(Entity):
             self.destroy()
 
     def draw(self, surface):
+        self.draw_pulse(surface)
+        for image, pos, _ in self.sprites():
+            surface.blit(image, pos)
+
+    def submit(self, queue):
+        if self.level_up_timer > 0 and quality.tier()["glow"]:
+            queue.call(self.draw_pulse, LAYER_PLANT_BACK)
+        for image, pos, layer in self.sprites():
+            queue.submit(image, pos, layer)
+
+    def draw_pulse(self, surface):
+        # Level up pulse effect (disc dari glow cache bersama)
+        if self.level_up_timer > 0 and quality.tier()["glow"]:
+            glow.draw_disc(surface, self.rect.center, 40 * self.level_up_timer,
+                           (100, 255, 100), 150 * self.level_up_timer)
+
+    def sprites(self):
+        """Cached (surface, position, layer) blits that make up this plant"""
         x, y = self.rect.center
-        
-        # Wobble animation
-        wobble = math.sin(self.animation_timer * 1.5 + self.wobble_offset) * 0.1
-        
-        # Level up pulse effect
-        if self.level_up_timer > 0:
-            pulse_radius = int(40 * self.level_up_timer)
-            pulse_surface = pygame.Surface((pulse_radius * 2, pulse_radius * 2), pygame.SRCALPHA)
-            pulse_color = (100, 255, 100, int(150 * self.level_up_timer))
-            pygame.draw.circle(pulse_surface, pulse_color, 
-                             (pulse_radius, pulse_radius), pulse_radius)
-            surface.blit(pulse_surface, (x - pulse_radius, y - pulse_radius))
+        result = []
         
         # Growth progress circle
         if self.level < 3:
-            progress = self.growth / self.max_growth
-            angle = progress * math.pi * 2
-            pygame.draw.arc(surface, (100, 180, 100), 
-                          (x - 25, y - 25, 50, 50), 0, angle, 3)
+            arc = growth_arc(self.growth / self.max_growth)
+            if arc is not None:
+                result.append((arc, (x - 25, y - 25), LAYER_PLANT_BACK))
         
         # Health indicator
         health_percent = self.health / 100.0
         if health_percent < 0.7:
-            health_color = (255, int(255 * health_percent), 0)
-            health_width = 2
-            health_rect = pygame.Rect(x - 20, y + 25, 40 * health_percent, 3)
-            pygame.draw.rect(surface, health_color, health_rect)
+            result.append((health_bar(health_percent), (x - 20, y + 25), LAYER_PLANT_UI))
         
-        # stem with animation
-        stem_length = 18 + math.sin(self.animation_timer) * 2
-        pygame.draw.line(surface, (70, 120, 60), 
-                        (x, y + stem_length), (x, y + 6), 3)
+        # Stem, leaves and bloom from the baked loop for this level
+        frames = plant_frames(self.level)
+        t = self.animation_timer + self.wobble_offset / 1.5
+        t -= t % (quality.tier()["anim_cadence"] / 60)
+        frame = frames[int(t / PLANT_LOOP * len(frames)) % len(frames)]
+        result.append((frame, (x - FRAME_ORIGIN[0], y - FRAME_ORIGIN[1]), LAYER_PLANTS))
+        return result
+
+    def damage(self, amount):
+        self.health -= amount
+        if self.health <= 0:
+            self.destroy()
+
+
+# ===============================
+# RENDER CACHE
+# ===============================
+def draw_plant(surface, x, y, level, t):
+    """Draw stem, leaves and bloom of a plant at animation time t"""
+    # Wobble animation
+    wobble = math.sin(t * 1.5) * 0.1
+    
+    # stem with animation
+    stem_length = 18 + math.sin(t) * 2
+    pygame.draw.line(surface, (70, 120, 60), 
+                    (x, y + stem_length), (x, y + 6), 3)
+    
+    # leaves depend on level with animation
+    if level >= 1:
+        leaf_scale = 1 + wobble * 0.5
+        leaf_rect = pygame.Rect(x - 12 * leaf_scale, y + 2, 
+                              18 * leaf_scale, 10 * leaf_scale)
+        pygame.draw.ellipse(surface, (86, 146, 92), leaf_rect)
+        
+        # Leaf veins
+        pygame.draw.line(surface, (60, 110, 70), 
+                       (x - 3, y + 7), (x - 9, y + 4), 1)
+        pygame.draw.line(surface, (60, 110, 70), 
+                       (x - 3, y + 7), (x + 2, y + 6), 1)
+    
+    if level >= 2:
+        leaf_scale = 1 + wobble * 0.3
+        leaf_rect = pygame.Rect(x - 2, y - 4 * leaf_scale, 
+                              20 * leaf_scale, 12 * leaf_scale)
+        pygame.draw.ellipse(surface, (102, 170, 110), leaf_rect)
         
-        # leaves depend on level with animation
-        leaf_pulse = 1 + 0.1 * math.sin(self.animation_timer * 2)
+        # Leaf veins
+        pygame.draw.line(surface, (80, 140, 90), 
+                       (x + 8, y - 2), (x + 2, y - 1), 1)
+        pygame.draw.line(surface, (80, 140, 90), 
+                       (x + 8, y - 2), (x + 10, y + 2), 1)
+    
+    if level >= 3:
+        # bloom with animation
+        bloom_size = 8 + math.sin(t * 3) * 2
+        bloom_pulse = 1 + 0.2 * math.sin(t * 1.5)
         
-        if self.level >= 1:
-            leaf_scale = 1 + wobble * 0.5
-            leaf_rect = pygame.Rect(x - 12 * leaf_scale, y + 2, 
-                                  18 * leaf_scale, 10 * leaf_scale)
-            pygame.draw.ellipse(surface, (86, 146, 92), leaf_rect)
-            
-            # Leaf veins
-            pygame.draw.line(surface, (60, 110, 70), 
-                           (x - 3, y + 7), (x - 9, y + 4), 1)
-            pygame.draw.line(surface, (60, 110, 70), 
-                           (x - 3, y + 7), (x + 2, y + 6), 1)
+        # Petals
+        petal_colors = [(250, 220, 110), (255, 200, 100), (245, 230, 120)]
+        for i in range(6):
+            angle = t + i * math.pi / 3
+            petal_x = x + math.cos(angle) * bloom_size * 0.8
+            petal_y = y - 12 + math.sin(angle) * bloom_size * 0.8
+            pygame.draw.circle(surface, petal_colors[i % 3], 
+                             (int(petal_x), int(petal_y)), 
+                             int(bloom_size * 0.6 * bloom_pulse))
         
-        if self.level >= 2:
-            leaf_scale = 1 + wobble * 0.3
-            leaf_rect = pygame.Rect(x - 2, y - 4 * leaf_scale, 
-                                  20 * leaf_scale, 12 * leaf_scale)
-            pygame.draw.ellipse(surface, (102, 170, 110), leaf_rect)
-            
-            # Leaf veins
-            pygame.draw.line(surface, (80, 140, 90), 
-                           (x + 8, y - 2), (x + 2, y - 1), 1)
-            pygame.draw.line(surface, (80, 140, 90), 
-                           (x + 8, y - 2), (x + 10, y + 2), 1)
+        # Center with pulse
+        center_size = bloom_size * 0.4 * bloom_pulse
+        pygame.draw.circle(surface, (255, 150, 100), (x, y - 12), 
+                         int(center_size))
         
-        if self.level >= 3:
-            # bloom with animation
-            bloom_size = 8 + math.sin(self.animation_timer * 3) * 2
-            bloom_pulse = 1 + 0.2 * math.sin(self.animation_timer * 1.5)
-            
-            # Petals
-            petal_colors = [(250, 220, 110), (255, 200, 100), (245, 230, 120)]
-            for i in range(6):
-                angle = self.animation_timer + i * math.pi / 3
-                petal_x = x + math.cos(angle) * bloom_size * 0.8
-                petal_y = y - 12 + math.sin(angle) * bloom_size * 0.8
-                pygame.draw.circle(surface, petal_colors[i % 3], 
-                                 (int(petal_x), int(petal_y)), 
-                                 int(bloom_size * 0.6 * bloom_pulse))
-            
-            # Center with pulse
-            center_size = bloom_size * 0.4 * bloom_pulse
-            pygame.draw.circle(surface, (255, 150, 100), (x, y - 12), 
-                             int(center_size))
-            
-            # Stamen
-            for i in range(4):
-                angle = self.animation_timer * 2 + i * math.pi / 2
-                stamen_x = x + math.cos(angle) * center_size * 0.7
-                stamen_y = y - 12 + math.sin(angle) * center_size * 0.7
-                pygame.draw.line(surface, (255, 200, 50), 
-                               (x, y - 12), (stamen_x, stamen_y), 2)
-            
-            # Sparkles
-            if math.sin(self.animation_timer * 4) > 0.9:
-                sparkle_x = x + math.cos(self.animation_timer * 5) * 15
-                sparkle_y = y - 12 + math.sin(self.animation_timer * 5) * 15
-                pygame.draw.circle(surface, (255, 255, 200, 200), 
-                                 (int(sparkle_x), int(sparkle_y)), 2)
+        # Stamen
+        for i in range(4):
+            angle = t * 2 + i * math.pi / 2
+            stamen_x = x + math.cos(angle) * center_size * 0.7
+            stamen_y = y - 12 + math.sin(angle) * center_size * 0.7
+            pygame.draw.line(surface, (255, 200, 50), 
+                           (x, y - 12), (stamen_x, stamen_y), 2)
+        
+        # Sparkles
+        if math.sin(t * 4) > 0.9:
+            sparkle_x = x + math.cos(t * 5) * 15
+            sparkle_y = y - 12 + math.sin(t * 5) * 15
+            pygame.draw.circle(surface, (255, 255, 200), 
+                             (int(sparkle_x), int(sparkle_y)), 2)
 
-    def damage(self, amount):
-        self.health -= amount
-        if self.health <= 0:
-            self.destroy()
\ No newline at end of file
+
+def plant_frames(level):
+    """Looping animation strip for a growth level, baked on first use"""
+    key = ("Plant", level)
+    frames = get_frames(key)
+    if frames is None:
+        frames = bake_frames(key, FRAME_SIZE, PLANT_ANIM_FRAMES,
+                             lambda surface, phase: draw_plant(
+                                 surface, FRAME_ORIGIN[0], FRAME_ORIGIN[1], level,
+                                 phase * PLANT_LOOP))
+    return frames
+
+
+def growth_arc(progress):
+    """Growth ring for progress in [0, 1), quantized to ARC_STEPS"""
+    step = int(progress * ARC_STEPS)
+    if step <= 0:
+        return None
+    arc = _arcs.get(step)
+    if arc is None:
+        arc = new_surface((50, 50))
+        pygame.draw.arc(arc, (100, 180, 100), (0, 0, 50, 50),
+                        0, step / ARC_STEPS * math.pi * 2, 3)
+        _arcs[step] = arc
+    return arc
+
+
+def health_bar(health_percent):
+    key = max(0, int(health_percent * 100))
+    bar = _health_bars.get(key)
+    if bar is None:
+        bar = new_surface((max(1, int(40 * key / 100)), 3), alpha=False)
+        bar.fill((255, int(255 * key / 100), 0))
+        _health_bars[key] = bar
+    return bar
+
+
+def prebake_plant_sprites():
+    for level in (1, 2, 3):
+        plant_frames(level)
+    for step in range(1, ARC_STEPS):
+        growth_arc(step / ARC_STEPS)
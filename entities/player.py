@@ -1,16 +1,24 @@
 import pygame, math
 from .entity import Entity
 from settings import WIDTH, HEIGHT
+from gfx import glow
+from gfx.surfaces import new_surface
+from gfx.render_queue import LAYER_PLAYER
+import quality
 
 class Player(Entity):
     """
     The MIND Guardian - diamond-shaped character with glow and animations.
     """
+    __slots__ = ("score", "repels", "float_timer", "walk_timer", "move_direction",
+                 "is_moving", "interact_timer", "inner_surface")
+    layer = LAYER_PLAYER
+    speed = 260  # px/sec
+    color = (120, 200, 255)
+    eye_color = (20, 30, 40)
+
     def __init__(self, x, y):
         super().__init__(x, y, 40, 46)
-        self.speed = 260  # px/sec
-        self.color = (120, 200, 255)
-        self.eye_color = (20, 30, 40)
         self.score = 0
         self.repels = 0
         
@@ -20,6 +28,9 @@ class Player(Entity):
         self.move_direction = (0, 0)
         self.is_moving = False
         self.interact_timer = 0
+        
+        # Scratch surface untuk inner diamond, dipakai ulang tiap frame
+        self.inner_surface = new_surface((40, 40))
 
     def update(self, dt, game):
         # Update animation timers
@@ -28,7 +39,7 @@ class Player(Entity):
         self.interact_timer = max(0, self.interact_timer - dt * 4)
         
         # Movement
-        keys = pygame.key.get_pressed()
+        keys = game.get_pressed()
         dx = dy = 0
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             dx -= 1
@@ -66,27 +77,17 @@ class Player(Entity):
         else:
             walk_offset = 0
         
+        glows = quality.tier()["glow"]
+        
         # Interaction pulse
-        if self.interact_timer > 0:
-            pulse_radius = int(60 * self.interact_timer)
-            pulse_surface = pygame.Surface((pulse_radius * 2, pulse_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(pulse_surface, (120, 200, 255, int(100 * self.interact_timer)), 
-                             (pulse_radius, pulse_radius), pulse_radius)
-            surface.blit(pulse_surface, (x - pulse_radius, y - pulse_radius))
-        
-        # Glow effect with animation
-        for i in range(3):
-            glow_radius = 26 + i * 8
-            glow_alpha = 40 - i * 10
-            glow_pulse = 1 + 0.1 * math.sin(self.float_timer + i)
-            
-            s = pygame.Surface((int(glow_radius * 2 * glow_pulse), 
-                              int(glow_radius * 2 * glow_pulse)), pygame.SRCALPHA)
-            pygame.draw.circle(s, (*self.color[:3], glow_alpha), 
-                             (int(glow_radius * glow_pulse), int(glow_radius * glow_pulse)), 
-                             int(glow_radius * glow_pulse))
-            surface.blit(s, (x - int(glow_radius * glow_pulse), 
-                           y - int(glow_radius * glow_pulse)))
+        if glows and self.interact_timer > 0:
+            glow.draw_disc(surface, (x, y), 60 * self.interact_timer,
+                           (120, 200, 255), 100 * self.interact_timer)
+        
+        # Glow effect with animation (satu tekstur radial dari glow cache)
+        if glows:
+            glow_pulse = 1 + 0.1 * math.sin(self.float_timer)
+            glow.draw_radial(surface, (x, y), 46 * glow_pulse, self.color, 150)
         
         # Diamond polygon with float and walk animations
         points = [
@@ -108,7 +109,8 @@ class Player(Entity):
         ]
         
         # Inner diamond with gradient
-        inner_surface = pygame.Surface((40, 40), pygame.SRCALPHA)
+        inner_surface = self.inner_surface
+        inner_surface.fill((0, 0, 0, 0))
         pygame.draw.polygon(inner_surface, (255, 255, 255, 200), 
                           [(p[0] - x + 20, p[1] - y + 20) for p in inner_points])
         surface.blit(inner_surface, (x - 20, y - 20))
@@ -0,0 +1,77 @@
+# frame_pacer.py
+import time
+
+from settings import FPS, PACER_SPIN_MS
+
+
+class FramePacer:
+    """
+    Holds frames to a fixed rate more tightly than pygame's Clock.tick:
+    sleeps through most of the wait, then busy-waits the last PACER_SPIN_MS
+    so OS sleep granularity doesn't add jitter.
+    """
+    def __init__(self, fps=FPS, spin_ms=PACER_SPIN_MS):
+        self.spin = spin_ms / 1000.0
+        self.last = time.perf_counter()
+        self.set_fps(fps)
+
+    def set_fps(self, fps):
+        self.fps = fps
+        self.period = 1.0 / fps
+        # Frame berikutnya langsung ikut rate baru
+        self.deadline = self.last + self.period
+
+    def reset(self, immediate=False):
+        """Restart the schedule; immediate makes the next frame due right away"""
+        self.last = time.perf_counter()
+        self.deadline = self.last if immediate else self.last + self.period
+
+    def slack(self):
+        """Seconds left until the next frame is due"""
+        return self.deadline - time.perf_counter()
+
+    def wait(self):
+        """Block until the next frame is due; returns seconds since the last one"""
+        remaining = self.deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < self.deadline:
+            pass
+
+        now = time.perf_counter()
+        dt = now - self.last
+        self.last = now
+        # Terlambat lebih dari satu frame: jadwal ulang dari sekarang,
+        # jangan kejar frame yang sudah lewat
+        self.deadline += self.period
+        if self.deadline < now:
+            self.deadline = now + self.period
+        return dt
+
+    def wait_input(self, wait_event, min_period):
+        """
+        Idle variant of wait: blocks in wait_event(timeout_ms) instead of
+        spinning and ends early when it returns an event, though never
+        sooner than min_period after the last frame.
+        Returns (seconds since the last frame, event or None).
+        """
+        event = None
+        remaining = self.deadline - time.perf_counter()
+        if remaining > 0:
+            # Timeout minimal 1 ms; 0 berarti menunggu selamanya
+            event = wait_event(max(1, int(remaining * 1000)))
+            if event is not None:
+                early = self.last + min_period - time.perf_counter()
+                if early > 0:
+                    time.sleep(early)
+
+        now = time.perf_counter()
+        dt = now - self.last
+        self.last = now
+        # Bangun karena input: frame ambient berikutnya tetap di jadwalnya.
+        # Timeout event wait dibulatkan ke ms, jadi timeout = deadline tercapai.
+        if event is None or now >= self.deadline:
+            self.deadline += self.period
+            if self.deadline < now:
+                self.deadline = now + self.period
+        return dt, event
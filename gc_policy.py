@@ -0,0 +1,189 @@
+# gc_policy.py
+"""
+Keeps Python's cyclic GC out of gameplay frames.
+
+Particle bursts and interact() result dicts allocate many short-lived
+containers, and every 700 of them the collector runs inside whichever
+phase made the 700th, as a frame spike. The policy:
+
+- loaded() after a scene or the warm-up caches are built: at the next
+  idle slack, one full collection (old scenes are cyclic garbage), then
+  gc.freeze(), so the thousands of long-lived objects (modules, caches,
+  the scene) are no longer scanned by later collections;
+- scenes with entity_churn use GC_GAMEPLAY_THRESHOLD, so automatic
+  collections are rare;
+- idle(slack) runs after the frame flip: when enough young objects piled
+  up and the frame's remaining time fits the (measured) cost, it collects
+  the generation the collector would reach next, so that work lands in
+  time the pacer would have slept through anyway.
+
+Pause times come from gc.callbacks; pauses outside idle() are charged to
+the frame in which they happened (FrameProfiler, spike log).
+"""
+import gc
+import time
+
+from settings import GC_GAMEPLAY_THRESHOLD, GC_IDLE_GEN0, GC_SLACK_MARGIN_MS
+
+# Perkiraan awal ms per generasi (+ settle), diperbarui dari pause yang terukur
+INITIAL_ESTIMATE_MS = (0.2, 1.0, 5.0)
+INITIAL_SETTLE_MS = 5.0
+SMOOTHING = 0.2
+SLACK_FACTOR = 1.5  # koleksi hanya jika perkiraannya x1.5 masih muat di slack
+
+
+class GcPolicy:
+    def __init__(self):
+        self.installed = False
+        self.default_threshold = gc.get_threshold()
+        self.gameplay = False
+        self.estimate_ms = list(INITIAL_ESTIMATE_MS)
+        self.settle_ms = INITIAL_SETTLE_MS
+        self.pending_settle = False
+        self.in_idle = False
+        self._started = None
+
+        self.auto_counts = [0, 0, 0]
+        self.auto_max_ms = [0.0, 0.0, 0.0]
+        self.auto_total_ms = 0.0
+        self.idle_counts = [0, 0, 0]
+        self.idle_total_ms = 0.0
+        self.settles = 0
+        self.frame_pause_ms = 0.0  # pause otomatis sejak take_pause_ms() terakhir
+
+    def install(self):
+        if not self.installed:
+            self.installed = True
+            self.default_threshold = gc.get_threshold()
+            gc.callbacks.append(self.on_gc)
+
+    # ===============================
+    # PAUSE TIMES
+    # ===============================
+    def on_gc(self, phase, info):
+        if phase == "start":
+            self._started = time.perf_counter()
+            return
+        if self._started is None:
+            return
+        ms = (time.perf_counter() - self._started) * 1000.0
+        self._started = None
+        gen = info["generation"]
+        self.estimate_ms[gen] += (ms - self.estimate_ms[gen]) * SMOOTHING
+        if self.in_idle:
+            self.idle_counts[gen] += 1
+            self.idle_total_ms += ms
+        else:
+            self.auto_counts[gen] += 1
+            self.auto_max_ms[gen] = max(self.auto_max_ms[gen], ms)
+            self.auto_total_ms += ms
+            self.frame_pause_ms += ms
+
+    def take_pause_ms(self):
+        """Automatic GC pause time since the last call (one frame)"""
+        ms = self.frame_pause_ms
+        self.frame_pause_ms = 0.0
+        return ms
+
+    # ===============================
+    # POLICY
+    # ===============================
+    def scene_changed(self, scene):
+        """Thresholds for the new scene; its objects are frozen at the next idle"""
+        gameplay = getattr(scene, "entity_churn", False)
+        if gameplay != self.gameplay:
+            self.gameplay = gameplay
+            gc.set_threshold(*(GC_GAMEPLAY_THRESHOLD if gameplay else self.default_threshold))
+        self.loaded()
+
+    def loaded(self):
+        self.pending_settle = True
+
+    def idle(self, slack):
+        """Use up to `slack` seconds left in the frame for at most one collection"""
+        budget_ms = slack * 1000.0 - GC_SLACK_MARGIN_MS
+        if budget_ms <= 0:
+            return
+        self.in_idle = True
+        try:
+            if self.pending_settle and self.settle_ms * SLACK_FACTOR <= budget_ms:
+                self.settle()
+                return
+            gen = self.next_generation()
+            if gen is not None and self.estimate_ms[gen] * SLACK_FACTOR <= budget_ms:
+                gc.collect(gen)
+        finally:
+            self.in_idle = False
+
+    def next_generation(self):
+        """Generation the collector would reach next, or None if few objects piled up"""
+        count = gc.get_count()
+        if count[0] < GC_IDLE_GEN0:
+            return None
+        threshold = gc.get_threshold()
+        if count[1] + 1 >= threshold[1]:
+            return 2 if count[2] + 1 >= threshold[2] else 1
+        return 0
+
+    def settle(self):
+        """Full collection with nothing frozen, then freeze what survived"""
+        start = time.perf_counter()
+        gc.unfreeze()
+        gc.collect()
+        gc.freeze()
+        ms = (time.perf_counter() - start) * 1000.0
+        self.settle_ms += (ms - self.settle_ms) * SMOOTHING
+        self.settles += 1
+        self.pending_settle = False
+
+    # ===============================
+    # REPORTING
+    # ===============================
+    def stats(self):
+        return {
+            "threshold": list(gc.get_threshold()),
+            "frozen": gc.get_freeze_count(),
+            "settles": self.settles,
+            "auto_collections": list(self.auto_counts),
+            "auto_max_ms": [round(ms, 3) for ms in self.auto_max_ms],
+            "auto_total_ms": round(self.auto_total_ms, 3),
+            "idle_collections": list(self.idle_counts),
+            "idle_total_ms": round(self.idle_total_ms, 3),
+        }
+
+    def overlay_lines(self):
+        return [f"gc auto {'/'.join(map(str, self.auto_counts))}  "
+                f"max {max(self.auto_max_ms):.2f} ms  "
+                f"idle {'/'.join(map(str, self.idle_counts))}  "
+                f"frozen {gc.get_freeze_count()}"]
+
+
+policy = GcPolicy()
+
+
+def install():
+    policy.install()
+
+
+def scene_changed(scene):
+    policy.scene_changed(scene)
+
+
+def loaded():
+    policy.loaded()
+
+
+def idle(slack):
+    policy.idle(slack)
+
+
+def take_pause_ms():
+    return policy.take_pause_ms()
+
+
+def stats():
+    return policy.stats()
+
+
+def overlay_lines():
+    return policy.overlay_lines()
@@ -0,0 +1,2 @@
+# gfx/__init__.py
+# package marker
@@ -0,0 +1,69 @@
+# gfx/backdrop.py
+import math
+import random
+
+import pygame
+from cache_registry import ManagedCache
+from gfx.surfaces import new_surface
+
+ALPHA_STEP = 8       # alpha dot dibulatkan ke kelipatan ini
+STAR_SEED = 2025     # starfield menu selalu sama di tiap run
+
+_gradients = ManagedCache("gradient")  # (size, top, bottom) -> opaque gradient surface
+_dots = ManagedCache("star_dot")       # (radius, rgb, alpha) -> filled circle sprite
+
+
+def gradient(size, top, bottom):
+    """Vertical gradient from top to bottom color, built once per size and colors"""
+    key = (size, top, bottom)
+    surface = _gradients.get(key)
+    if surface is None:
+        width, height = size
+        surface = new_surface(size, alpha=False)
+        for y in range(height):
+            ratio = y / height
+            color = tuple(int(a + (b - a) * ratio) for a, b in zip(top, bottom))
+            pygame.draw.line(surface, color, (0, y), (width, y))
+        _gradients[key] = surface
+    return surface
+
+
+def dot(radius, color, alpha):
+    """Filled circle sprite (2*radius square), alpha rounded to ALPHA_STEP"""
+    alpha = max(0, min(255, int(alpha + ALPHA_STEP / 2) // ALPHA_STEP * ALPHA_STEP))
+    key = (radius, color[:3], alpha)
+    surface = _dots.get(key)
+    if surface is None:
+        surface = new_surface((max(1, radius * 2), max(1, radius * 2)))
+        if radius > 0:
+            pygame.draw.circle(surface, (*color[:3], alpha), (radius, radius), radius)
+        else:
+            surface.fill((*color[:3], alpha))
+        _dots[key] = surface
+    return surface
+
+
+class Starfield:
+    """
+    Fixed star positions from a seeded RNG; twinkling only changes which
+    pre-baked alpha sprite each star uses, so a frame is one blits call.
+    """
+    def __init__(self, count, area, seed=STAR_SEED, sizes=(1, 3), brightness=(150, 255)):
+        rng = random.Random(seed)
+        x, y, width, height = area
+        self.stars = []
+        for _ in range(count):
+            self.stars.append((
+                x + rng.randint(0, width), y + rng.randint(0, height),
+                rng.randint(*sizes),
+                rng.randint(*brightness),
+                rng.uniform(0, math.pi * 2),   # fase twinkle
+                rng.uniform(0.8, 2.0),         # kecepatan twinkle
+            ))
+
+    def draw(self, surface, time):
+        blits = []
+        for x, y, size, brightness, phase, speed in self.stars:
+            alpha = brightness * (0.75 + 0.25 * math.sin(time * speed + phase))
+            blits.append((dot(size, (255, 255, 255), alpha), (x - size, y - size)))
+        surface.blits(blits, doreturn=False)
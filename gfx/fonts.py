@@ -0,0 +1,39 @@
+# gfx/fonts.py
+"""
+Shared system fonts.
+
+SysFont has to scan the installed fonts once (fc-list on Linux, the
+registry on Windows) before its first lookup. scan_in_background() starts
+that scan on a worker thread at startup; sysfont() waits for it only if it
+is still running, then caches the Font per (name, size, bold, italic) so
+scenes built again (HUD per level, dialogs) don't reopen the font file.
+"""
+import threading
+
+import pygame
+import pygame.sysfont
+
+_fonts = {}  # (name, size, bold, italic) -> Font
+_scan = None
+
+
+def scan_in_background():
+    """Start the system font scan on a worker thread (idempotent)"""
+    global _scan
+    if _scan is None and not pygame.sysfont.is_init:
+        _scan = threading.Thread(target=pygame.sysfont.initsysfonts, name="font-scan",
+                                 daemon=True)
+        _scan.start()
+
+
+def sysfont(name, size, bold=False, italic=False):
+    """pygame.font.SysFont, created once per combination"""
+    key = (name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if _scan is not None:
+            _scan.join()
+        font = _fonts[key] = pygame.font.SysFont(name, size, bold=bold, italic=italic)
+    return font
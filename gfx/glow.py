@@ -0,0 +1,76 @@
+# gfx/glow.py
+import pygame
+from cache_registry import ManagedCache
+from gfx.surfaces import new_surface, to_display
+
+# Radial falloff textures are baked at a few base radii and derived from there
+BASE_RADII = (8, 16, 32, 64, 128)
+
+_base = ManagedCache("glow_base")  # base radius -> white radial texture
+_glows = ManagedCache("glow")      # (shape, radius, color) -> tinted texture shared by every caller
+
+
+def quantize(radius, step):
+    return max(step, int(radius + step / 2) // step * step)
+
+
+def _radial_base(radius):
+    """White texture whose alpha falls off quadratically from the center"""
+    surface = _base.get(radius)
+    if surface is None:
+        surface = new_surface((radius * 2, radius * 2))
+        for r in range(radius, 0, -1):
+            alpha = int(255 * (1 - r / radius) ** 2)
+            pygame.draw.circle(surface, (255, 255, 255, alpha), (radius, radius), r)
+        _base[radius] = surface
+    return surface
+
+
+def radial(radius, color, step=4):
+    """Soft glow of `color`, cached per radius rounded to `step` px"""
+    radius = quantize(radius, step)
+    key = ("radial", radius, color)
+    surface = _glows.get(key)
+    if surface is None:
+        base_radius = next((r for r in BASE_RADII if r >= radius), BASE_RADII[-1])
+        base = _radial_base(base_radius)
+        if base_radius == radius:
+            surface = base.copy()
+        else:
+            surface = to_display(
+                pygame.transform.smoothscale(base, (radius * 2, radius * 2)), "glow texture")
+        surface.fill((*color[:3], 255), special_flags=pygame.BLEND_RGBA_MULT)
+        _glows[key] = surface
+    return surface
+
+
+def disc(radius, color, step=2):
+    """Flat filled circle of `color` (pulses), cached per radius rounded to `step` px"""
+    radius = quantize(radius, step)
+    key = ("disc", radius, color)
+    surface = _glows.get(key)
+    if surface is None:
+        surface = new_surface((radius * 2, radius * 2))
+        pygame.draw.circle(surface, color[:3], (radius, radius), radius)
+        _glows[key] = surface
+    return surface
+
+
+def draw_radial(surface, center, radius, color, alpha=255):
+    """Blit a cached soft glow centered on `center`, faded with set_alpha"""
+    if radius < 1 or alpha <= 0:
+        return
+    glow = radial(radius, color)
+    glow.set_alpha(min(255, int(alpha)))
+    half = glow.get_width() // 2
+    surface.blit(glow, (center[0] - half, center[1] - half))
+
+
+def draw_disc(surface, center, radius, color, alpha=255):
+    """Blit a cached flat disc centered on `center`, faded with set_alpha"""
+    if radius < 1 or alpha <= 0:
+        return
+    glow = disc(radius, color)
+    glow.set_alpha(min(255, int(alpha)))
+    half = glow.get_width() // 2
+    surface.blit(glow, (center[0] - half, center[1] - half))
@@ -0,0 +1,74 @@
+# gfx/render_queue.py
+
+# Draw layers, lower first (player dulu, seperti urutan entities lama)
+LAYER_PLAYER = 10
+LAYER_PLANT_BACK = 15   # level-up pulse, growth arc
+LAYER_PLANTS = 20
+LAYER_PLANT_UI = 25     # health bars
+LAYER_ORBS = 30
+LAYER_BUGS = 40
+LAYER_PARTICLES = 50
+
+
+# Layers whose sprites never overlap (plants sit 220 px apart); only these
+# may be grouped by texture, every other layer draws in submission order
+SORTED_LAYERS = frozenset((LAYER_PLANTS, LAYER_PLANT_UI))
+
+
+class RenderQueue:
+    """
+    Collects sprite blits for a frame and flushes them layer by layer in
+    submission order, so overlapping bugs and particles keep their stacking.
+    Things that can't be expressed as a plain blit (shared glow textures
+    faded with set_alpha, primitive drawing) are queued as draw calls and
+    run at the point they were queued; the blits between two draw calls go
+    out as one Surface.blits call. Runs in SORTED_LAYERS are also sorted by
+    texture (stable, so equal textures keep their order).
+    """
+    def __init__(self):
+        self.layers = {}  # layer -> blit items and draw calls, in submission order
+
+    def _layer(self, layer):
+        entry = self.layers.get(layer)
+        if entry is None:
+            entry = self.layers[layer] = []
+        return entry
+
+    def submit(self, surface, pos, layer=0, flags=0):
+        if flags:
+            self._layer(layer).append((surface, pos, None, flags))
+        else:
+            self._layer(layer).append((surface, pos))
+
+    def call(self, draw, layer=0):
+        """Queue draw(target) to run in layer and submission order"""
+        self._layer(layer).append(draw)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self.layers.values())
+
+    def flush(self, target):
+        for layer in sorted(self.layers):
+            entries = self.layers[layer]
+            grouped = layer in SORTED_LAYERS
+            run = []
+            for entry in entries:
+                if callable(entry):
+                    _blit_run(target, run, grouped)
+                    entry(target)
+                else:
+                    run.append(entry)
+            _blit_run(target, run, grouped)
+            entries.clear()
+
+
+def _blit_run(target, run, grouped):
+    if run:
+        if grouped:
+            run.sort(key=_texture)
+        target.blits(run, doreturn=False)
+        run.clear()
+
+
+def _texture(item):
+    return id(item[0])
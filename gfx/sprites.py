@@ -0,0 +1,40 @@
+# gfx/sprites.py
+import pygame
+from cache_registry import ManagedCache
+from gfx.surfaces import new_surface, to_display
+
+# (key) -> list of baked frame surfaces
+_frames = ManagedCache("sprite_frames")
+
+
+def bake_frames(key, size, count, draw_frame):
+    """
+    Return `count` animation frames for key, rendering them on first use.
+    draw_frame(surface, phase) draws one frame, phase runs over [0, 1).
+    """
+    frames = _frames.get(key)
+    if frames is None:
+        frames = []
+        for i in range(count):
+            surface = new_surface(size)
+            draw_frame(surface, i / count)
+            frames.append(to_display(surface, f"sprite {key!r}"))
+        _frames[key] = frames
+    return frames
+
+
+def get_frames(key):
+    return _frames.get(key)
+
+
+def frame_index(count, period_ms, ticks=None):
+    """Frame of a looping animation with the given period at `ticks` ms"""
+    if count <= 1:
+        return 0
+    if ticks is None:
+        ticks = pygame.time.get_ticks()
+    return int(ticks * count / period_ms) % count
+
+
+def clear_frames():
+    _frames.clear()
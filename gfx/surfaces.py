@@ -0,0 +1,68 @@
+# gfx/surfaces.py
+import warnings
+
+import pygame
+from settings import DEBUG_SURFACES
+
+# Reference surfaces in the display's pixel format, rebuilt when the mode changes
+_display = None
+_alpha_ref = None
+
+# Labels that already triggered a slow-path warning (warn once each)
+_warned = set()
+
+
+def _reference():
+    """Display surface and a 1x1 alpha surface in its preferred alpha format"""
+    global _display, _alpha_ref
+    display = pygame.display.get_surface() if pygame.display.get_init() else None
+    if display is not _display:
+        _display = display
+        _alpha_ref = None
+        if display is not None:
+            _alpha_ref = pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha()
+    return _display, _alpha_ref
+
+
+def new_surface(size, alpha=True):
+    """
+    Create a surface directly in the display pixel format, so blits to the
+    screen don't convert every pixel. Falls back to a plain surface before
+    the window exists.
+    """
+    display, alpha_ref = _reference()
+    if alpha:
+        if alpha_ref is None:
+            return pygame.Surface(size, pygame.SRCALPHA)
+        return pygame.Surface(size, pygame.SRCALPHA, alpha_ref)
+    if display is None:
+        return pygame.Surface(size)
+    return pygame.Surface(size, 0, display)
+
+
+def is_display_format(surface):
+    display, alpha_ref = _reference()
+    if display is None:
+        return True  # belum ada window, tidak ada yang bisa dibandingkan
+    ref = alpha_ref if surface.get_flags() & pygame.SRCALPHA else display
+    return (surface.get_bitsize() == ref.get_bitsize() and
+            surface.get_masks() == ref.get_masks())
+
+
+def to_display(surface, label=None):
+    """
+    Return surface in the display format, converting it if needed.
+    Long-lived (cached/loaded) surfaces go through here; with DEBUG_SURFACES
+    a surface that would have hit the slow blit path is reported once.
+    """
+    if is_display_format(surface):
+        return surface
+    if DEBUG_SURFACES:
+        label = label or f"{surface.get_size()} surface"
+        if label not in _warned:
+            _warned.add(label)
+            warnings.warn(f"{label} is not in display format, blits take the slow path",
+                          stacklevel=2)
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
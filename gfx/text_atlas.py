@@ -0,0 +1,86 @@
+# gfx/text_atlas.py
+from cache_registry import ManagedCache
+from gfx.surfaces import new_surface
+
+# Karakter yang dibake di muka; karakter lain ditambahkan saat pertama dipakai
+CHARSET = "0123456789%/:.,+- "
+
+_atlases = ManagedCache("text_atlas")  # (font, color) -> GlyphAtlas
+
+
+class GlyphAtlas:
+    """
+    Glyphs of one font and color packed into a single surface.
+    Strings are drawn as a run of glyph blits placed by advance width,
+    so changing numbers never go through Font.render.
+    """
+    def __init__(self, font, color, charset=CHARSET):
+        self.font = font
+        self.color = color
+        self.height = font.get_height()
+        self.surface = None
+        self.glyphs = {}  # char -> (area rect in atlas, advance)
+        self.add(charset)
+
+    def add(self, chars):
+        """Render missing chars and repack the atlas"""
+        chars = [ch for ch in dict.fromkeys(chars) if ch not in self.glyphs]
+        if not chars:
+            return
+        rendered = [(ch, self.font.render(ch, True, self.color)) for ch in chars]
+
+        width = (self.surface.get_width() if self.surface else 0) + sum(
+            image.get_width() for _, image in rendered)
+        atlas = new_surface((max(1, width), self.height))
+        x = 0
+        if self.surface is not None:
+            atlas.blit(self.surface, (0, 0))
+            x = self.surface.get_width()
+        for ch, image in rendered:
+            atlas.blit(image, (x, 0))
+            # Advance = lebar string satu karakter menurut font (termasuk bold)
+            self.glyphs[ch] = ((x, 0, image.get_width(), self.height), self.font.size(ch)[0])
+            x += image.get_width()
+        self.surface = atlas
+        _atlases.refresh((self.font, self.color))  # atlas melebar: byte dihitung ulang
+
+    def layout(self, text):
+        glyphs = self.glyphs
+        try:
+            return [glyphs[ch] for ch in text]
+        except KeyError:
+            self.add(text)
+            return [glyphs[ch] for ch in text]
+
+    def size(self, text):
+        return sum(advance for _, advance in self.layout(text)), self.height
+
+    def draw(self, surface, text, pos, anchor="topleft"):
+        """
+        Blit text at pos, where anchor is "topleft", "center" or "topright".
+        Returns the text's width.
+        """
+        layout = self.layout(text)
+        width = sum(advance for _, advance in layout)
+        x, y = pos
+        if anchor == "center":
+            x -= width // 2
+            y -= self.height // 2
+        elif anchor == "topright":
+            x -= width
+        atlas = self.surface
+        blits = []
+        for area, advance in layout:
+            blits.append((atlas, (x, y), area))
+            x += advance
+        surface.blits(blits, doreturn=False)
+        return width
+
+
+def atlas(font, color):
+    """Shared atlas for a font and color, built on first use"""
+    key = (font, color)
+    result = _atlases.get(key)
+    if result is None:
+        result = _atlases[key] = GlyphAtlas(font, color)
+    return result
@@ -0,0 +1,207 @@
+# leaderboard.py
+"""
+Per-level top-N leaderboards shared safely between processes.
+
+Submissions are appended to a log (one JSON line each) under an advisory
+file lock; every process keeps the top N per level in a min-heap and only
+reads log lines it hasn't seen yet, so a submission costs the same no
+matter how long the history is. Every LEADERBOARD_COMPACT_EVERY records
+the heaps are written to the snapshot file and the log starts over with
+the next generation number in its header line, both via temp file +
+os.replace. A process that sees a new generation reloads. A half-written
+last line left by a crash is cut off by the next submit.
+"""
+import heapq
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+
+from settings import (LEADERBOARD_FILE, LEADERBOARD_LOG, LEADERBOARD_SIZE,
+                      LEADERBOARD_COMPACT_EVERY)
+from utils import atomic_write
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive advisory lock on path (created if missing), held for the block"""
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            # lockf (POSIX record lock) juga dihormati lewat NFS, flock tidak
+            fcntl.lockf(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.lockf(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class Leaderboard:
+    def __init__(self, path=LEADERBOARD_FILE, log_path=LEADERBOARD_LOG,
+                 size=LEADERBOARD_SIZE, compact_every=LEADERBOARD_COMPACT_EVERY):
+        self.path = path
+        self.log_path = log_path
+        self.lock_path = path + ".lock"
+        self.size = size
+        self.compact_every = compact_every
+        self.skipped = 0  # baris rusak yang dilewati saat membaca
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with file_lock(self.lock_path):
+            self.reload()
+
+    # ===============================
+    # IN-MEMORY BOARDS
+    # ===============================
+    def reload(self):
+        """Rebuild the heaps from the snapshot and the whole log (caller holds the lock)"""
+        self.boards = {}  # level -> min-heap of (score, -seq, entry)
+        self.ids = set()
+        self.seq = 0
+        self.generation = None
+        self.offset = 0
+        self.log_records = 0
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                for number, line in enumerate(f):
+                    self.apply_line(line, f"legacy-{number}")
+        self.read_log()
+
+    def apply(self, entry):
+        entry_id = entry.get("id")
+        if entry_id in self.ids:
+            return  # sudah ada (log yang belum sempat dihapus saat compaction)
+        self.seq += 1
+        # Skor sama: yang lebih dulu masuk menang, yang terbaru dibuang dulu
+        item = (entry["score"], -self.seq, entry)
+        heap = self.boards.setdefault(entry.get("level"), [])
+        if len(heap) < self.size:
+            heapq.heappush(heap, item)
+        elif item > heap[0]:
+            dropped = heapq.heapreplace(heap, item)
+            self.ids.discard(dropped[2].get("id"))
+        else:
+            return
+        self.ids.add(entry_id)
+
+    def apply_line(self, line, default_id=None):
+        try:
+            entry = json.loads(line)
+            entry["score"] = int(entry["score"])
+        except (ValueError, KeyError, TypeError):
+            self.skipped += 1
+            return
+        if default_id is not None:
+            entry.setdefault("id", default_id)
+        self.apply(entry)
+
+    def read_log(self):
+        """Apply log lines appended since the last read (caller holds the lock)"""
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            header = f.readline()
+            generation = log_generation(header)
+            stale = self.generation is not None and generation != self.generation
+            if not stale:
+                self.generation = generation
+                self.offset = max(self.offset, len(header))
+                f.seek(self.offset)
+                data = f.read()
+        if stale:
+            # Proses lain sudah compaction: snapshot baru, log baru
+            self.reload()
+            return
+        # Hanya baris lengkap; sisa setengah baris dibaca lagi nanti
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            self.apply_line(line)
+            self.log_records += 1
+        self.offset += end
+
+    # ===============================
+    # PUBLIC API
+    # ===============================
+    def submit(self, name, score, level=None):
+        """Record a score; returns the (possibly updated) top N for its level"""
+        entry = {"name": name, "score": int(score), "level": level,
+                 "ts": int(time.time()), "id": uuid.uuid4().hex}
+        line = (json.dumps(entry) + "\n").encode()
+        with file_lock(self.lock_path):
+            self.read_log()
+            if self.generation is None:
+                self.start_log(0)
+            with open(self.log_path, "r+b") as f:
+                # Sisa setengah baris setelah offset = tulisan yang terputus (crash);
+                # dipotong dulu supaya record baru tidak menempel padanya
+                if f.seek(0, os.SEEK_END) > self.offset:
+                    f.truncate(self.offset)
+                    f.seek(self.offset)
+                f.write(line)
+            self.offset += len(line)
+            self.log_records += 1
+            self.apply(entry)
+            if self.log_records >= self.compact_every:
+                self.compact()
+        return self.top(level, refresh=False)
+
+    def top(self, level=None, refresh=True):
+        """Entries of a level's board, best first"""
+        if refresh:
+            with file_lock(self.lock_path):
+                self.read_log()
+        heap = self.boards.get(level, [])
+        return [entry for _, _, entry in sorted(heap, reverse=True)]
+
+    def levels(self):
+        return list(self.boards)
+
+    def compact(self):
+        """Fold the log into the snapshot (caller holds the lock)"""
+        lines = [json.dumps(entry) + "\n"
+                 for level in self.boards for entry in self.top(level, refresh=False)]
+        atomic_write(self.path, lines)
+        self.start_log(self.generation + 1)
+
+    def start_log(self, generation):
+        """Replace the log with an empty one of the given generation"""
+        header = json.dumps({"generation": generation}) + "\n"
+        atomic_write(self.log_path, [header])
+        self.generation = generation
+        self.offset = len(header.encode())
+        self.log_records = 0
+
+
+def log_generation(header):
+    try:
+        return json.loads(header)["generation"]
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+_board = None
+
+
+def board():
+    """Shared leaderboard for the game, loaded on first use"""
+    global _board
+    if _board is None:
+        _board = Leaderboard()
+    return _board
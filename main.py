@@ -1,23 +1,74 @@
 # main.py
+import sys
+import time
+STARTUP = time.perf_counter()  # sebelum import lain: import ikut dihitung di startup
+
+# pygame/__init__ ikut mengimport surfarray/sndarray (-> NumPy) dan pkgdata
+# (-> pkg_resources), ~170 ms yang tidak dipakai sampai jauh setelah frame
+# pertama. Keduanya disembunyikan selama import pygame; yang butuh
+# pygame.sndarray/surfarray mengimportnya sendiri (lihat audio_manager).
+_DEFERRED = [name for name in ("numpy", "pkg_resources") if name not in sys.modules]
+for _name in _DEFERRED:
+    sys.modules[_name] = None
 import pygame
-from settings import WIDTH, HEIGHT, FPS
+for _name in _DEFERRED:
+    if sys.modules.get(_name, 0) is None:
+        del sys.modules[_name]
+from settings import (WIDTH, HEIGHT, FPS, SIM_HZ, SIM_DT, MAX_SIM_STEPS,
+                      UNFOCUSED_FPS, MINIMIZED_WAIT_MS)
 from scenes.home_scene import HomeScene
 from audio_manager import AudioManager
+from profiler import FrameProfiler, StartupTimer
+from gfx import fonts
+from frame_pacer import FramePacer
+import cache_registry
+import gc_policy
+import quality
+import telemetry
+import warmup
+from replay import InputRecorder, key_mask
 
 class Game:
     def __init__(self):
-        pygame.init()
+        self.startup = StartupTimer(STARTUP)
+        gc_policy.install()
+        self.startup.mark("imports")
+        # Hanya display (+ event) di depan; scan font dan audio jalan di
+        # thread lain, pygame.font diinit saat font pertama dibuat
+        pygame.display.init()
+        fonts.scan_in_background()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Distraction Garden")
+        self.startup.mark("display")
+        self.audio = AudioManager()
+        self.audio.start()
+        self.audio.play_music("sounds/background_music.mp3")
+        self.startup.mark("audio_start")
         self.width = WIDTH
         self.height = HEIGHT
-        self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(FPS)
         self.scene = HomeScene(self)
+        self.startup.mark("home_scene")
+        # Cache level pertama dibangun saat menu idle, mulai setelah frame pertama
+        warmup.prepare((WIDTH, HEIGHT))
         self.previous_scene_surface = None
         self.running = True
-        self.dt = 0
-        self.audio = AudioManager()
-        self.audio.play_music("sounds/background_music.mp3")
+        self.dt = SIM_DT
+        self.render_alpha = 1.0  # posisi render antara step sebelumnya (0) dan terakhir (1)
+        self.sim_steps = 0
+        self.dropped_steps = 0
+        self.focused = True
+        self.minimized = False
+        self.profiler = FrameProfiler()
+        self.profiler.add_overlay_provider(self.sim_overlay)
+        self.profiler.add_overlay_provider(quality.controller.overlay_lines)
+        self.profiler.add_overlay_provider(telemetry.overlay_lines)
+        self.profiler.add_overlay_provider(self.startup.overlay_lines)
+        self.profiler.add_overlay_provider(warmup.overlay_lines)
+        self.profiler.add_overlay_provider(cache_registry.overlay_lines)
+        self.profiler.add_overlay_provider(gc_policy.overlay_lines)
+        self.recorder = InputRecorder()
+        self.key_state = None  # diisi Replayer saat memutar ulang input
         
         
         
@@ -25,22 +76,144 @@ class Game:
         # simpan tampilan lama (dipakai QuestionScene)
         self.previous_scene_surface = self.screen.copy()
         self.scene = new_scene
+        gc_policy.scene_changed(new_scene)
+        if not getattr(new_scene, "records_input", False):
+            self.recorder.end()
+
+    def get_pressed(self):
+        """Keyboard state for gameplay: live keys, or replayed ones"""
+        if self.key_state is not None:
+            return self.key_state
+        return pygame.key.get_pressed()
+
+    def sim_overlay(self):
+        return [f"sim {SIM_HZ} Hz  steps {self.sim_steps}  "
+                f"alpha {self.render_alpha:.2f}  dropped {self.dropped_steps}",
+                f"frame rate {self.pacer.fps}  focused {self.focused}"]
+
+    # ===============================
+    # IDLE THROTTLING
+    # ===============================
+    def frame_rate(self):
+        """Full FPS in play; menus run at their ambient cadence, unfocused slower still"""
+        rate = getattr(self.scene, "ambient_fps", None) or FPS
+        if not self.focused:
+            rate = min(rate, UNFOCUSED_FPS)
+        return rate
+
+    def wait_event(self, timeout_ms):
+        event = pygame.event.wait(timeout_ms)
+        return None if event.type == pygame.NOEVENT else event
+
+    def handle_window_event(self, event):
+        """Track focus and minimize state; returns True if the event was a window event"""
+        if event.type == pygame.WINDOWFOCUSLOST:
+            self.focused = False
+        elif event.type == pygame.WINDOWFOCUSGAINED:
+            self.focused = True
+        elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+            self.minimized = True
+        elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN,
+                            pygame.WINDOWMAXIMIZED):
+            if self.minimized:
+                self.minimized = False
+                # Waktu selama minimize tidak dikejar
+                self.pacer.reset()
+        else:
+            return False
+        return True
+
+    def handle_events(self, events):
+        """Dispatch a batch of events; returns False once the game should quit"""
+        running = True
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            elif self.handle_window_event(event):
+                pass
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+            else:
+                self.recorder.record_event(event)
+                self.scene.handle_event(event)
+        return running
 
     def run(self):
+        profiler = self.profiler
+        recorder = self.recorder
+        accumulator = 0.0
+        # Frame pertama langsung digambar, tanpa menunggu jadwal pacer
+        self.pacer.reset(immediate=not self.startup.done)
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
+            if self.minimized:
+                # Minimized: tidur di antrian event, tanpa update dan render
+                event = self.wait_event(MINIMIZED_WAIT_MS)
+                events = pygame.event.get()
+                if event is not None:
+                    events.insert(0, event)
+                running = self.handle_events(events)
+                continue
 
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-                else:
-                    self.scene.handle_event(event)
+            profiler.begin_frame()
+            rate = self.frame_rate()
+            if rate != self.pacer.fps:
+                self.pacer.set_fps(rate)
+            if rate < FPS:
+                # Event-driven: redraw langsung saat ada input,
+                # selain itu hanya pada cadence ambient
+                frame_dt, event = self.pacer.wait_input(self.wait_event, 1.0 / FPS)
+                events = pygame.event.get()
+                if event is not None:
+                    events.insert(0, event)
+            else:
+                frame_dt = self.pacer.wait()
+                events = pygame.event.get()
+            profiler.lap("wait")
+
+            running = self.handle_events(events)
+            profiler.lap("events")
+
+            # Fixed-step simulation; frame lambat dibatasi MAX_SIM_STEPS
+            # supaya mesin lemah melambat, bukan spiral makin tertinggal
+            accumulator += frame_dt
+            self.sim_steps = 0
+            # Frame rate rendah (menu/unfocused) butuh lebih banyak step per frame
+            max_steps = MAX_SIM_STEPS * max(1, round(FPS / self.pacer.fps))
+            while accumulator >= SIM_DT:
+                if self.sim_steps == max_steps:
+                    self.dropped_steps += int(accumulator / SIM_DT)
+                    accumulator %= SIM_DT
+                    break
+                if recorder.active:
+                    recorder.record_tick(SIM_DT, key_mask(pygame.key.get_pressed()))
+                self.scene.update(SIM_DT)
+                accumulator -= SIM_DT
+                self.sim_steps += 1
+            self.render_alpha = accumulator / SIM_DT
+            profiler.lap("update")
 
-            self.scene.update(dt)
             self.scene.render(self.screen)
+            profiler.draw(self.screen, self.scene)
+            profiler.lap("render")
+
             pygame.display.flip()
+            profiler.lap("flip")
+            if not self.startup.done:
+                self.startup.finish()
+            if not warmup.ready():
+                # Sisa waktu frame menu (pacer akan tidur setelah ini)
+                warmup.step()
+                if warmup.ready():
+                    gc_policy.loaded()  # cache level pertama selesai: dibekukan
+            gc_policy.idle(self.pacer.slack())
+            profiler.end_frame(self.scene)
+            quality.controller.observe(profiler.last_frame_ms())
 
+        profiler.flush()
+        recorder.end()
+        telemetry.stop()
+        self.audio.wait()
         pygame.quit()
 
 
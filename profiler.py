@@ -0,0 +1,236 @@
+# profiler.py
+import json
+import os
+import time
+from collections import Counter
+
+import pygame
+import gc_policy
+from gfx.surfaces import new_surface
+from gfx.fonts import sysfont
+from settings import PROFILER_HISTORY, FRAME_BUDGET_MS, SPIKE_LOG_FILE
+
+PHASES = ("wait", "events", "update", "render", "flip")
+WORK_PHASES = ("events", "update", "render", "flip")
+
+
+class StartupTimer:
+    """
+    Time-to-first-frame breakdown. mark(step) closes the step that ran
+    since the previous mark; the clock starts at `start` (main.py reads it
+    before its own imports).
+    """
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.steps = []  # (step, ms)
+        self.done = False
+
+    def mark(self, step):
+        now = time.perf_counter()
+        self.steps.append((step, (now - self._last) * 1000.0))
+        self._last = now
+
+    def finish(self):
+        """Close the last step (the first frame) once"""
+        if not self.done:
+            self.mark("first_frame")
+            self.done = True
+
+    def total_ms(self):
+        return (self._last - self.start) * 1000.0
+
+    def as_dict(self):
+        return {"total_ms": round(self.total_ms(), 2),
+                "steps_ms": {step: round(ms, 2) for step, ms in self.steps}}
+
+    def overlay_lines(self):
+        return [f"startup {self.total_ms():.0f} ms: "
+                + "  ".join(f"{step} {ms:.0f}" for step, ms in self.steps)]
+
+
+class FrameProfiler:
+    """
+    Per-phase frame timer for Game.run.
+    Keeps the last PROFILER_HISTORY frames in a ring buffer, draws an
+    overlay on demand and logs frames over budget to a JSONL spike log.
+    """
+    def __init__(self, history=PROFILER_HISTORY, budget_ms=FRAME_BUDGET_MS,
+                 spike_log=SPIKE_LOG_FILE):
+        self.history = history
+        self.budget_ms = budget_ms
+        self.spike_log = spike_log
+
+        # Ring buffer: satu slot per frame, ditimpa secara melingkar
+        self.frame_ms = [0.0] * history
+        self.phase_ms = {phase: [0.0] * history for phase in PHASES}
+        self.gc_ms = [0.0] * history  # pause GC otomatis di dalam frame
+        self.index = 0
+        self.count = 0
+        self.frame_number = 0
+
+        self.visible = False
+        self.spike_count = 0
+        self.pending_spikes = []
+        self.last_flush = time.perf_counter()
+
+        # Extra overlay lines: callables returning a list of strings
+        self.overlay_providers = []
+
+        self._current = {}
+        self._last = None
+        self._font = None
+        self._panel = None
+
+    # ===============================
+    # TIMING
+    # ===============================
+    def begin_frame(self):
+        self._current = dict.fromkeys(PHASES, 0.0)
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Close the running phase and start timing the next one"""
+        now = time.perf_counter()
+        self._current[phase] += (now - self._last) * 1000.0
+        self._last = now
+
+    def end_frame(self, scene=None):
+        i = self.index
+        work = 0.0
+        for phase in PHASES:
+            ms = self._current.get(phase, 0.0)
+            self.phase_ms[phase][i] = ms
+            if phase in WORK_PHASES:
+                work += ms
+        self.frame_ms[i] = work
+        self.gc_ms[i] = gc_policy.take_pause_ms()
+
+        self.index = (i + 1) % self.history
+        self.count = min(self.count + 1, self.history)
+        self.frame_number += 1
+
+        if work > self.budget_ms:
+            self.record_spike(work, scene)
+        if self.pending_spikes and time.perf_counter() - self.last_flush > 1.0:
+            self.flush()
+
+    # ===============================
+    # STATISTICS
+    # ===============================
+    def last_frame_ms(self):
+        return self.frame_ms[(self.index - 1) % self.history]
+
+    def samples(self, values=None):
+        """Return buffered samples oldest-first"""
+        values = self.frame_ms if values is None else values
+        if self.count < self.history:
+            return values[:self.count]
+        return values[self.index:] + values[:self.index]
+
+    def percentile(self, pct, values=None):
+        data = sorted(self.samples(values))
+        if not data:
+            return 0.0
+        k = min(len(data) - 1, int(round(pct / 100.0 * (len(data) - 1))))
+        return data[k]
+
+    def phase_average(self, phase):
+        data = self.samples(self.phase_ms[phase])
+        return sum(data) / len(data) if data else 0.0
+
+    # ===============================
+    # SPIKE LOG
+    # ===============================
+    def record_spike(self, work_ms, scene):
+        i = (self.index - 1) % self.history
+        entities = getattr(scene, "entities", None)
+        self.spike_count += 1
+        self.pending_spikes.append({
+            "ts": round(time.time(), 3),
+            "frame": self.frame_number,
+            "total_ms": round(work_ms, 3),
+            "budget_ms": round(self.budget_ms, 3),
+            "phases": {p: round(self.phase_ms[p][i], 3) for p in PHASES},
+            "gc_ms": round(self.gc_ms[i], 3),
+            "scene": scene.__class__.__name__ if scene is not None else None,
+            "entities": len(entities) if entities is not None else None,
+        })
+
+    def flush(self):
+        """Write buffered spikes; batched so the log itself doesn't cause hitches"""
+        self.last_flush = time.perf_counter()
+        if not self.pending_spikes or not self.spike_log:
+            self.pending_spikes = []
+            return
+        folder = os.path.dirname(self.spike_log)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        with open(self.spike_log, "a") as f:
+            for spike in self.pending_spikes:
+                f.write(json.dumps(spike) + "\n")
+        self.pending_spikes = []
+
+    # ===============================
+    # OVERLAY
+    # ===============================
+    def toggle(self):
+        self.visible = not self.visible
+
+    def add_overlay_provider(self, provider):
+        self.overlay_providers.append(provider)
+
+    def overlay_lines(self, scene):
+        frames = self.samples()
+        avg = sum(frames) / len(frames) if frames else 0.0
+        lines = [
+            f"frame avg {avg:5.2f} ms  p50 {self.percentile(50):5.2f}  "
+            f"p99 {self.percentile(99):5.2f}  max {max(frames, default=0.0):5.2f}",
+            "  ".join(f"{p} {self.phase_average(p):4.2f}" for p in WORK_PHASES),
+            f"budget {self.budget_ms:.1f} ms  spikes {self.spike_count}  "
+            f"gc max {max(self.samples(self.gc_ms), default=0.0):.2f} ms",
+        ]
+
+        entities = getattr(scene, "entities", None)
+        if entities is not None:
+            counts = Counter(ent.__class__.__name__ for ent in entities)
+            lines.append(f"entities {len(entities)}: " + ", ".join(
+                f"{name} {n}" for name, n in sorted(counts.items())))
+
+        for provider in self.overlay_providers:
+            lines.extend(provider())
+        return lines
+
+    def draw(self, screen, scene=None):
+        if not self.visible:
+            return
+        if self._font is None:
+            self._font = sysfont("consolas", 14)
+
+        lines = self.overlay_lines(scene)
+        graph_h = 60
+        line_h = self._font.get_linesize()
+        width = max(self.history, 420) + 16
+        height = graph_h + 16 + line_h * len(lines) + 8
+
+        if self._panel is None or self._panel.get_size() != (width, height):
+            self._panel = new_surface((width, height))
+        panel = self._panel
+        panel.fill((10, 15, 20, 190))
+
+        # Frame-time graph, satu batang per frame
+        scale = graph_h / (self.budget_ms * 2)
+        base_y = 8 + graph_h
+        for x, ms in enumerate(self.samples()):
+            h = min(graph_h, int(ms * scale))
+            color = (230, 80, 80) if ms > self.budget_ms else (90, 210, 120)
+            pygame.draw.line(panel, color, (8 + x, base_y), (8 + x, base_y - h))
+        budget_y = base_y - int(self.budget_ms * scale)
+        pygame.draw.line(panel, (255, 220, 100), (8, budget_y), (8 + self.history, budget_y))
+
+        y = base_y + 8
+        for line in lines:
+            panel.blit(self._font.render(line, True, (230, 230, 230)), (8, y))
+            y += line_h
+
+        screen.blit(panel, (screen.get_width() - width - 8, screen.get_height() - height - 8))
@@ -0,0 +1,116 @@
+# quality.py
+from collections import deque
+
+from settings import (FRAME_BUDGET_MS, PARTICLE_COUNT, QUALITY_TIER, QUALITY_WINDOW,
+                      QUALITY_DOWNGRADE, QUALITY_UPGRADE, QUALITY_UPGRADE_HOLD)
+
+# Tier rendah -> tinggi. Semua knob grafis dibaca dari tier yang aktif.
+TIERS = [
+    {
+        "name": "low",
+        "particles": 0.25,        # skala jumlah partikel tiap spawn_particles
+        "max_particles": 40,      # batas partikel hidup sekaligus
+        "bg_particles": PARTICLE_COUNT // 4,
+        "glow": False,
+        "grass_anim": False,
+        "anim_cadence": 3,        # animasi sprite maju tiap N frame
+        "overlays": False,        # gradien/vignette layar penuh
+    },
+    {
+        "name": "medium",
+        "particles": 0.5,
+        "max_particles": 120,
+        "bg_particles": PARTICLE_COUNT // 2,
+        "glow": True,
+        "grass_anim": True,
+        "anim_cadence": 2,
+        "overlays": True,
+    },
+    {
+        "name": "high",
+        "particles": 1.0,
+        "max_particles": 400,
+        "bg_particles": PARTICLE_COUNT,
+        "glow": True,
+        "grass_anim": True,
+        "anim_cadence": 1,
+        "overlays": True,
+    },
+]
+TIER_NAMES = [tier["name"] for tier in TIERS]
+
+
+class QualityController:
+    """
+    Steps the quality tier from measured frame times.
+    Watches the p90 of a rolling window of frame work times: over
+    QUALITY_DOWNGRADE of the budget drops a tier right away, under
+    QUALITY_UPGRADE for QUALITY_UPGRADE_HOLD frames in a row raises one.
+    The gap between the two thresholds plus the hold keeps it from flapping.
+    """
+    def __init__(self, tier=QUALITY_TIER, budget_ms=FRAME_BUDGET_MS,
+                 window=QUALITY_WINDOW):
+        self.auto = tier == "auto"
+        self.index = len(TIERS) - 1 if self.auto else TIER_NAMES.index(tier)
+        self.budget_ms = budget_ms
+        self.samples = deque(maxlen=window)
+        self.calm_frames = 0
+        self.changes = 0
+
+    @property
+    def tier(self):
+        return TIERS[self.index]
+
+    def set_tier(self, name):
+        """Pin a tier by name ('auto' resumes adapting)"""
+        self.auto = name == "auto"
+        if not self.auto:
+            self.index = TIER_NAMES.index(name)
+        self.samples.clear()
+        self.calm_frames = 0
+
+    def observe(self, frame_ms):
+        if not self.auto:
+            return
+        self.samples.append(frame_ms)
+        if len(self.samples) < self.samples.maxlen:
+            return
+
+        p90 = sorted(self.samples)[int(len(self.samples) * 0.9)]
+        if p90 > self.budget_ms * QUALITY_DOWNGRADE and self.index > 0:
+            self.step(-1)
+        elif p90 < self.budget_ms * QUALITY_UPGRADE and self.index < len(TIERS) - 1:
+            self.calm_frames += 1
+            if self.calm_frames >= QUALITY_UPGRADE_HOLD:
+                self.step(1)
+        else:
+            self.calm_frames = 0
+
+    def step(self, direction):
+        self.index += direction
+        self.changes += 1
+        # Jendela baru: ukur ulang dengan tier yang baru
+        self.samples.clear()
+        self.calm_frames = 0
+
+    def overlay_lines(self):
+        mode = "auto" if self.auto else "fixed"
+        return [f"quality {self.tier['name']} ({mode})  changes {self.changes}"]
+
+
+# Satu controller untuk seluruh game; entity dan scene membaca tier-nya
+controller = QualityController()
+
+
+def tier():
+    return controller.tier
+
+
+def particle_count(count):
+    return int(count * controller.tier["particles"] + 0.5)
+
+
+def anim_ticks(ticks):
+    """Quantize a pygame tick count to the tier's animation cadence"""
+    step = controller.tier["anim_cadence"] * 1000 // 60
+    return ticks - ticks % step
@@ -0,0 +1,289 @@
+# replay.py
+import os
+import random
+import struct
+import time
+
+import pygame
+import gc_policy
+from settings import REPLAY_DIR, REPLAY_KEEP, REPLAY_RECORDING
+
+MAGIC = b"DGRP"
+VERSION = 1
+
+# Layout file: header, lalu satu record per tick diikuti event-event tick itu
+HEADER = struct.Struct("<4sBQB")      # magic, version, seed, level_id
+TICK = struct.Struct("<dHB")          # dt, key mask, event count
+KEY_EVENT = struct.Struct("<Bi")      # kind, key
+MOUSE_EVENT = struct.Struct("<Bhhb")  # kind, x, y, button
+
+# Keys polled by Player.update, one bit each in the tick's key mask
+MOVE_KEYS = (
+    pygame.K_LEFT, pygame.K_a,
+    pygame.K_RIGHT, pygame.K_d,
+    pygame.K_UP, pygame.K_w,
+    pygame.K_DOWN, pygame.K_s,
+)
+KEY_BITS = {key: 1 << i for i, key in enumerate(MOVE_KEYS)}
+
+# Event types routed to handle_event that scenes react to
+KEY_KINDS = {pygame.KEYDOWN: 1, pygame.KEYUP: 2}
+MOUSE_KINDS = {pygame.MOUSEMOTION: 3, pygame.MOUSEBUTTONDOWN: 4, pygame.MOUSEBUTTONUP: 5}
+EVENT_TYPES = {kind: etype for etype, kind in {**KEY_KINDS, **MOUSE_KINDS}.items()}
+
+
+def key_mask(pressed):
+    """Pack the movement keys of a get_pressed() result into a bit mask"""
+    mask = 0
+    for key, bit in KEY_BITS.items():
+        if pressed[key]:
+            mask |= bit
+    return mask
+
+
+class KeyState:
+    """Stand-in for pygame.key.get_pressed() rebuilt from a key mask"""
+    def __init__(self, mask=0):
+        self.mask = mask
+
+    def __getitem__(self, key):
+        return bool(self.mask & KEY_BITS.get(key, 0))
+
+
+def encode_event(event):
+    kind = KEY_KINDS.get(event.type)
+    if kind is not None:
+        return KEY_EVENT.pack(kind, event.key)
+    kind = MOUSE_KINDS.get(event.type)
+    if kind is not None:
+        x, y = event.pos
+        return MOUSE_EVENT.pack(kind, x, y, getattr(event, "button", 0))
+    return None
+
+
+def make_event(kind, data):
+    etype = EVENT_TYPES[kind]
+    if etype in KEY_KINDS:
+        return pygame.event.Event(etype, key=data[0], mod=0, unicode="", scancode=0)
+    x, y, button = data
+    if etype == pygame.MOUSEMOTION:
+        return pygame.event.Event(etype, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+    return pygame.event.Event(etype, pos=(x, y), button=button)
+
+
+# ===============================
+# RECORDING
+# ===============================
+class InputRecorder:
+    """
+    Writes the seed, level id and per-tick input of a run to a compact
+    binary log in REPLAY_DIR. GameScene starts a recording; Game.change_scene
+    stops it once play leaves the game/question scenes.
+    """
+    def __init__(self, folder=REPLAY_DIR, keep=REPLAY_KEEP, enabled=REPLAY_RECORDING):
+        self.folder = folder
+        self.keep = keep
+        self.enabled = enabled
+        self.file = None
+        self.path = None
+        self.pending = []
+
+    @property
+    def active(self):
+        return self.file is not None
+
+    def begin(self, seed, level_id):
+        self.end()
+        if not self.enabled:
+            return
+        if not os.path.exists(self.folder):
+            os.makedirs(self.folder)
+        self.prune()
+        self.path = os.path.join(
+            self.folder, f"replay_{int(time.time() * 1000)}_L{level_id}.dgr")
+        self.file = open(self.path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, seed, level_id))
+
+    def record_event(self, event):
+        if self.file is None:
+            return
+        data = encode_event(event)
+        if data is not None and len(self.pending) < 255:
+            self.pending.append(data)
+
+    def record_tick(self, dt, mask):
+        if self.file is None:
+            return
+        self.file.write(TICK.pack(dt, mask, len(self.pending)))
+        for data in self.pending:
+            self.file.write(data)
+        self.pending = []
+
+    def end(self):
+        if self.file is not None:
+            self.file.close()
+        self.file = None
+        self.pending = []
+
+    def prune(self):
+        """Keep only the newest REPLAY_KEEP logs so kiosks don't fill up"""
+        logs = sorted(f for f in os.listdir(self.folder) if f.endswith(".dgr"))
+        for name in logs[:max(0, len(logs) - self.keep + 1)]:
+            os.remove(os.path.join(self.folder, name))
+
+
+# ===============================
+# PLAYBACK
+# ===============================
+class Replay:
+    """A decoded replay: seed, level id and a list of (dt, mask, events) ticks"""
+    def __init__(self, seed, level_id, ticks):
+        self.seed = seed
+        self.level_id = level_id
+        self.ticks = ticks
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        magic, version, seed, level_id = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay")
+
+        ticks = []
+        offset = HEADER.size
+        while offset + TICK.size <= len(data):
+            dt, mask, count = TICK.unpack_from(data, offset)
+            offset += TICK.size
+            events = []
+            for _ in range(count):
+                kind = data[offset]
+                if kind in (1, 2):
+                    events.append(make_event(kind, KEY_EVENT.unpack_from(data, offset)[1:]))
+                    offset += KEY_EVENT.size
+                else:
+                    events.append(make_event(kind, MOUSE_EVENT.unpack_from(data, offset)[1:]))
+                    offset += MOUSE_EVENT.size
+            ticks.append((dt, mask, events))
+        return cls(seed, level_id, ticks)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, self.level_id))
+            for dt, mask, events in self.ticks:
+                f.write(TICK.pack(dt, mask, len(events)))
+                for event in events:
+                    f.write(encode_event(event))
+
+    @classmethod
+    def synthetic(cls, level_id, ticks=3600, seed=1234, dt=1 / 60):
+        """
+        Scripted workload for benchmarks: wanders around with held movement
+        keys and answers any question that pops up.
+        """
+        rng = random.Random(seed)
+        result = []
+        mask = 0
+        hold = 0
+        for i in range(ticks):
+            if hold <= 0:
+                mask = rng.choice([0] + list(KEY_BITS.values()) * 2)
+                hold = rng.randint(10, 40)
+            hold -= 1
+            events = []
+            if i % 90 == 45:
+                key = rng.choice([pygame.K_t, pygame.K_f])
+                events.append(make_event(1, (key,)))
+            result.append((dt, mask, events))
+        return cls(seed, level_id, result)
+
+
+class Replayer:
+    """
+    Drives GameScene from a Replay, either headless as fast as possible or
+    rendered at any speed (1.0 = real time, 0 = unthrottled).
+    """
+    def __init__(self, game, replay):
+        self.game = game
+        self.replay = replay
+
+    def run(self, render=True, speed=1.0, profiler=None):
+        from scenes.game_scene import GameScene
+
+        game = self.game
+        game.recorder.enabled = False
+        game.change_scene(GameScene(game, self.replay.level_id, seed=self.replay.seed))
+
+        ticks = 0
+        start = time.perf_counter()
+        sim_time = 0.0
+        for dt, mask, events in self.replay.ticks:
+            if not getattr(game.scene, "records_input", False):
+                break  # replay left the game, e.g. ESC back to home
+            if profiler:
+                profiler.begin_frame()
+
+            for event in events:
+                game.scene.handle_event(event)
+            if profiler:
+                profiler.lap("events")
+
+            game.key_state = KeyState(mask)
+            game.scene.update(dt)
+            if profiler:
+                profiler.lap("update")
+
+            if render:
+                game.scene.render(game.screen)
+                if profiler:
+                    profiler.draw(game.screen, game.scene)
+                    profiler.lap("render")
+                pygame.display.flip()
+                if profiler:
+                    profiler.lap("flip")
+                pygame.event.pump()
+
+            if profiler:
+                profiler.end_frame(game.scene)
+
+            ticks += 1
+            sim_time += dt
+            if render and speed > 0:
+                ahead = sim_time / speed - (time.perf_counter() - start)
+                if ahead > 0:
+                    gc_policy.idle(ahead)  # seperti Game.run: GC di sisa waktu frame
+                    ahead = sim_time / speed - (time.perf_counter() - start)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+        game.key_state = None
+        return ticks
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Play back a Distraction Garden replay")
+    parser.add_argument("path", help="replay file (.dgr)")
+    parser.add_argument("--headless", action="store_true", help="simulate without a window")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed, 0 = unthrottled")
+    args = parser.parse_args()
+
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from main import Game
+
+    game = Game()
+    replay = Replay.load(args.path)
+    start = time.perf_counter()
+    ticks = Replayer(game, replay).run(render=not args.headless, speed=args.speed)
+    print(f"replayed {ticks} ticks of level {replay.level_id} "
+          f"(seed {replay.seed}) in {time.perf_counter() - start:.2f}s")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
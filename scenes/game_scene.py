@@ -8,18 +8,42 @@ from scenes.base_scene import BaseScene
 from scenes.question_scene import QuestionScene
 
 from entities.player import Player
-from entities.bug import ChatBug, NotifBadge, PopupBug
-from entities.plant import Plant
+from entities.bug import Bug, ChatBug, NotifBadge, PopupBug, prebake_bug_sprites
+from entities.bug_swarm import BugSwarm
+from entities.plant import Plant, prebake_plant_sprites
 from entities.floworb import FlowOrb
+from entities.particle import Particle
+from gfx import glow
+from gfx.fonts import sysfont
+from gfx.render_queue import RenderQueue
+from gfx.surfaces import new_surface
 from ui.hud import HUD
+from utils import save_stats_json
+from cache_registry import ManagedCache
+import quality
+import telemetry
 from settings import *
 
+_buttons = ManagedCache("end_button")  # (width, height, text, color, hover) -> button sprite
+
 
 class GameScene(BaseScene):
-    def __init__(self, game, level_id: int):
+    records_input = True  # input direkam untuk replay
+    entity_churn = True   # GC: threshold gameplay (lihat gc_policy)
+
+    def __init__(self, game, level_id: int, seed=None):
         super().__init__(game)
         self.level_id = level_id
 
+        # ===== DETERMINISM =====
+        # Semua random gameplay berasal dari seed ini supaya run bisa di-replay
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        random.seed(self.seed)
+        # Partikel kosmetik punya RNG sendiri: jumlahnya ikut tier kualitas,
+        # jadi tidak boleh menggeser urutan random gameplay
+        self.fx_random = random.Random(self.seed)
+        self.game.recorder.begin(self.seed, level_id)
+
         # ===== LEVEL TARGETS =====
         self.level_targets = {1: 100, 2: 200, 3: 300}  # Score target per level
         self.target_score = self.level_targets.get(level_id, 100)
@@ -29,6 +53,8 @@ class GameScene(BaseScene):
         self.focus = 100
         self.game_over = False
         self.repels = 0  # Counter for repelled bugs
+        self.elapsed = 0.0  # waktu simulasi selama level dimainkan
+        self.focus_sample_timer = 0.0
 
         # ===== WORLD =====
         self.entities = []
@@ -37,25 +63,34 @@ class GameScene(BaseScene):
 
         # Background particles
         self.bg_particles = []
+        self.particle_count = 0
         self.init_background()
 
         # initial plants
+        self.plants = []
         for i in range(3):
-            self.entities.append(
-                Plant(140 + i * 220, HEIGHT - 140)
-            )
+            plant = Plant(140 + i * 220, HEIGHT - 140)
+            self.plants.append(plant)
+            self.entities.append(plant)
+
+        # Bug kinematics are batched here; bugs are still entities for draw/interact
+        self.swarm = BugSwarm()
+        self.render_queue = RenderQueue()
+
+        # Sprite frames dibake saat scene dimuat, bukan saat frame pertama
+        prebake_bug_sprites()
+        prebake_plant_sprites()
 
         # ===== UI =====
-        self.hud = None
+        self.hud = HUD(self)
 
         # ===== SPAWN CONTROL =====
         self.bug_timer = 0
         self.flow_timer = 0
         self.question_cooldown = 0
 
-        self.font = pygame.font.SysFont("segoeui", 20)
-        self.title_font = pygame.font.SysFont("bahnschrift", 32, bold=True, italic=True)
-        self.big_font = pygame.font.SysFont("arial", 48, bold=True)
+        self.font = sysfont("segoeui", 20)
+        self.big_font = sysfont("arial", 48, bold=True)
         
         self.recent_bug_pressure = []
         
@@ -74,10 +109,15 @@ class GameScene(BaseScene):
         self.game_over_selection = 0  # 0: Retry, 1: Home
         self.level_complete_selection = 0  # 0: Next Level, 1: Home
         
-        # Tombol untuk touchpad
-        self.retry_button = None
-        self.home_button = None
-        self.next_button = None
+        # Tombol untuk touchpad (geometri tetap, supaya klik juga bekerja tanpa render)
+        button_width, button_height, button_spacing = 180, 60, 40
+        buttons_start_x = WIDTH // 2 - (2 * button_width + button_spacing) // 2
+        buttons_y = HEIGHT // 2 + 140
+        self.retry_button = pygame.Rect(buttons_start_x, buttons_y, button_width, button_height)
+        self.end_screen = None    # frozen world + static end panel, dibuat saat state masuk
+        self.next_button = self.retry_button.copy()
+        self.home_button = pygame.Rect(buttons_start_x + button_width + button_spacing,
+                                       buttons_y, button_width, button_height)
 
         # Play level start sound
         self.game.audio.play('level_start')
@@ -100,7 +140,7 @@ class GameScene(BaseScene):
     def handle_event(self, event):
         # Handle mouse events untuk touchpad
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             
             if self.game_over:
                 if self.retry_button and self.retry_button.collidepoint(mouse_pos):
@@ -182,6 +222,10 @@ class GameScene(BaseScene):
     # UPDATE LOOP
     # ===============================
     def update(self, dt):
+        # Posisi sebelum step ini, untuk interpolasi saat render
+        for ent in self.entities:
+            ent.prev_center = ent.rect.center
+
         # Update animation timers
         self.pulse_timer += dt * 2
         self.focus_pulse = max(0, self.focus_pulse - dt * 2)
@@ -193,8 +237,8 @@ class GameScene(BaseScene):
         # Update background particles
         for particle in self.bg_particles:
             particle['wobble'] += dt * 2
-            particle['x'] += math.sin(particle['wobble']) * particle['speed']
-            particle['y'] += math.cos(particle['wobble'] * 0.7) * particle['speed']
+            particle['x'] += math.sin(particle['wobble']) * particle['speed'] * 60 * dt
+            particle['y'] += math.cos(particle['wobble'] * 0.7) * particle['speed'] * 60 * dt
             
             # Wrap around screen
             if particle['x'] < 0:
@@ -210,13 +254,21 @@ class GameScene(BaseScene):
         if self.question_cooldown > 0:
             self.question_cooldown -= dt
 
+        self.elapsed += dt
         self.focus -= dt * (2 + self.level_id * 1)
 
+        self.focus_sample_timer += dt
+        if self.focus_sample_timer >= TELEMETRY_FOCUS_INTERVAL:
+            self.focus_sample_timer -= TELEMETRY_FOCUS_INTERVAL
+            self.track("focus_sample", focus=round(self.focus, 1),
+                       bugs=self.swarm.live_count())
+
         # PERIKSA APAKAH LEVEL SELESAI
         if self.player.score >= self.target_score and not self.level_complete:
             self.level_complete = True
             self.focus = 100
             self.game.audio.play('level_complete') 
+            self.save_session()
             return
 
         # game over jika fokus habis
@@ -224,6 +276,7 @@ class GameScene(BaseScene):
             self.focus = 0
             self.game_over = True
             self.game.audio.play('game_over')  
+            self.save_session()
             return
 
         # spawn bug 
@@ -232,10 +285,7 @@ class GameScene(BaseScene):
             self.spawn_bug()
             self.bug_timer = 0
 
-        bug_count = len([
-            e for e in self.entities
-            if e.__class__.__name__ in ("ChatBug", "NotifBadge", "PopupBug")
-        ])
+        bug_count = self.swarm.live_count()
         self.recent_bug_pressure.append(bug_count)
         if len(self.recent_bug_pressure) > 120:
             self.recent_bug_pressure.pop(0)
@@ -245,63 +295,105 @@ class GameScene(BaseScene):
             self.spawn_flow()
             self.flow_timer = 0
 
+        # bug movement + plant hits, vectorized
+        self.plants = [p for p in self.plants if p.is_alive()]
+        self.swarm.step(dt, self, self.plants)
+
         # update entities
         for ent in list(self.entities):
             ent.update(dt, self)
             if not ent.is_alive():
                 self.entities.remove(ent)
+                if isinstance(ent, Particle):
+                    self.particle_count -= 1
+                elif isinstance(ent, Plant):
+                    self.track("plant_death", plants_left=sum(p.is_alive() for p in self.plants))
+
+        # collision detection: bugs through the swarm's vectorized overlap test
+        for bug in self.swarm.overlapping(self.player.rect):
+            result = bug.interact(self.player, self)
+            if result:
+                self.handle_bug_result(bug, result)
 
-        # collision detection 
         for ent in list(self.entities):
-            if ent is self.player:
+            if ent is self.player or isinstance(ent, Bug):
                 continue
-            
+
             if self.player.rect.colliderect(ent.rect):
-                # Jika ent adalah bug (gangguan)
-                if ent.__class__.__name__ in ("ChatBug", "NotifBadge", "PopupBug"):
-                    result = ent.interact(self.player, self)
-                    
-                    if result:
-                        if result.get("type") == "bug_destroyed":
-                            if isinstance(ent, ChatBug):
-                                self.game.audio.play('chatbug_hit')
-                            elif isinstance(ent, NotifBadge):
-                                self.game.audio.play('notifbug_hit')
-                            elif isinstance(ent, PopupBug):
-                                self.game.audio.play('popupbug_hit')
-                                
-                            self.repels += 1  # Tambah counter repels
-                            self.player.score += 15
-                            self.focus_pulse = 1.0
-                            # Spawn particles untuk feedback
-                            self.spawn_particles(ent, "spark", 10)
-                        
-                        elif result.get("type") == "popup_bug":
-                            if self.question_cooldown <= 0:
-                                self.trigger_question()
-                
                 # Jika ent adalah flow orb
-                elif ent.__class__.__name__ == "FlowOrb":
+                if ent.__class__.__name__ == "FlowOrb":
                     result = ent.interact(self.player, self)
                     if result and result.get("type") == "flow_collected":
                         self.focus = min(100, self.focus + 20)
                         self.player.score += 20
                         self.focus_pulse = 1.5
+                        self.track("orb_pickup", focus=round(self.focus, 1))
+
+    def handle_bug_result(self, ent, result):
+        """Apply the result of the player touching a bug"""
+        if result.get("type") == "bug_destroyed":
+            if isinstance(ent, ChatBug):
+                self.game.audio.play('chatbug_hit')
+            elif isinstance(ent, NotifBadge):
+                self.game.audio.play('notifbug_hit')
+            elif isinstance(ent, PopupBug):
+                self.game.audio.play('popupbug_hit')
+                
+            self.repels += 1  # Tambah counter repels
+            self.player.score += 15
+            self.focus_pulse = 1.0
+            self.track("bug_kill", bug=type(ent).__name__)
+            # Spawn particles untuk feedback
+            self.spawn_particles(ent, "spark", 10)
+        
+        elif result.get("type") == "popup_bug":
+            if self.question_cooldown <= 0:
+                self.trigger_question()
 
     # ===============================
     # RENDER
     # ===============================
     def render(self, screen):
+        # Layar akhir: dunia + panel statis dibekukan sekali saat state masuk,
+        # tiap frame hanya tombol (hover/selection) yang digambar ulang
+        if self.game_over or self.level_complete:
+            if self.end_screen is None:
+                self.end_screen = self.build_end_screen(screen)
+            screen.blit(self.end_screen, (0, 0))
+            if self.game_over:
+                self.draw_game_over_buttons(screen)
+            else:
+                self.draw_level_complete_buttons(screen)
+            return
+
+        self.draw_world(screen)
+
+        # Title and Stats overlay
+        self.hud.draw(screen)
+
+    def build_end_screen(self, screen):
+        """Compose the frozen world frame and the static end panel"""
+        self.draw_world(screen)
+        self.hud.draw(screen)
+        frozen = screen.copy()
+        if self.game_over:
+            self.draw_game_over_screen(frozen)
+        else:
+            self.draw_level_complete_screen(frozen)
+        return frozen
+
+    def draw_world(self, screen):
         bg_color = self.level_colors[(self.level_id - 1) % len(self.level_colors)]
         screen.fill(bg_color)
 
-        # Draw background particles
-        for particle in self.bg_particles:
-            alpha = 100 + int(math.sin(particle['wobble']) * 50)
-            color = (*particle['color'][:3], alpha)
-            s = pygame.Surface((particle['size'] * 2, particle['size'] * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, color, (particle['size'], particle['size']), particle['size'])
-            screen.blit(s, (int(particle['x']), int(particle['y'])))
+        tier = quality.tier()
+
+        # Draw background particles (sebanyak budget tier); disc dari glow cache
+        # bersama per (radius, warna), alpha wobble lewat set_alpha
+        for particle in self.bg_particles[:tier["bg_particles"]]:
+            dot = glow.disc(particle['size'], particle['color'][:3], step=1)
+            dot.set_alpha(100 + int(math.sin(particle['wobble']) * 50))
+            screen.blit(dot, (int(particle['x']), int(particle['y'])))
 
         # ground with pattern
         pygame.draw.rect(
@@ -312,7 +404,8 @@ class GameScene(BaseScene):
         
         # Grass pattern
         for i in range(0, WIDTH, 20):
-            height = 10 + int(math.sin(i * 0.1 + self.pulse_timer) * 3)
+            phase = self.pulse_timer if tier["grass_anim"] else 0
+            height = 10 + int(math.sin(i * 0.1 + phase) * 3)
             pygame.draw.line(
                 screen,
                 GRASS_LIGHT,
@@ -321,213 +414,65 @@ class GameScene(BaseScene):
                 2
             )
 
-        # entities
+        # entities: sprite blits di-batch per layer, sisanya draw() biasa
+        moved = self.interpolate(self.game.render_alpha)
+        queue = self.render_queue
         for ent in self.entities:
-            ent.draw(screen)
+            ent.submit(queue)
+        queue.flush(screen)
 
         # Focus pulse effect
-        if self.focus_pulse > 0:
-            pulse_radius = int(50 * self.focus_pulse)
-            pulse_surface = pygame.Surface((pulse_radius * 2, pulse_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(pulse_surface, (100, 200, 255, int(100 * self.focus_pulse)), 
-                             (pulse_radius, pulse_radius), pulse_radius)
-            screen.blit(pulse_surface, (self.player.rect.centerx - pulse_radius, 
-                                      self.player.rect.centery - pulse_radius))
-
-        # Title and Stats overlay
-        self.draw_game_header(screen)
-
-        # Tampilkan layar game over atau level complete
-        if self.game_over:
-            self.draw_game_over_screen(screen)
-        elif self.level_complete:
-            self.draw_level_complete_screen(screen)
-
-    def draw_game_header(self, screen):
-        """Draw game title and player stats dengan target score"""
-        # 1. TOP BAR BACKGROUND
-        top_bar = pygame.Surface((WIDTH, 80), pygame.SRCALPHA)
-        for y in range(80):
-            alpha = 180 - int(y * 0.5)
-            color = (20, 30, 40, alpha)
-            pygame.draw.line(top_bar, color, (0, y), (WIDTH, y))
-        screen.blit(top_bar, (0, 0))
-        
-        # 2. KIRI: GAME TITLE
-        pulse = (math.sin(self.pulse_timer * 1.5) + 1) * 0.5
-        title_color = (int(180 + 50 * pulse), int(220 + 20 * pulse), 255)
-        
-        title = self.title_font.render("DISTRACTION GARDEN", True, title_color)
-        subtitle = pygame.font.SysFont("Russo One", 21).render("Protect Your Focus", True, (200, 200, 220))
-
-        screen.blit(title, (25, 15))
-        screen.blit(subtitle, (30, 55))
-        
-        # 3. TENGAH: FOCUS BAR 
-        focus_percent = int(self.focus)
-        bar_width = 200
-        bar_height = 20
-        bar_x = 450
-        bar_y = 28
-    
-        # Label FOCUS
-        focus_label = pygame.font.SysFont("arial", 17, bold=True).render("Focus", True, (240, 240, 240))
-        screen.blit(focus_label, (bar_x - 55, bar_y + 3))
-        
-        # Focus bar
-        bar_container = pygame.Rect(bar_x - 3, bar_y - 3, bar_width + 6, bar_height + 6)
-        pygame.draw.rect(screen, (40, 50, 70), bar_container, border_radius=6)
-        pygame.draw.rect(screen, (80, 90, 110), bar_container, 2, border_radius=6)
-
-        # Bar fill
-        fill_width = max(0, int((focus_percent / 100) * bar_width))
-        if fill_width > 0:
-            if focus_percent > 70:
-                color_start = (80, 220, 120)
-                color_end = (120, 255, 160)
-            elif focus_percent > 40:
-                color_start = (250, 200, 80)
-                color_end = (255, 220, 100)
-            else:
-                color_start = (220, 70, 60)
-                color_end = (255, 100, 90)
-            
-            # Draw gradient fill
-            fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-            for i in range(fill_width):
-                ratio = i / fill_width
-                r = int(color_start[0] + (color_end[0] - color_start[0]) * ratio)
-                g = int(color_start[1] + (color_end[1] - color_start[1]) * ratio)
-                b = int(color_start[2] + (color_end[2] - color_start[2]) * ratio)
-                pygame.draw.line(screen, (r, g, b), 
-                               (bar_x + i, bar_y), 
-                               (bar_x + i, bar_y + bar_height - 1))
-            
-            pygame.draw.rect(screen, (255, 255, 255, 50), 
-                            (bar_x, bar_y, fill_width, bar_height), 
-                            1, border_radius=4)
-            
-            # Pulse effect saat fokus rendah
-            if focus_percent < 30:
-                pulse_alpha = int(100 * (0.5 + 0.5 * math.sin(self.pulse_timer * 4)))
-                pulse_overlay = pygame.Surface((fill_width, bar_height), pygame.SRCALPHA)
-                pulse_overlay.fill((255, 255, 255, pulse_alpha))
-                screen.blit(pulse_overlay, (bar_x, bar_y))
-        
-        # Persentase fokus
-        focus_text = pygame.font.SysFont("arial", 17, bold=True).render(f"{focus_percent}%", True, (255, 255, 255))
-        screen.blit(focus_text, (bar_x + bar_width + 15, bar_y + 2))
-        
-        # Progress score (target)
-        progress_ratio = min(1.0, self.player.score / self.target_score)
-        progress_text = pygame.font.SysFont("arial", 12).render(
-            f"Target: {self.player.score}/{self.target_score}", 
-            True, (200, 200, 200)
-        )
-        screen.blit(progress_text, (bar_x, bar_y + bar_height + 8))
-        
-        # Progress bar kecil
-        progress_width = 100
-        progress_height = 4
-        progress_bar_x = bar_x + bar_width - progress_width
-        progress_bar_y = bar_y + bar_height + 12
-        
-        pygame.draw.rect(screen, (60, 60, 80), 
-                        (progress_bar_x, progress_bar_y, progress_width, progress_height))
-        
-        if progress_ratio > 0:
-            progress_fill = int(progress_width * progress_ratio)
-            progress_color = (100, 200, 100) if progress_ratio >= 1.0 else (100, 150, 255)
-            pygame.draw.rect(screen, progress_color, 
-                           (progress_bar_x, progress_bar_y, progress_fill, progress_height))
-            
-        # 4. STATS PANEL 
-        stats_panel_width = 220
-        stats_panel_height = 80
-        stats_x = WIDTH - stats_panel_width - 20
-        stats_y = 5
-        
-        # Panel background dengan efek depth
-        panel_bg = pygame.Surface((stats_panel_width, stats_panel_height), pygame.SRCALPHA)
-        
-        # Gradient background
-        for y in range(stats_panel_height):
-            alpha = 120 + int(30 * (y / stats_panel_height))
-            pygame.draw.line(panel_bg, (30, 40, 50, alpha), 
-                            (0, y), (stats_panel_width, y))
-        
-        # Border dengan efek 3D
-        pygame.draw.rect(panel_bg, (255, 255, 255, 40), 
-                        (0, 0, stats_panel_width, stats_panel_height), 
-                        2, border_radius=8)
-        pygame.draw.rect(panel_bg, (0, 0, 0, 60), 
-                        (2, 2, stats_panel_width - 4, stats_panel_height - 4), 
-                        1, border_radius=6)
-        
-        screen.blit(panel_bg, (stats_x, stats_y))
-        
-        # Grid stats 2x2 dengan spacing yang baik
-        stats = [
-            ("Score", f"{self.player.score}", (255, 255, 180)),
-            ("Level", f"{self.level_id}", (255, 180, 180)),
-            ("Repels", f"{self.repels}", (180, 255, 180)),
-            ("Plants", "3", (180, 180, 255))
-        ]
-        
-        # Font untuk stats
-        stat_label_font = pygame.font.SysFont("arial", 13)
-        stat_value_font = pygame.font.SysFont("arial", 18, bold=True)
-        
-        for i, (label, value, color) in enumerate(stats):
-            col = i % 2
-            row = i // 2
-            
-            # Hitung posisi dengan padding
-            cell_width = stats_panel_width // 2
-            cell_height = stats_panel_height // 2
-            
-            stat_x_pos = stats_x + col * cell_width
-            stat_y_pos = stats_y + row * cell_height
-            
-            # Center dalam cell
-            label_text = stat_label_font.render(label, True, (200, 200, 220))
-            label_rect = label_text.get_rect(center=(
-                stat_x_pos + cell_width // 2,
-                stat_y_pos + cell_height // 2 - 10
-            ))
-            
-            value_text = stat_value_font.render(value, True, color)
-            value_rect = value_text.get_rect(center=(
-                stat_x_pos + cell_width // 2,
-                stat_y_pos + cell_height // 2 + 12
-            ))
-            
-            screen.blit(label_text, label_rect)
-            screen.blit(value_text, value_rect)
-            
-            # Garis pemisah vertikal
-            if col == 0:
-                pygame.draw.line(screen, (255, 255, 255, 30),
-                            (stat_x_pos + cell_width - 1, stat_y_pos + 5),
-                            (stat_x_pos + cell_width - 1, stat_y_pos + cell_height - 5), 1)
-            
-            # Garis pemisah horizontal
-            if row == 0:
-                pygame.draw.line(screen, (255, 255, 255, 30),
-                            (stat_x_pos + 5, stat_y_pos + cell_height - 1),
-                            (stat_x_pos + cell_width - 5, stat_y_pos + cell_height - 1), 1)
+        if self.focus_pulse > 0 and tier["glow"]:
+            glow.draw_disc(screen, self.player.rect.center, 50 * self.focus_pulse,
+                           (100, 200, 255), 100 * self.focus_pulse)
+
+        # Kembalikan posisi simulasi
+        for ent, center in moved:
+            ent.rect.center = center
+
+    def interpolate(self, alpha):
+        """
+        Move entity rects between their previous and current simulation
+        positions for drawing. Returns (entity, center) pairs to restore.
+        """
+        moved = []
+        if alpha >= 1.0:
+            return moved
+        for ent in self.entities:
+            px, py = ent.prev_center
+            cx, cy = center = ent.rect.center
+            if px != cx or py != cy:
+                ent.rect.center = (round(px + (cx - px) * alpha), round(py + (cy - py) * alpha))
+                moved.append((ent, center))
+        return moved
 
     # ===============================
     # SPAWN METHODS
     # ===============================
+    def track(self, kind, **fields):
+        """Telemetry event from live play (replays and benchmarks don't emit)"""
+        if self.game.key_state is None:
+            telemetry.emit(kind, level=self.level_id, seed=self.seed, **fields)
+
+    def save_session(self):
+        """Record the finished level in the stats store (live play only, not replays)"""
+        if self.game.key_state is not None:
+            return
+        self.track("level_end", completed=self.level_complete, score=self.player.score,
+                   duration=round(self.elapsed, 2))
+        save_stats_json({
+            "level": self.level_id,
+            "score": self.player.score,
+            "repels": self.repels,
+            "plants_remaining": len(self.plants),
+            "duration": round(self.elapsed, 2),
+            "focus": round(self.focus, 2),
+            "completed": self.level_complete,
+            "seed": self.seed,
+        })
+
     def spawn_bug(self):
         """Spawn bugs only from top with SLOWER speeds"""
-        bug_colors = {
-            "chat": (255, 50, 50),     
-            "notif": (50, 200, 50),    
-            "popup": (255, 255, 50)     
-        }
-        
         base_speeds = [1.0, 1.5, 2.0]
         speed_variation = 0.3
         
@@ -541,16 +486,14 @@ class GameScene(BaseScene):
         if kind == "chat":
             bug = ChatBug(x, y)
             bug.speed = speed
-            bug.color = bug_colors["chat"]
         elif kind == "notif":
             bug = NotifBadge(x, y)
             bug.speed = speed
-            bug.color = bug_colors["notif"]
         else:
             bug = PopupBug(x, y)
             bug.speed = speed
-            bug.color = bug_colors["popup"]
         
+        self.swarm.add(bug)
         self.entities.append(bug)
 
     def spawn_flow(self):
@@ -561,11 +504,14 @@ class GameScene(BaseScene):
     def spawn_particles(self, ent, kind="spark", count=8):
         """ Spawn particle effects at entity location.
         Called when bugs are destroyed, plants level up, etc. """
-        from entities.particle import Particle
+        tier = quality.tier()
+        count = min(quality.particle_count(count),
+                    tier["max_particles"] - self.particle_count)
         
         cx, cy = ent.rect.center
         for _ in range(count):
-            self.entities.append(Particle(cx, cy, kind))
+            self.entities.append(Particle(cx, cy, kind, self.fx_random))
+        self.particle_count += max(0, count)
     
     # ===============================
     # QUESTION INTEGRATION
@@ -620,12 +566,15 @@ class GameScene(BaseScene):
     
     def draw_level_complete_screen(self, screen):
         # Overlay dengan efek gradien
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for y in range(HEIGHT):
-            alpha = 180 - int(y * 0.1)
-            color = (0, 0, 0, alpha)
-            pygame.draw.line(overlay, color, (0, y), (WIDTH, y))
-        screen.blit(overlay, (0, 0))
+        if quality.tier()["overlays"]:
+            overlay = new_surface((WIDTH, HEIGHT))
+            for y in range(HEIGHT):
+                alpha = 180 - int(y * 0.1)
+                color = (0, 0, 0, alpha)
+                pygame.draw.line(overlay, color, (0, y), (WIDTH, y))
+            screen.blit(overlay, (0, 0))
+        else:
+            screen.fill((80, 80, 80), special_flags=pygame.BLEND_RGB_MULT)
         
         # Background panel utama dengan efek neon
         panel_width = 600
@@ -634,7 +583,7 @@ class GameScene(BaseScene):
         panel_y = HEIGHT // 2 - panel_height // 2
         
         # Panel background dengan gradien
-        panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel_bg = new_surface((panel_width, panel_height))
         for y in range(panel_height):
             alpha = 200 + int(55 * (y / panel_height))
             color = (20, 30, 50, alpha)
@@ -647,7 +596,7 @@ class GameScene(BaseScene):
                         (2, 2, panel_width - 4, panel_height - 4), 2, border_radius=18)
         
         # Glow effect
-        glow_surface = pygame.Surface((panel_width + 40, panel_height + 40), pygame.SRCALPHA)
+        glow_surface = new_surface((panel_width + 40, panel_height + 40))
         pygame.draw.rect(glow_surface, (100, 255, 100, 50), 
                         (0, 0, glow_surface.get_width(), glow_surface.get_height()), 
                         border_radius=30)
@@ -655,14 +604,6 @@ class GameScene(BaseScene):
         
         screen.blit(panel_bg, (panel_x, panel_y))
         
-        # Level complete title dengan efek animasi
-        pulse = (math.sin(self.pulse_timer * 3) + 1) * 0.5
-        title_color = (
-            int(100 + 155 * pulse),
-            int(255 - 55 * pulse),
-            int(100 + 155 * pulse)
-        )
-        
         # Judul utama dengan shadow
         level_complete_text = self.big_font.render("LEVEL COMPLETE!", True, (255, 255, 255))
         level_complete_shadow = self.big_font.render("LEVEL COMPLETE!", True, (0, 0, 0, 100))
@@ -671,7 +612,7 @@ class GameScene(BaseScene):
         screen.blit(level_complete_text, (WIDTH // 2 - level_complete_text.get_width() // 2, HEIGHT // 2 - 155))
         
         # Subtitle
-        subtitle = pygame.font.SysFont("arial", 24).render("Congratulations! You've protected your focus", True, (200, 255, 200))
+        subtitle = sysfont("arial", 24).render("Congratulations! You've protected your focus", True, (200, 255, 200))
         screen.blit(subtitle, (WIDTH // 2 - subtitle.get_width() // 2, HEIGHT // 2 - 100))
         
         # Achievement badge
@@ -680,7 +621,7 @@ class GameScene(BaseScene):
         badge_y = HEIGHT // 2 - 70
         
         # Badge dengan efek 3D
-        badge_surface = pygame.Surface((badge_size, badge_size), pygame.SRCALPHA)
+        badge_surface = new_surface((badge_size, badge_size))
         pygame.draw.circle(badge_surface, (255, 215, 0), (badge_size//2, badge_size//2), badge_size//2)
         pygame.draw.circle(badge_surface, (255, 255, 150), (badge_size//2, badge_size//2), badge_size//2 - 5)
         pygame.draw.circle(badge_surface, (255, 200, 0), (badge_size//2, badge_size//2), badge_size//2 - 8)
@@ -707,20 +648,20 @@ class GameScene(BaseScene):
         stats_x = WIDTH // 2 - stats_width // 2
         stats_y = HEIGHT // 2
         
-        stats_bg = pygame.Surface((stats_width, stats_height), pygame.SRCALPHA)
+        stats_bg = new_surface((stats_width, stats_height))
         stats_bg.fill((255, 255, 255, 30))
         pygame.draw.rect(stats_bg, (255, 255, 255, 50), 
                         (0, 0, stats_width, stats_height), 2, border_radius=15)
         
         # Blur effect
-        blur_overlay = pygame.Surface((stats_width, stats_height), pygame.SRCALPHA)
+        blur_overlay = new_surface((stats_width, stats_height))
         blur_overlay.fill((255, 255, 255, 20))
         stats_bg.blit(blur_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         
         screen.blit(stats_bg, (stats_x, stats_y))
         
         # Final stats dengan layout grid
-        stats_font = pygame.font.SysFont("arial", 22)
+        stats_font = sysfont("arial", 22)
         
         score_text = stats_font.render(f"Score: {self.player.score}", True, (255, 255, 180))
         repels_text = stats_font.render(f"Bugs Repelled: {self.repels}", True, (180, 255, 180))
@@ -732,7 +673,8 @@ class GameScene(BaseScene):
         screen.blit(repels_text, (stats_x + stats_width - repels_text.get_width() - 40, stats_y + 20))
         screen.blit(level_text, (stats_x + 40, stats_y + 70))
         screen.blit(target_text, (stats_x + stats_width - target_text.get_width() - 40, stats_y + 70))
-        
+
+    def draw_level_complete_buttons(self, screen):
         # Tombol dalam layout horizontal
         button_width = 180
         button_height = 60
@@ -772,12 +714,15 @@ class GameScene(BaseScene):
     
     def draw_game_over_screen(self, screen):
         # Overlay dengan efek gelap
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for y in range(HEIGHT):
-            alpha = 200 - int(y * 0.08)
-            color = (0, 0, 0, alpha)
-            pygame.draw.line(overlay, color, (0, y), (WIDTH, y))
-        screen.blit(overlay, (0, 0))
+        if quality.tier()["overlays"]:
+            overlay = new_surface((WIDTH, HEIGHT))
+            for y in range(HEIGHT):
+                alpha = 200 - int(y * 0.08)
+                color = (0, 0, 0, alpha)
+                pygame.draw.line(overlay, color, (0, y), (WIDTH, y))
+            screen.blit(overlay, (0, 0))
+        else:
+            screen.fill((60, 60, 60), special_flags=pygame.BLEND_RGB_MULT)
         
         # Background panel utama
         panel_width = 600
@@ -786,7 +731,7 @@ class GameScene(BaseScene):
         panel_y = HEIGHT // 2 - panel_height // 2
         
         # Panel background dengan gradien merah
-        panel_bg = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        panel_bg = new_surface((panel_width, panel_height))
         for y in range(panel_height):
             alpha = 200 + int(55 * (y / panel_height))
             color = (40, 20, 30, alpha)
@@ -799,7 +744,7 @@ class GameScene(BaseScene):
                         (2, 2, panel_width - 4, panel_height - 4), 2, border_radius=18)
         
         # Glow effect
-        glow_surface = pygame.Surface((panel_width + 40, panel_height + 40), pygame.SRCALPHA)
+        glow_surface = new_surface((panel_width + 40, panel_height + 40))
         pygame.draw.rect(glow_surface, (255, 100, 100, 50), 
                         (0, 0, glow_surface.get_width(), glow_surface.get_height()), 
                         border_radius=30)
@@ -807,14 +752,6 @@ class GameScene(BaseScene):
         
         screen.blit(panel_bg, (panel_x, panel_y))
         
-        # Game over title dengan efek pulsating
-        pulse = (math.sin(self.pulse_timer * 4) + 1) * 0.5
-        title_color = (
-            int(255 - 55 * pulse),
-            int(100 + 155 * pulse),
-            int(100 + 155 * pulse)
-        )
-        
         # Judul utama dengan shadow
         game_over_text = self.big_font.render("GAME OVER", True, (255, 255, 255))
         game_over_shadow = self.big_font.render("GAME OVER", True, (0, 0, 0, 100))
@@ -823,7 +760,7 @@ class GameScene(BaseScene):
         screen.blit(game_over_text, (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 155))
         
         # Subtitle
-        subtitle = pygame.font.SysFont("arial", 24).render("Your focus has been overwhelmed by distractions", True, (255, 200, 200))
+        subtitle = sysfont("arial", 24).render("Your focus has been overwhelmed by distractions", True, (255, 200, 200))
         screen.blit(subtitle, (WIDTH // 2 - subtitle.get_width() // 2, HEIGHT // 2 - 100))
         
         # Warning icon
@@ -832,7 +769,7 @@ class GameScene(BaseScene):
         warning_y = HEIGHT // 2 - 70
         
         # Warning triangle
-        warning_surface = pygame.Surface((warning_size, warning_size), pygame.SRCALPHA)
+        warning_surface = new_surface((warning_size, warning_size))
         triangle_points = [
             (warning_size//2, 10),
             (warning_size - 10, warning_size - 10),
@@ -855,20 +792,20 @@ class GameScene(BaseScene):
         stats_x = WIDTH // 2 - stats_width // 2
         stats_y = HEIGHT // 2
         
-        stats_bg = pygame.Surface((stats_width, stats_height), pygame.SRCALPHA)
+        stats_bg = new_surface((stats_width, stats_height))
         stats_bg.fill((255, 255, 255, 30))
         pygame.draw.rect(stats_bg, (255, 255, 255, 50), 
                         (0, 0, stats_width, stats_height), 2, border_radius=15)
         
         # Blur effect
-        blur_overlay = pygame.Surface((stats_width, stats_height), pygame.SRCALPHA)
+        blur_overlay = new_surface((stats_width, stats_height))
         blur_overlay.fill((255, 255, 255, 20))
         stats_bg.blit(blur_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
         
         screen.blit(stats_bg, (stats_x, stats_y))
         
         # Final stats
-        stats_font = pygame.font.SysFont("arial", 22)
+        stats_font = sysfont("arial", 22)
         
         score_text = stats_font.render(f"Score: {self.player.score}", True, (255, 255, 180))
         repels_text = stats_font.render(f"Bugs Repelled: {self.repels}", True, (180, 255, 180))
@@ -880,7 +817,8 @@ class GameScene(BaseScene):
         screen.blit(repels_text, (stats_x + stats_width - repels_text.get_width() - 40, stats_y + 20))
         screen.blit(level_text, (stats_x + 40, stats_y + 70))
         screen.blit(target_text, (stats_x + stats_width - target_text.get_width() - 40, stats_y + 70))
-        
+
+    def draw_game_over_buttons(self, screen):
         # Tombol dalam layout horizontal
         button_width = 180
         button_height = 60
@@ -923,11 +861,22 @@ class GameScene(BaseScene):
         
     
     def draw_button(self, screen, x, y, width, height, text, base_color, hover=False):
-        """Draw a button with hover effects"""
-        button_rect = pygame.Rect(x, y, width, height)
+        """Draw a button with hover effects (surface cached per look)"""
+        key = (width, height, text, base_color, hover)
+        sprite = _buttons.get(key)
+        if sprite is None:
+            sprite = _buttons[key] = self.render_button(
+                width, height, text, base_color, hover)
+        screen.blit(sprite, (x - 10, y - 10))
+        return pygame.Rect(x, y, width, height)
+
+    def render_button(self, width, height, text, base_color, hover):
+        """Button with a 10px margin for the hover glow"""
+        sprite = new_surface((width + 20, height + 20))
+        x, y = 10, 10
         
         # Button background dengan gradien
-        button_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        button_surface = new_surface((width, height))
         
         if hover:
             # Hover effect - lebih terang
@@ -946,11 +895,11 @@ class GameScene(BaseScene):
                             (0, 0, width, height), 3, border_radius=12)
             
             # Glow effect
-            glow = pygame.Surface((width + 20, height + 20), pygame.SRCALPHA)
+            glow = new_surface((width + 20, height + 20))
             pygame.draw.rect(glow, (*base_color[:3], 50), 
                             (0, 0, glow.get_width(), glow.get_height()), 
                             border_radius=20)
-            screen.blit(glow, (x - 10, y - 10))
+            sprite.blit(glow, (x - 10, y - 10))
         else:
             # Normal state
             for i in range(height):
@@ -966,20 +915,20 @@ class GameScene(BaseScene):
         pygame.draw.rect(button_surface, (0, 0, 0, 30), 
                         (2, 2, width - 4, height - 4), border_radius=10)
         
-        screen.blit(button_surface, (x, y))
+        sprite.blit(button_surface, (x, y))
         
         # Button text
-        button_font = pygame.font.SysFont("arial", 20, bold=True)
+        button_font = sysfont("arial", 20, bold=True)
         text_color = (255, 255, 255) if hover else (240, 240, 240)
         text_surface = button_font.render(text, True, text_color)
         
         # Text shadow
         shadow_surface = button_font.render(text, True, (0, 0, 0, 100))
-        screen.blit(shadow_surface, (x + width//2 - text_surface.get_width()//2 + 1, y + height//2 - text_surface.get_height()//2 + 1))
+        sprite.blit(shadow_surface, (x + width//2 - text_surface.get_width()//2 + 1, y + height//2 - text_surface.get_height()//2 + 1))
         
-        screen.blit(text_surface, (x + width//2 - text_surface.get_width()//2, y + height//2 - text_surface.get_height()//2))
+        sprite.blit(text_surface, (x + width//2 - text_surface.get_width()//2, y + height//2 - text_surface.get_height()//2))
         
-        return button_rect
+        return sprite
     
     def draw_selection_indicator(self, screen, x, y):
         """Draw selection indicator arrow"""
@@ -998,4 +947,7 @@ class GameScene(BaseScene):
     # PUBLIC API (FOR HUD)
     # ===============================
     def get_focus_level(self):
-        return max(0, min(100, int(self.focus)))
\ No newline at end of file
+        return max(0, min(100, int(self.focus)))
+
+    def get_pressed(self):
+        return self.game.get_pressed()
\ No newline at end of file
@@ -1,14 +1,20 @@
 import pygame, math
 import random  
 from scenes.base_scene import BaseScene
+from gfx.backdrop import Starfield, dot, gradient
+from gfx.fonts import sysfont
+from settings import MENU_AMBIENT_FPS
+import warmup
 
 class HomeScene(BaseScene):
+    ambient_fps = MENU_AMBIENT_FPS  # redraw saat input, selain itu cadence lambat
+
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont("bahnschrift", 72, bold=True, italic=True)
-        self.menu_font = pygame.font.SysFont("segoeui", 36, bold=True)
-        self.small = pygame.font.SysFont("segoeui", 24, bold=True, italic=True)
-        self.hint_font = pygame.font.SysFont("consolas", 16, bold=True)
+        self.font = sysfont("bahnschrift", 72, bold=True, italic=True)
+        self.menu_font = sysfont("segoeui", 36, bold=True)
+        self.small = sysfont("segoeui", 24, bold=True, italic=True)
+        self.hint_font = sysfont("consolas", 16, bold=True)
 
         self.menu = [
             ("Start Game", self.start_game),
@@ -21,6 +27,14 @@ class HomeScene(BaseScene):
         self.animation_timer = 0
         self.bg_particles = []
         self.init_background()
+
+        # Backdrop dan teks statis dibuat sekali
+        self.backdrop = gradient((self.game.width, self.game.height), (20, 30, 40), (30, 45, 60))
+        self.starfield = Starfield(20, (0, 0, self.game.width, 100))
+        self.title = self.font.render("DISTRACTION GARDEN", True, (180, 220, 255))
+        self.subtitle = self.small.render("Protect Your Mind Garden", True, (200, 200, 220))
+        self.version = self.hint_font.render("© 2025 Distraction Garden v1.0",
+                                             True, (120, 120, 140))
         
         # Menu item rectangles for click detection
         self.menu_rects = []
@@ -28,6 +42,7 @@ class HomeScene(BaseScene):
         
         # Audio state
         self.last_hover_index = -1
+        self.pending_start = False  # Start Game dipilih, menunggu warm-up selesai
     
     def init_background(self):
         """Initialize background particles"""
@@ -103,6 +118,10 @@ class HomeScene(BaseScene):
                     break
     
     def update(self, dt):
+        if self.pending_start and warmup.ready():
+            self.start_game()
+            return
+
         # Update animation timer
         self.animation_timer += dt
         self.title_glow = (math.sin(self.animation_timer) + 1) / 2
@@ -110,8 +129,8 @@ class HomeScene(BaseScene):
         # Update background particles
         for particle in self.bg_particles:
             particle['wobble'] += dt * 2
-            particle['x'] += math.cos(particle['direction']) * particle['speed']
-            particle['y'] += math.sin(particle['direction']) * particle['speed']
+            particle['x'] += math.cos(particle['direction']) * particle['speed'] * 60 * dt
+            particle['y'] += math.sin(particle['direction']) * particle['speed'] * 60 * dt
             
             # Wrap around screen
             if particle['x'] < -20:
@@ -124,6 +143,11 @@ class HomeScene(BaseScene):
                 particle['y'] = -20
 
     def start_game(self):
+        if not warmup.ready():
+            # Level pertama dimulai begitu cache-nya siap
+            self.pending_start = True
+            self.ambient_fps = None
+            return
         from scenes.game_scene import GameScene
         self.game.change_scene(GameScene(self.game, level_id=1))
 
@@ -139,58 +163,43 @@ class HomeScene(BaseScene):
         # Gradient background
         self.draw_gradient_background(screen)
         
-        # Background particles
-        for particle in self.bg_particles:
-            particle_surface = pygame.Surface((particle['size'] * 2, particle['size'] * 2), 
-                                            pygame.SRCALPHA)
-            alpha = 80 + int(40 * math.sin(particle['wobble']))
-            color = (*particle['color'][:3], alpha)
-            pygame.draw.circle(particle_surface, color, 
-                             (particle['size'], particle['size']), particle['size'])
-            screen.blit(particle_surface, 
-                       (int(particle['x']), int(particle['y'])))
+        # Background particles (sprite pre-baked per ukuran/warna/alpha)
+        screen.blits([
+            (dot(particle['size'], particle['color'], 80 + 40 * math.sin(particle['wobble'])),
+             (int(particle['x']), int(particle['y'])))
+            for particle in self.bg_particles
+        ], doreturn=False)
         
         # Title with glow effect
         self.draw_title(screen)
         
         # Subtitle
-        subtitle = self.small.render("Protect Your Mind Garden", True, (200, 200, 220))
-        screen.blit(subtitle, (self.game.width // 2 - subtitle.get_width() // 2, 160))
+        screen.blit(self.subtitle, (self.game.width // 2 - self.subtitle.get_width() // 2, 160))
     
         # Menu items
         self.draw_menu(screen)
         
+        if self.pending_start:
+            text = self.hint_font.render(f"Preparing garden... {warmup.progress():.0%}",
+                                         True, (180, 200, 220))
+            screen.blit(text, (self.game.width // 2 - text.get_width() // 2, 400))
+
         # Version/copyright
-        version = self.hint_font.render("© 2025 Distraction Garden v1.0", 
-                                       True, (120, 120, 140))
-        screen.blit(version, (self.game.width // 2 - version.get_width() // 2, 
-                            self.game.height - 30))
+        screen.blit(self.version, (self.game.width // 2 - self.version.get_width() // 2, 
+                                   self.game.height - 30))
     
     def draw_gradient_background(self, screen):
-        """Draw gradient background"""
-        for y in range(self.game.height):
-            # Vertical gradient from dark to light
-            r = int(20 + 10 * (y / self.game.height))
-            g = int(30 + 15 * (y / self.game.height))
-            b = int(40 + 20 * (y / self.game.height))
-            pygame.draw.line(screen, (r, g, b), (0, y), (self.game.width, y))
+        """Draw cached gradient background and the twinkling starfield"""
+        screen.blit(self.backdrop, (0, 0))
         
-        # Add some stars/particles in the "sky"
-        for _ in range(20):
-            x = random.randint(0, self.game.width)
-            y = random.randint(0, 100)
-            size = random.randint(1, 3)
-            brightness = random.randint(150, 255)
-            pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), size)
+        # Stars in the "sky": posisi tetap, hanya alpha yang berkedip
+        self.starfield.draw(screen, self.animation_timer)
     
     # Versi sederhana tanpa glow untuk testing
     def draw_title(self, screen):
         """Draw animated title - SIMPLE VERSION FOR DEBUGGING"""
-        title_text = "DISTRACTION GARDEN"
-        
-        # Hanya render teks utama tanpa glow
-        title_color = (180, 220, 255)
-        title = self.font.render(title_text, True, title_color)
+        # Hanya teks utama tanpa glow (di-render sekali di __init__)
+        title = self.title
         title_x = self.game.width // 2 - title.get_width() // 2
         title_y = 80
         
@@ -2,6 +2,12 @@ import pygame
 import random  
 import math
 from scenes.base_scene import BaseScene
+from gfx.surfaces import new_surface
+from gfx.backdrop import dot, gradient
+from gfx.fonts import sysfont
+from cache_registry import ManagedCache
+from settings import MENU_AMBIENT_FPS
+import warmup
 
 LEVELS = [
     (1, "Notification Overload", "Basic distractions", (100, 200, 255)),
@@ -9,13 +15,22 @@ LEVELS = [
     (3, "Burnout Phase", "Intense pressure", (255, 100, 100))
 ]
 
+GRID_SIZE = 40
+GRID_ALPHA = 12      # rata-rata kilau grid lama (10..15)
+BUG_WOBBLE_STEPS = 16  # sudut kaki preview bug yang dibake
+
+_backdrops = ManagedCache("level_backdrop")  # level color -> gradient + grid
+_bug_sprites = ManagedCache("preview_bug")   # (size, color, wobble step) -> preview bug
+
 class LevelSelectScene(BaseScene):
+    ambient_fps = MENU_AMBIENT_FPS  # redraw saat input, selain itu cadence lambat
+
     def __init__(self, game):
         super().__init__(game)
-        self.font = pygame.font.SysFont("arial", 32, bold=True)
-        self.level_font = pygame.font.SysFont("arial", 24)
-        self.desc_font = pygame.font.SysFont("arial", 18)
-        self.small = pygame.font.SysFont("arial", 16)
+        self.font = sysfont("arial", 32, bold=True)
+        self.level_font = sysfont("arial", 24)
+        self.desc_font = sysfont("arial", 18)
+        self.small = sysfont("arial", 16)
         
         self.selected = 0
         self.animation_timer = 0
@@ -38,6 +53,9 @@ class LevelSelectScene(BaseScene):
         
         # Audio state
         self.last_hover_index = -1
+
+        self.title_image = self.build_title()
+        self.pending_level = None  # level dipilih, menunggu warm-up selesai
         
     def init_preview(self):
         """Initialize preview animations"""
@@ -76,9 +94,7 @@ class LevelSelectScene(BaseScene):
                 self.game.audio.play('menu_select')
             elif event.key == pygame.K_RETURN:
                 self.game.audio.play('button_click')
-                from scenes.game_scene import GameScene
-                level_id = LEVELS[self.selected][0]
-                self.game.change_scene(GameScene(self.game, level_id))
+                self.start_level(LEVELS[self.selected][0])
             elif event.key == pygame.K_ESCAPE:
                 self.game.audio.play('button_click')
                 from scenes.home_scene import HomeScene
@@ -106,9 +122,7 @@ class LevelSelectScene(BaseScene):
             for i, rect in enumerate(self.level_rects):
                 if rect.collidepoint(mouse_pos):
                     self.game.audio.play('button_click')
-                    from scenes.game_scene import GameScene
-                    level_id = LEVELS[i][0]
-                    self.game.change_scene(GameScene(self.game, level_id))
+                    self.start_level(LEVELS[i][0])
                     return
             
            # Check back button click
@@ -117,15 +131,28 @@ class LevelSelectScene(BaseScene):
                 from scenes.home_scene import HomeScene
                 self.game.change_scene(HomeScene(self.game))
     
+    def start_level(self, level_id):
+        """Start a level once the warm-up has its caches hot"""
+        if not warmup.ready():
+            self.pending_level = level_id
+            self.ambient_fps = None  # frame penuh: warm-up dapat budget tiap frame
+            return
+        from scenes.game_scene import GameScene
+        self.game.change_scene(GameScene(self.game, level_id))
+
     def update(self, dt):
+        if self.pending_level is not None and warmup.ready():
+            self.start_level(self.pending_level)
+            return
+
         # Update animation timer
         self.animation_timer += dt
         
         # Update preview bugs
         for bug in self.preview_bugs:
             bug['wobble'] += dt * 3
-            bug['x'] += math.cos(bug['direction']) * bug['speed']
-            bug['y'] += math.sin(bug['direction']) * bug['speed'] * 0.5
+            bug['x'] += math.cos(bug['direction']) * bug['speed'] * 60 * dt
+            bug['y'] += math.sin(bug['direction']) * bug['speed'] * 0.5 * 60 * dt
             
             # Bounce off edges
             if bug['x'] < 100 or bug['x'] > 900:
@@ -134,35 +161,20 @@ class LevelSelectScene(BaseScene):
                 bug['direction'] = -bug['direction']
             
             # Add some wobble
-            bug['x'] += math.sin(bug['wobble']) * 2
+            bug['x'] += math.sin(bug['wobble']) * 2 * 60 * dt
 
     def render(self, screen):
         # Gradient background
         self.draw_gradient_background(screen)
         
-        # Preview bugs (tetap di background)
+        # Preview bugs (tetap di background), sprite per sudut kaki
+        blits = []
         for bug in self.preview_bugs:
-            # Bug body
-            pygame.draw.circle(screen, bug['color'], 
-                             (int(bug['x']), int(bug['y'])), bug['size'])
-            
-            # Bug eyes
-            eye_offset = bug['size'] * 0.4
-            pygame.draw.circle(screen, (30, 30, 30), 
-                             (int(bug['x'] - eye_offset), int(bug['y'] - eye_offset)), 2)
-            pygame.draw.circle(screen, (30, 30, 30), 
-                             (int(bug['x'] + eye_offset), int(bug['y'] - eye_offset)), 2)
-            
-            # Bug legs
-            for leg in range(3):
-                angle = math.radians(30 + leg * 60) + bug['wobble']
-                leg_length = bug['size'] * 1.2
-                leg_x = bug['x'] + math.cos(angle) * bug['size']
-                leg_y = bug['y'] + math.sin(angle) * bug['size']
-                leg_end_x = leg_x + math.cos(angle) * leg_length
-                leg_end_y = leg_y + math.sin(angle) * leg_length
-                pygame.draw.line(screen, bug['color'], 
-                               (leg_x, leg_y), (leg_end_x, leg_end_y), 2)
+            step = int(bug['wobble'] / (math.pi * 2) * BUG_WOBBLE_STEPS + 0.5) % BUG_WOBBLE_STEPS
+            image = preview_bug_sprite(bug['size'], bug['color'], step)
+            half = image.get_width() // 2
+            blits.append((image, (int(bug['x']) - half, int(bug['y']) - half)))
+        screen.blits(blits, doreturn=False)
         
         # Title (lebih besar dan di tengah)
         self.draw_title(screen)
@@ -179,47 +191,54 @@ class LevelSelectScene(BaseScene):
         # Selected level preview - dipindah ke kanan
         self.draw_selected_preview(screen)
 
+        if self.pending_level is not None:
+            text = self.small.render(f"Preparing level... {warmup.progress():.0%}",
+                                     True, (200, 220, 240))
+            screen.blit(text, (self.game.width // 2 - text.get_width() // 2,
+                               self.game.height - 40))
+
     def draw_gradient_background(self, screen):
         """Draw gradient background based on selected level"""
         selected_color = LEVELS[self.selected][3]
-        
-        for y in range(self.game.height):
-            # Interpolate between dark blue and selected level color
-            ratio = y / self.game.height
-            r = int(20 + (selected_color[0] - 20) * ratio * 0.3)
-            g = int(30 + (selected_color[1] - 30) * ratio * 0.3)
-            b = int(40 + (selected_color[2] - 40) * ratio * 0.3)
-            pygame.draw.line(screen, (r, g, b), (0, y), (self.game.width, y))
-        
-        # Add subtle grid pattern
-        grid_size = 40
-        for x in range(0, self.game.width, grid_size):
-            for y in range(0, self.game.height, grid_size):
-                alpha = 10 + int(5 * math.sin(x * 0.01 + y * 0.01 + self.animation_timer))
-                grid_surface = pygame.Surface((1, 1), pygame.SRCALPHA)
-                grid_surface.fill((255, 255, 255, alpha))
-                screen.blit(grid_surface, (x, y))
+        backdrop = _backdrops.get(selected_color)
+        if backdrop is None:
+            backdrop = _backdrops[selected_color] = self.build_backdrop(selected_color)
+        screen.blit(backdrop, (0, 0))
 
-    def draw_title(self, screen):
-        """Draw animated title"""
-        title_text = "SELECT YOUR CHALLENGE"
-        
+    def build_backdrop(self, selected_color):
+        """Gradient toward the level color plus the grid, baked once per level"""
+        size = (self.game.width, self.game.height)
+        # Interpolate 30% of the way from dark blue to the level color
+        top = (20, 30, 40)
+        bottom = tuple(t + (c - t) * 0.3 for t, c in zip(top, selected_color))
+        backdrop = gradient(size, top, bottom).copy()
+        
+        # Subtle grid pattern (kilau per frame yang nyaris tak terlihat dihapus)
+        grid_dot = dot(0, (255, 255, 255), GRID_ALPHA)
+        backdrop.blits([(grid_dot, (x, y))
+                        for x in range(0, self.game.width, GRID_SIZE)
+                        for y in range(0, self.game.height, GRID_SIZE)], doreturn=False)
+        return backdrop
+
+    def build_title(self):
+        """Title text on its background panel"""
         # Title dengan ukuran yang sesuai
-        title_color = (180, 220, 255)
-        title = self.font.render(title_text, True, title_color)
-        title_x = self.game.width // 2 - title.get_width() // 2
-        title_y = 60  # Lebih ke atas
+        title = self.font.render("SELECT YOUR CHALLENGE", True, (180, 220, 255))
         
         # Title background yang lebih sederhana
-        title_bg = pygame.Surface((title.get_width() + 30, title.get_height() + 15), 
-                                 pygame.SRCALPHA)
+        title_bg = new_surface((title.get_width() + 30, title.get_height() + 15))
         title_bg.fill((0, 0, 0, 80))
         pygame.draw.rect(title_bg, (255, 255, 255, 20), 
                         (0, 0, title_bg.get_width(), title_bg.get_height()), 
                         2, border_radius=5)
-        screen.blit(title_bg, (title_x - 15, title_y - 7))
-        
-        screen.blit(title, (title_x, title_y))
+        title_bg.blit(title, (15, 7))
+        return title_bg
+
+    def draw_title(self, screen):
+        """Draw the cached title"""
+        title_x = self.game.width // 2 - self.title_image.get_width() // 2
+        title_y = 60 - 7  # Lebih ke atas
+        screen.blit(self.title_image, (title_x, title_y))
 
     def draw_level_item(self, screen, index, level_id, name, description, color, y):
         """Draw a single level selection item"""
@@ -249,8 +268,7 @@ class LevelSelectScene(BaseScene):
         scaled_rect.center = rect.center
         
         # Level card background
-        card_surface = pygame.Surface((scaled_rect.width, scaled_rect.height), 
-                                     pygame.SRCALPHA)
+        card_surface = new_surface((scaled_rect.width, scaled_rect.height))
         
         # Card gradient
         for i in range(scaled_rect.height):
@@ -340,8 +358,7 @@ class LevelSelectScene(BaseScene):
         scaled_rect.center = self.back_rect.center
         
         # Button with gradient
-        button_surface = pygame.Surface((scaled_rect.width, scaled_rect.height), 
-                                       pygame.SRCALPHA)
+        button_surface = new_surface((scaled_rect.width, scaled_rect.height))
         
         for i in range(scaled_rect.height):
             shade = int(30 * (i / scaled_rect.height))
@@ -372,8 +389,7 @@ class LevelSelectScene(BaseScene):
         
         # Preview panel - lebih kecil dan di posisi yang tepat
         preview_rect = pygame.Rect(self.preview_x, 150, 250, 220)
-        preview_surface = pygame.Surface((preview_rect.width, preview_rect.height), 
-                                        pygame.SRCALPHA)
+        preview_surface = new_surface((preview_rect.width, preview_rect.height))
         
         # Panel background
         pygame.draw.rect(preview_surface, (0, 0, 0, 150), 
@@ -428,4 +444,38 @@ class LevelSelectScene(BaseScene):
     def get_time_limit(self, level_id):
         """Get time limit for level"""
         limits = {1: 10, 2: 8, 3: 6}
-        return limits.get(level_id, 5)
\ No newline at end of file
+        return limits.get(level_id, 5)
+
+
+def preview_bug_sprite(size, color, step):
+    key = (size, color, step)
+    image = _bug_sprites.get(key)
+    if image is None:
+        image = _bug_sprites[key] = bake_preview_bug(size, color, step)
+    return image
+
+
+def bake_preview_bug(size, color, step):
+    """Preview bug centered on a square surface, legs at wobble step"""
+    half = int(size * 2.2) + 2
+    surface = new_surface((half * 2, half * 2))
+    
+    # Bug body
+    pygame.draw.circle(surface, color, (half, half), size)
+    
+    # Bug eyes
+    eye_offset = size * 0.4
+    pygame.draw.circle(surface, (30, 30, 30), (int(half - eye_offset), int(half - eye_offset)), 2)
+    pygame.draw.circle(surface, (30, 30, 30), (int(half + eye_offset), int(half - eye_offset)), 2)
+    
+    # Bug legs
+    wobble = step * math.pi * 2 / BUG_WOBBLE_STEPS
+    for leg in range(3):
+        angle = math.radians(30 + leg * 60) + wobble
+        leg_length = size * 1.2
+        leg_x = half + math.cos(angle) * size
+        leg_y = half + math.sin(angle) * size
+        leg_end_x = leg_x + math.cos(angle) * leg_length
+        leg_end_y = leg_y + math.sin(angle) * leg_length
+        pygame.draw.line(surface, color, (leg_x, leg_y), (leg_end_x, leg_end_y), 2)
+    return surface
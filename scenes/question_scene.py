@@ -3,20 +3,36 @@ import json
 import random
 import math
 from scenes.base_scene import BaseScene
+from gfx import glow
+from gfx.fonts import sysfont
+from gfx.surfaces import new_surface
+from gfx.text_atlas import atlas
+from cache_registry import ManagedCache
+import asset_pack
+import quality
+import telemetry
 from settings import *
 
+QUESTIONS_FILE = "data/questions.json"
+VIGNETTE_SCALE = 4  # vignette digambar 1/4 ukuran lalu di-smoothscale
+
+_questions = None  # level -> list pertanyaan dari data/questions.json
+_vignettes = ManagedCache("vignette")  # screen size -> vignette overlay
+
+
 class QuestionScene(BaseScene):
+    records_input = True  # bagian dari run GameScene yang direkam
+    entity_churn = True
+
     def __init__(self, game, level_id, callback, return_scene):
         super().__init__(game)
         self.callback = callback
         self.return_scene = return_scene
         self.level_id = str(level_id)
 
-        self.font = pygame.font.SysFont("arial", 24)
-        self.big_font = pygame.font.SysFont("arial", 32, bold=True)
-        self.button_font = pygame.font.SysFont("arial", 28, bold=True)
-        self.title_font = pygame.font.SysFont("arial", 36, bold=True)
-        self.timer_font = pygame.font.SysFont("arial", 42, bold=True)  # Diperkecil untuk pojok
+        (self.font, self.big_font, self.button_font, self.title_font,
+         self.timer_font) = question_fonts()
+        self.sec_label = sysfont("arial", 14).render("Sec", True, (180, 180, 200))
 
         # Load semua level pertanyaan 
         self.all_questions = self.load_all_questions()
@@ -80,39 +96,11 @@ class QuestionScene(BaseScene):
 
     def load_all_questions(self):
         """Load all questions from questions.json file only"""
-        with open("data/questions.json", "r", encoding="utf-8") as f:
-            data = json.load(f)
-        
-        # Validasi struktur minimal
-        if not isinstance(data, dict):
-            raise ValueError("questions.json should be a dictionary")
-        
-        all_levels = {}
-        for level in ["1", "2", "3"]:
-            if level not in data:
-                raise ValueError(f"Level {level} not found in questions.json")
-            
-            if not isinstance(data[level], list):
-                raise ValueError(f"Level {level} should contain a list")
-            
-            all_levels[level] = data[level]
-        
-        return all_levels
+        return load_questions()
 
     def create_vignette_overlay(self):
         """Create a vignette effect overlay"""
-        overlay = pygame.Surface(self.game.screen.get_size(), pygame.SRCALPHA)
-        center_x = overlay.get_width() // 2
-        center_y = overlay.get_height() // 2
-        max_radius = max(center_x, center_y) * 1.5
-        
-        # Create radial gradient
-        for radius in range(int(max_radius), 0, -1):
-            alpha = int(180 * (1 - radius / max_radius) ** 2)
-            color = (0, 0, 0, alpha)
-            pygame.draw.circle(overlay, color, (center_x, center_y), radius)
-        
-        return overlay
+        return vignette(self.game.screen.get_size())
 
     def load_question(self):
         """Load a random question for the current level"""
@@ -189,6 +177,13 @@ class QuestionScene(BaseScene):
 
     def finish(self, player_answer):
         correct = player_answer == self.question["answer"]
+        if self.game.key_state is None:  # live play, bukan replay
+            questions = self.all_questions.get(self.level_id, [])
+            telemetry.emit("question_answer", level=int(self.level_id),
+                           question=questions.index(self.question) if self.question in questions else None,
+                           answer=player_answer, correct=correct,
+                           timed_out=self.time_left <= 0,
+                           latency=round(self.time_limit - max(0.0, self.time_left), 3))
         # Play feedback sound
         if correct:
             self.game.audio.play('answer_correct')
@@ -204,11 +199,11 @@ class QuestionScene(BaseScene):
         bg_color = self.get_background_color()
         screen.fill(bg_color)
         
-        # Overlay dengan animasi
-        overlay_copy = self.overlay.copy()
-        vignette_pulse = 0.9 + 0.1 * math.sin(self.animation_timer)
-        overlay_copy.set_alpha(int(150 * vignette_pulse))
-        screen.blit(overlay_copy, (0, 0))
+        # Overlay dengan animasi (alpha diatur langsung, tanpa copy tiap frame)
+        if quality.tier()["overlays"]:
+            vignette_pulse = 0.9 + 0.1 * math.sin(self.animation_timer)
+            self.overlay.set_alpha(int(150 * vignette_pulse))
+            screen.blit(self.overlay, (0, 0))
         
         # Timer di pojok kanan atas
         self.draw_timer(screen)
@@ -271,13 +266,11 @@ class QuestionScene(BaseScene):
                          (self.timer_x, self.timer_y), timer_bg_radius)
         
         # Outer glow effect saat waktu kritis
-        if self.time_left < self.critical_time:
+        if self.time_left < self.critical_time and quality.tier()["glow"]:
             pulse = 1 + 0.2 * math.sin(self.pulse_timer * 4)
-            glow_radius = int(timer_bg_radius * pulse)
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (*color, 80), 
-                             (glow_radius, glow_radius), glow_radius)
-            screen.blit(glow_surface, (self.timer_x - glow_radius, self.timer_y - glow_radius))
+            glow_color = (color[0], color[1] // 10 * 10, color[2])  # warna dikuantisasi agar cache kecil
+            glow.draw_disc(screen, (self.timer_x, self.timer_y),
+                           timer_bg_radius * pulse, glow_color, 80)
         
         # Progress ring background
         pygame.draw.circle(screen, (40, 40, 60), 
@@ -294,20 +287,19 @@ class QuestionScene(BaseScene):
                           math.radians(-90), math.radians(progress - 90), 5)
         
         # Timer text
-        timer_text = self.timer_font.render(f"{int(self.time_left)}", True, color)
-        timer_rect = timer_text.get_rect(center=(self.timer_x, self.timer_y))
-        screen.blit(timer_text, timer_rect)
+        # (digit atlas per warna; merah berdenyut dikuantisasi supaya atlas sedikit)
+        digit_color = (color[0], color[1] // 10 * 10, color[2])
+        atlas(self.timer_font, digit_color).draw(
+            screen, str(int(self.time_left)), (self.timer_x, self.timer_y), "center")
         
         # Label "SEC" kecil di bawah angka
-        sec_font = pygame.font.SysFont("arial", 14)
-        sec_label = sec_font.render("Sec", True, (180, 180, 200))
-        sec_rect = sec_label.get_rect(center=(self.timer_x, self.timer_y + 35))
-        screen.blit(sec_label, sec_rect)
+        sec_rect = self.sec_label.get_rect(center=(self.timer_x, self.timer_y + 35))
+        screen.blit(self.sec_label, sec_rect)
 
     def draw_question_panel(self, screen):
         """Draw question panel di tengah layar"""
         # Panel background dengan efek depth
-        panel_surface = pygame.Surface((self.panel_width, self.panel_height), pygame.SRCALPHA)
+        panel_surface = new_surface((self.panel_width, self.panel_height))
         
         # Shadow effect
         pygame.draw.rect(panel_surface, (0, 0, 0, 100), 
@@ -368,7 +360,7 @@ class QuestionScene(BaseScene):
 
     def draw_button(self, screen, rect, text, color, border_color):
         """Draw a single button with shortcut hint"""
-        button_surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        button_surface = new_surface((rect.width, rect.height))
         is_hovered = (self.hover_button == text.lower())
         
         # Button background dengan gradien
@@ -400,7 +392,7 @@ class QuestionScene(BaseScene):
         # Hover glow effect
         if is_hovered:
             glow_size = 8
-            glow_surface = pygame.Surface((rect.width + glow_size*2, rect.height + glow_size*2), pygame.SRCALPHA)
+            glow_surface = new_surface((rect.width + glow_size*2, rect.height + glow_size*2))
             glow_alpha = int(100 * (0.7 + 0.3 * math.sin(self.animation_timer * 2)))
             pygame.draw.rect(glow_surface, (*border_color[:3], glow_alpha), 
                            (glow_size, glow_size, rect.width, rect.height), 
@@ -442,4 +434,64 @@ class QuestionScene(BaseScene):
         if current:
             lines.append(current.strip())
         
-        return lines
\ No newline at end of file
+        return lines
+
+
+def question_fonts():
+    """Fonts of the question dialog (shared through gfx.fonts)"""
+    return (sysfont("arial", 24),
+            sysfont("arial", 32, bold=True),
+            sysfont("arial", 28, bold=True),
+            sysfont("arial", 36, bold=True),
+            sysfont("arial", 42, bold=True))  # timer, diperkecil untuk pojok
+
+
+def load_questions():
+    """Questions per level from data/questions.json, read and validated once"""
+    global _questions
+    if _questions is None:
+        pack = asset_pack.pack()
+        if pack is not None and QUESTIONS_FILE in pack:
+            data = json.loads(bytes(pack.data(QUESTIONS_FILE)))
+        else:
+            with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        # Validasi struktur minimal
+        if not isinstance(data, dict):
+            raise ValueError("questions.json should be a dictionary")
+
+        all_levels = {}
+        for level in ["1", "2", "3"]:
+            if level not in data:
+                raise ValueError(f"Level {level} not found in questions.json")
+
+            if not isinstance(data[level], list):
+                raise ValueError(f"Level {level} should contain a list")
+
+            all_levels[level] = data[level]
+        _questions = all_levels
+    return _questions
+
+
+def vignette(size):
+    """Dark radial vignette overlay for a screen size, built once"""
+    overlay = _vignettes.get(size)
+    if overlay is None:
+        small = new_surface((size[0] // VIGNETTE_SCALE, size[1] // VIGNETTE_SCALE))
+        center_x = small.get_width() // 2
+        center_y = small.get_height() // 2
+        max_radius = max(center_x, center_y) * 1.5
+
+        # Create radial gradient
+        for radius in range(int(max_radius), 0, -1):
+            alpha = int(180 * (1 - radius / max_radius) ** 2)
+            pygame.draw.circle(small, (0, 0, 0, alpha), (center_x, center_y), radius)
+        overlay = _vignettes[size] = pygame.transform.smoothscale(small, size)
+    return overlay
+
+
+def prebake_question_assets(size):
+    """Fonts and vignette of the question dialog (warm-up)"""
+    question_fonts()
+    vignette(size)
@@ -26,4 +26,84 @@ UI_HIGHLIGHT = (50, 150, 220)
 
 # Visual effects
 PARTICLE_COUNT = 20
-GLOW_INTENSITY = 0.7
\ No newline at end of file
+GLOW_INTENSITY = 0.7
+
+# Profiler (toggle with F3)
+PROFILER_HISTORY = 240          # frames kept in the ring buffer
+FRAME_BUDGET_MS = 1000.0 / FPS  # frames slower than this go to the spike log
+SPIKE_LOG_FILE = "data/spikes.jsonl"
+
+# Input recording (replays for bug reports and benchmarks)
+REPLAY_RECORDING = True
+REPLAY_DIR = "data/replays"
+REPLAY_KEEP = 20                # newest replay logs kept on disk
+
+# Pre-baked sprite animation frames per bug type (more = smoother, more memory)
+BUG_ANIM_FRAMES = {"Bug": 12, "ChatBug": 1, "NotifBadge": 8, "PopupBug": 2}
+PLANT_ANIM_FRAMES = 120  # frames per growth level over the 4*pi s plant loop
+
+# Debug: warn when a cached surface isn't in the display pixel format
+DEBUG_SURFACES = False
+
+# Fixed-step simulation (render interpolates between steps)
+SIM_HZ = 60
+SIM_DT = 1.0 / SIM_HZ
+MAX_SIM_STEPS = 5    # catch-up cap per frame; beyond it the game slows down
+PACER_SPIN_MS = 2.0  # busy-wait tail of each frame wait
+
+# Adaptive quality ("auto" or a fixed tier: "low", "medium", "high")
+QUALITY_TIER = "auto"
+QUALITY_WINDOW = 120        # frames per measurement window
+QUALITY_DOWNGRADE = 0.9     # p90 over this fraction of the budget -> lower tier
+QUALITY_UPGRADE = 0.5       # p90 under this fraction of the budget...
+QUALITY_UPGRADE_HOLD = 300  # ...for this many frames in a row -> higher tier
+
+# Idle throttling (menus, unfocused and minimized window)
+MENU_AMBIENT_FPS = 15    # menus redraw on input, otherwise at this cadence
+UNFOCUSED_FPS = 5        # frame rate cap while the window has no focus
+MINIMIZED_WAIT_MS = 500  # event wait per loop while minimized (no update/render)
+
+# Session stats (SQLite; python -m stats_store migrate ingests old stats_*.json)
+STATS_DB = "data/stats.db"
+STATS_BATCH = 16     # rows per write transaction when migrating (the game writes each session)
+
+# Leaderboard (per-level top N; submissions appended to a log, compacted periodically)
+LEADERBOARD_FILE = "data/leaderboard.txt"
+LEADERBOARD_LOG = "data/leaderboard.log"
+LEADERBOARD_SIZE = 10
+LEADERBOARD_COMPACT_EVERY = 256  # log records before folding into LEADERBOARD_FILE
+
+# Telemetry (gameplay events, written by a background thread)
+TELEMETRY_ENABLED = True
+TELEMETRY_DIR = "data/telemetry"
+TELEMETRY_QUEUE = 4096              # queued events before dropping (low priority at half)
+TELEMETRY_BATCH = 256               # events per compressed write
+TELEMETRY_FLUSH_SECONDS = 2.0       # writer wakes at least this often
+TELEMETRY_ROTATE_BYTES = 1 << 20    # compressed size before starting a new file
+TELEMETRY_KEEP = 50                 # newest telemetry files kept on disk
+TELEMETRY_FOCUS_INTERVAL = 1.0      # seconds of play between focus samples
+
+# Analytics CLI (python -m analytics)
+ANALYTICS_INDEX = "data/analytics_index.json"  # checkpoint: read offsets + aggregate state
+ANALYTICS_ACCURACY = 0.01                      # relative error of the quantile sketches
+
+# Warm-up (caches for the first level built while the menus are idle)
+WARMUP_BUDGET_MS = 6     # game-thread warm-up work per menu frame, after the flip
+
+# Audio mixer format (asset packs store PCM in this format)
+MIXER_FREQUENCY = 44100  # sama dengan file wav
+MIXER_SIZE = -16
+MIXER_CHANNELS = 2
+MIXER_BUFFER = 512
+
+# Asset pack (python -m asset_pack build): sounds as PCM + data in one mmap'd file
+ASSET_PACK = "data/assets.pack"
+
+# Cache memory budget (cache_registry): every sprite/glow/text/sound cache together
+CACHE_BUDGET_MB = 64     # kiosk 2 GB: sisa RAM untuk OS, browser kiosk, dll.
+CACHE_LOW_WATER = 0.9    # eviksi sampai total di bawah fraksi budget ini
+
+# GC policy (gc_policy): freeze after loads, collect in frame slack
+GC_GAMEPLAY_THRESHOLD = (5000, 10, 10)  # threshold gen0 saat gameplay (default 700)
+GC_IDLE_GEN0 = 400       # koleksi di slack frame setelah sebanyak ini objek muda
+GC_SLACK_MARGIN_MS = 2.0 # sisa slack yang tidak dipakai (spin pacer)
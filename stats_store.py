@@ -0,0 +1,199 @@
+# stats_store.py
+"""
+Session stats in one SQLite database instead of a JSON file per run.
+
+    python -m stats_store migrate [--remove]   # ingest data/stats_*.json
+    python -m stats_store summary              # aggregates per level
+"""
+import argparse
+import atexit
+import glob
+import json
+import os
+import sqlite3
+import time
+
+from settings import STATS_DB, STATS_BATCH
+
+# Kolom tetap; field lain dari dict stats disimpan di kolom extra (JSON)
+COLUMNS = ("timestamp", "level", "score", "repels", "plants_remaining", "duration", "focus")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    timestamp REAL NOT NULL,
+    level INTEGER,
+    score INTEGER,
+    repels INTEGER,
+    plants_remaining INTEGER,
+    duration REAL,
+    focus REAL,
+    extra TEXT,
+    source TEXT UNIQUE
+);
+CREATE INDEX IF NOT EXISTS sessions_level_time ON sessions (level, timestamp);
+"""
+
+AGGREGATES = ("COUNT(*), AVG(score), MAX(score), AVG(duration), SUM(repels), "
+              "MIN(timestamp), MAX(timestamp)")
+AGGREGATE_KEYS = ("sessions", "avg_score", "best_score", "avg_duration", "total_repels",
+                  "first", "last")
+
+
+class StatsStore:
+    """
+    Append-mostly session store. add() buffers rows and writes them in one
+    transaction per STATS_BATCH sessions (or on flush/close); the game
+    flushes after every session (save_stats_json), migrate_json batches.
+    """
+    def __init__(self, path=STATS_DB, batch=STATS_BATCH):
+        self.path = path
+        self.batch = batch
+        self.pending = []
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path)
+        # WAL: append murah dan pembaca tidak memblokir penulis
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+
+    # ===============================
+    # WRITES
+    # ===============================
+    def add(self, stats, source=None):
+        """Queue one session dict; rows with an already-seen source are ignored"""
+        stats = dict(stats)
+        stats.setdefault("timestamp", time.time())
+        row = [stats.pop(column, None) for column in COLUMNS]
+        row.append(json.dumps(stats) if stats else None)
+        row.append(source)
+        self.pending.append(row)
+        if len(self.pending) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        with self.db:
+            self.db.executemany(
+                f"INSERT OR IGNORE INTO sessions ({', '.join(COLUMNS)}, extra, source) "
+                f"VALUES ({', '.join('?' * (len(COLUMNS) + 2))})", self.pending)
+        self.pending.clear()
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    # ===============================
+    # QUERIES
+    # ===============================
+    def _where(self, level, since, until):
+        clauses, params = [], []
+        if level is not None:
+            clauses.append("level = ?")
+            params.append(level)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def sessions(self, level=None, since=None, until=None, limit=None):
+        """Session dicts, newest first"""
+        self.flush()
+        where, params = self._where(level, since, until)
+        sql = f"SELECT {', '.join(COLUMNS)}, extra FROM sessions{where} ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        result = []
+        for row in self.db.execute(sql, params):
+            stats = dict(zip(COLUMNS, row))
+            if row[-1]:
+                stats.update(json.loads(row[-1]))
+            result.append(stats)
+        return result
+
+    def aggregate(self, level=None, since=None, until=None):
+        """Count plus score/duration/repels aggregates over matching sessions"""
+        self.flush()
+        where, params = self._where(level, since, until)
+        row = self.db.execute(f"SELECT {AGGREGATES} FROM sessions{where}", params).fetchone()
+        return dict(zip(AGGREGATE_KEYS, row))
+
+    def per_level(self, since=None, until=None):
+        """aggregate() per level in one grouped query (level None = legacy rows)"""
+        self.flush()
+        where, params = self._where(None, since, until)
+        rows = self.db.execute(
+            f"SELECT level, {AGGREGATES} FROM sessions{where} GROUP BY level ORDER BY level",
+            params)
+        return {row[0]: dict(zip(AGGREGATE_KEYS, row[1:])) for row in rows}
+
+    # ===============================
+    # MIGRATION
+    # ===============================
+    def migrate_json(self, directory, remove=False):
+        """
+        Ingest legacy stats_<timestamp>.json files. The file name is the row's
+        source, so running it twice doesn't duplicate sessions. remove deletes
+        only the files that were ingested; unreadable ones are kept.
+        Returns (files read, rows added).
+        """
+        paths = sorted(glob.glob(os.path.join(directory, "stats_*.json")))
+        self.flush()
+        before = self.db.total_changes
+        ingested = []
+        for path in paths:
+            try:
+                with open(path) as f:
+                    stats = json.load(f)
+            except (OSError, ValueError):
+                continue
+            self.add(stats, source=os.path.basename(path))
+            ingested.append(path)
+        self.flush()
+        added = self.db.total_changes - before
+        if remove:
+            for path in ingested:
+                os.remove(path)
+        return len(paths), added
+
+
+_store = None
+
+
+def store():
+    """Shared store for the game, opened on first use and closed at exit"""
+    global _store
+    if _store is None:
+        _store = StatsStore()
+        atexit.register(_store.close)
+    return _store
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--db", default=STATS_DB)
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="ingest stats_*.json files")
+    migrate.add_argument("--dir", default=os.path.dirname(STATS_DB) or ".")
+    migrate.add_argument("--remove", action="store_true", help="delete the JSON files afterwards")
+    sub.add_parser("summary", help="print aggregates per level as JSON")
+    args = parser.parse_args()
+
+    db = StatsStore(args.db)
+    if args.command == "migrate":
+        files, added = db.migrate_json(args.dir, remove=args.remove)
+        print(f"{files} files read, {added} sessions added")
+    else:
+        print(json.dumps({"all": db.aggregate(), "levels": db.per_level()}, indent=2))
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# telemetry.py
+"""
+Gameplay event telemetry written off the game loop.
+
+emit() only appends to a bounded deque; a writer thread drains it in
+batches into gzip-compressed JSON-line files under TELEMETRY_DIR, starting
+a new file every TELEMETRY_ROTATE_BYTES. When the queue backs up, events
+are dropped and counted instead of blocking a frame: low-priority kinds
+once it is half full, everything at TELEMETRY_QUEUE. Drop counts are
+written to the stream as "telemetry_dropped" records. A batch that can't
+be written (full or read-only card, directory removed) is counted as a
+write error and the next batch starts a new file; the writer keeps going.
+"""
+import atexit
+import gzip
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from settings import (TELEMETRY_ENABLED, TELEMETRY_DIR, TELEMETRY_QUEUE, TELEMETRY_BATCH,
+                      TELEMETRY_FLUSH_SECONDS, TELEMETRY_ROTATE_BYTES, TELEMETRY_KEEP)
+
+# Sampel periodik; boleh hilang lebih dulu saat antrian penuh
+LOW_PRIORITY = {"focus_sample"}
+
+
+class TelemetryWriter:
+    def __init__(self, directory=TELEMETRY_DIR, capacity=TELEMETRY_QUEUE,
+                 batch=TELEMETRY_BATCH, flush_seconds=TELEMETRY_FLUSH_SECONDS,
+                 rotate_bytes=TELEMETRY_ROTATE_BYTES, keep=TELEMETRY_KEEP):
+        self.directory = directory
+        self.capacity = capacity
+        self.batch = batch
+        self.flush_seconds = flush_seconds
+        self.rotate_bytes = rotate_bytes
+        self.keep = keep
+
+        # deque.append/popleft atomik di bawah GIL: game thread tidak pernah
+        # menunggu lock milik writer
+        self.queue = deque()
+        self.dropped = {}        # kind -> count (hanya ditulis game thread)
+        self.reported = {}       # drop counts terakhir yang sudah ditulis ke file
+        self.written = 0
+        self.write_errors = 0    # batch yang gagal ditulis (OSError)
+        self.failed = 0          # record di batch tersebut
+        self.path = None
+        self.file_index = 0
+
+        self.wake = threading.Event()
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name="telemetry", daemon=True)
+        self.thread.start()
+
+    # ===============================
+    # GAME THREAD
+    # ===============================
+    def emit(self, kind, **fields):
+        """Queue an event; returns False if it was dropped"""
+        queued = len(self.queue)
+        limit = self.capacity // 2 if kind in LOW_PRIORITY else self.capacity
+        if queued >= limit:
+            self.dropped[kind] = self.dropped.get(kind, 0) + 1
+            return False
+        fields["type"] = kind
+        fields["t"] = time.time()
+        self.queue.append(fields)
+        if queued + 1 >= self.batch:
+            self.wake.set()
+        return True
+
+    def stop(self):
+        """Write everything still queued and join the writer"""
+        if self.stopping:
+            return
+        self.stopping = True
+        self.wake.set()
+        self.thread.join()
+
+    def overlay_lines(self):
+        return [f"telemetry queued {len(self.queue)}  written {self.written}  "
+                f"dropped {sum(self.dropped.values())}  write errors {self.write_errors}"]
+
+    # ===============================
+    # WRITER THREAD
+    # ===============================
+    def run(self):
+        while True:
+            self.wake.wait(self.flush_seconds)
+            self.wake.clear()
+            stopping = self.stopping
+            while self.queue:
+                self.write_batch()
+            self.write_drops()
+            if stopping:
+                return
+
+    def take(self):
+        records = []
+        queue = self.queue
+        for _ in range(min(len(queue), self.batch)):
+            records.append(queue.popleft())
+        return records
+
+    def write_batch(self):
+        records = self.take()
+        if records:
+            self.write(records)
+
+    def write_drops(self):
+        dropped = self.dropped.copy()
+        if dropped != self.reported:
+            if self.write([{"type": "telemetry_dropped", "t": time.time(), "counts": dropped}]):
+                self.reported = dropped
+
+    def write(self, records):
+        """Append records as one gzip member; False (counted) if the write failed"""
+        data = "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records)
+        try:
+            path = self.current_path()
+            # Tiap batch jadi satu member gzip; file multi-member tetap gzip yang valid
+            with gzip.open(path, "ab") as f:
+                f.write(data.encode())
+        except OSError as e:
+            if not self.write_errors:
+                print(f"Telemetry write failed: {e}")
+            self.write_errors += 1
+            self.failed += len(records)
+            self.path = None  # batch berikutnya membuka file baru
+            return False
+        self.written += len(records)
+        return True
+
+    def current_path(self):
+        if self.path is None or os.path.getsize(self.path) >= self.rotate_bytes:
+            os.makedirs(self.directory, exist_ok=True)
+            self.file_index += 1
+            stamp = time.strftime("%Y%m%d-%H%M%S")
+            self.path = os.path.join(
+                self.directory, f"telemetry_{stamp}_{os.getpid()}_{self.file_index}.jsonl.gz")
+            self.prune()
+        return self.path
+
+    def prune(self):
+        files = sorted((entry for entry in os.scandir(self.directory)
+                        if entry.name.startswith("telemetry_") and entry.name.endswith(".gz")),
+                       key=lambda entry: entry.stat().st_mtime)
+        for entry in files[:max(0, len(files) - self.keep + 1)]:
+            os.remove(entry.path)
+
+
+_writer = None
+
+
+def writer():
+    """Shared writer, started on first use and stopped at exit"""
+    global _writer
+    if _writer is None:
+        _writer = TelemetryWriter()
+        atexit.register(_writer.stop)
+    return _writer
+
+
+def emit(kind, **fields):
+    if TELEMETRY_ENABLED:
+        writer().emit(kind, **fields)
+
+
+def stop():
+    if _writer is not None:
+        _writer.stop()
+
+
+def overlay_lines():
+    return _writer.overlay_lines() if _writer is not None else []
@@ -0,0 +1,54 @@
+# tests/test_analytics.py
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from analytics import Analytics
+from stats_store import StatsStore
+
+SESSION = {"level": 1, "score": 120, "completed": True}
+
+
+class MigratedSessionTest(unittest.TestCase):
+    """A stats_*.json copied into stats.db (migrate without --remove) counts once"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.index = os.path.join(self.dir, "index.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def write_json(self):
+        with open(os.path.join(self.dir, "stats_1.json"), "w") as f:
+            json.dump(SESSION, f)
+
+    def migrate(self):
+        db = StatsStore(os.path.join(self.dir, "stats.db"))
+        db.migrate_json(self.dir)
+        db.close()
+
+    def sessions(self, analytics):
+        return sum(stats.sessions for stats in analytics.report.levels.values())
+
+    def test_json_and_row_in_one_scan(self):
+        self.write_json()
+        self.migrate()
+        analytics = Analytics(index_path=None)
+        analytics.scan(self.dir)
+        self.assertEqual(self.sessions(analytics), 1)
+
+    def test_row_migrated_after_json_was_indexed(self):
+        self.write_json()
+        first = Analytics(index_path=self.index)
+        first.scan(self.dir)
+        first.save()
+        self.migrate()
+        second = Analytics(index_path=self.index)
+        second.scan(self.dir)
+        self.assertEqual(self.sessions(second), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
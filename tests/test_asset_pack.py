@@ -0,0 +1,44 @@
+# tests/test_asset_pack.py
+import os
+import shutil
+import tempfile
+import unittest
+
+from asset_pack import AssetPack, build
+
+
+class StalePackTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.dir, "questions.json")
+        self.path = os.path.join(self.dir, "assets.pack")
+        with open(self.source, "w") as f:
+            f.write('{"1": []}')
+        build(self.path, sources=[self.source])
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_unchanged_source_is_served_from_pack(self):
+        pack = AssetPack(self.path)
+        self.assertIn(self.source, pack)
+        pack.close()
+
+    def test_changed_source_falls_back_to_loose_file(self):
+        with open(self.source, "w") as f:
+            f.write('{"1": [], "2": []}')
+        pack = AssetPack(self.path)
+        self.assertNotIn(self.source, pack)
+        pack.close()
+
+    def test_touched_source_rewrites_index(self):
+        stat = os.stat(self.source)
+        os.utime(self.source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertEqual(build(self.path, sources=[self.source]), ([], [self.source]))
+        pack = AssetPack(self.path)
+        self.assertIn(self.source, pack)
+        pack.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+# tests/test_audio_manager.py
+import os
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import unittest
+
+import pygame
+
+from audio_manager import AudioManager
+from settings import MIXER_CHANNELS, MIXER_FREQUENCY
+
+
+class LoaderFailureTest(unittest.TestCase):
+    def test_ready_even_if_loading_fails(self):
+        audio = AudioManager()
+
+        def broken():
+            raise RuntimeError("broken sound table")
+        audio.load_sounds = broken
+        audio.play_music("missing.ogg")
+        try:
+            audio.load()
+        except RuntimeError:
+            pass
+        self.assertTrue(audio.ready.is_set())
+        self.assertIsNone(audio.pending_music)
+
+    def test_placeholder_matches_mixer_format(self):
+        audio = AudioManager()
+        audio.load()
+        if not pygame.mixer.get_init():
+            self.skipTest("no audio device")
+        self.assertEqual(pygame.mixer.get_init()[::2], (MIXER_FREQUENCY, MIXER_CHANNELS))
+        audio.create_placeholder_sound("hover")
+        self.assertAlmostEqual(audio.sounds["hover"].get_length(), 0.1, places=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
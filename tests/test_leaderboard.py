@@ -0,0 +1,40 @@
+# tests/test_leaderboard.py
+import os
+import shutil
+import tempfile
+import unittest
+
+from leaderboard import Leaderboard
+
+
+class TornLogTest(unittest.TestCase):
+    """A half-written last line from a crash must not swallow the next record"""
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "leaderboard.txt")
+        self.log_path = os.path.join(self.dir, "leaderboard.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def board(self):
+        return Leaderboard(self.path, self.log_path)
+
+    def names(self, board):
+        return [entry["name"] for entry in board.top(1)]
+
+    def test_submit_after_torn_line_is_kept(self):
+        self.board().submit("a", 10, 1)
+        with open(self.log_path, "ab") as f:
+            f.write(b'{"name": "crash", "sco')
+        restarted = self.board()
+        self.assertEqual([e["name"] for e in restarted.submit("b", 50, 1)], ["b", "a"])
+        fresh = self.board()
+        self.assertEqual(self.names(fresh), ["b", "a"])
+        self.assertEqual(fresh.skipped, 0)
+        restarted.submit("c", 30, 1)
+        self.assertEqual(self.names(self.board()), ["b", "c", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
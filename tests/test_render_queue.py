@@ -0,0 +1,48 @@
+# tests/test_render_queue.py
+import unittest
+
+from gfx.render_queue import LAYER_BUGS, LAYER_PLANT_UI, RenderQueue
+
+
+class Target:
+    """Records what flush() draws, in order"""
+    def __init__(self):
+        self.drawn = []
+
+    def blits(self, items, doreturn=True):
+        self.drawn.extend(item[0] for item in items)
+
+
+class SubmissionOrderTest(unittest.TestCase):
+    def test_overlapping_layer_keeps_submission_order(self):
+        a, b = object(), object()
+        queue = RenderQueue()
+        for surface in (b, a, b, a):
+            queue.submit(surface, (0, 0), LAYER_BUGS)
+        target = Target()
+        queue.flush(target)
+        self.assertEqual(target.drawn, [b, a, b, a])
+
+    def test_draw_call_runs_where_it_was_queued(self):
+        a, b = object(), object()
+        queue = RenderQueue()
+        queue.submit(a, (0, 0), LAYER_BUGS)
+        queue.call(lambda target: target.drawn.append("call"), LAYER_BUGS)
+        queue.submit(b, (0, 0), LAYER_BUGS)
+        target = Target()
+        queue.flush(target)
+        self.assertEqual(target.drawn, [a, "call", b])
+
+    def test_sorted_layer_groups_textures(self):
+        a, b = object(), object()
+        queue = RenderQueue()
+        for surface in (a, b, a, b):
+            queue.submit(surface, (0, 0), LAYER_PLANT_UI)
+        target = Target()
+        queue.flush(target)
+        self.assertEqual(target.drawn[:2], [target.drawn[0]] * 2)
+        self.assertEqual(len(queue), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+# tests/test_stats_store.py
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from stats_store import StatsStore
+
+
+class MigrateRemoveTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_remove_keeps_files_that_were_not_ingested(self):
+        with open(os.path.join(self.dir, "stats_1.json"), "w") as f:
+            json.dump({"level": 1, "score": 50}, f)
+        with open(os.path.join(self.dir, "stats_2.json"), "w") as f:
+            f.write("{not json")
+        db = StatsStore(os.path.join(self.dir, "stats.db"))
+        files, added = db.migrate_json(self.dir, remove=True)
+        db.close()
+        self.assertEqual((files, added), (2, 1))
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "stats_1.json")))
+        self.assertTrue(os.path.exists(os.path.join(self.dir, "stats_2.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
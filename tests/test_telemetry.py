@@ -0,0 +1,35 @@
+# tests/test_telemetry.py
+import os
+import shutil
+import tempfile
+import unittest
+
+from telemetry import TelemetryWriter
+
+
+class WriteErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.blocked = os.path.join(self.dir, "telemetry")
+        with open(self.blocked, "w"):
+            pass  # file di tempat direktori: makedirs gagal dengan OSError
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_writer_survives_and_counts_failed_batches(self):
+        writer = TelemetryWriter(self.blocked, flush_seconds=60)
+        writer.emit("hit")
+        writer.write_batch()
+        self.assertEqual((writer.write_errors, writer.failed, writer.written), (1, 1, 0))
+        self.assertIn("write errors 1", writer.overlay_lines()[0])
+
+        os.remove(self.blocked)
+        writer.emit("hit")
+        writer.stop()
+        self.assertEqual(writer.written, 1)
+        self.assertEqual(len(os.listdir(self.blocked)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,231 @@
 # ui/hud.py
+import math
+
 import pygame
+from gfx.surfaces import new_surface
+from gfx.fonts import sysfont
+from gfx.text_atlas import atlas
+from settings import WIDTH
+
+TITLE_STEPS = 16  # tingkat warna denyut judul yang di-cache
+
+# Layout header (sama dengan draw_game_header lama)
+BAR_X, BAR_Y = 450, 28
+BAR_WIDTH, BAR_HEIGHT = 200, 20
+PROGRESS_WIDTH, PROGRESS_HEIGHT = 100, 4
+PROGRESS_X = BAR_X + BAR_WIDTH - PROGRESS_WIDTH
+PROGRESS_Y = BAR_Y + BAR_HEIGHT + 12
+PANEL_WIDTH, PANEL_HEIGHT = 220, 80
+PANEL_X, PANEL_Y = WIDTH - PANEL_WIDTH - 20, 5
+CELL_WIDTH, CELL_HEIGHT = PANEL_WIDTH // 2, PANEL_HEIGHT // 2
+
+# Warna angka (satu glyph atlas per font + warna)
+FOCUS_DIGITS = (255, 255, 255)
+PROGRESS_DIGITS = (200, 200, 200)
+SCORE_DIGITS = (255, 255, 180)
+REPELS_DIGITS = (180, 255, 180)
+
+
+class Bound:
+    """Cached surface rebuilt only when the value it is bound to changes"""
+    _unset = object()
+
+    def __init__(self, getter, render):
+        self.getter = getter
+        self.render = render
+        self.value = self._unset
+        self.surface = None
+
+    def get(self):
+        value = self.getter()
+        if value != self.value:
+            self.value = value
+            self.surface = self.render(value)
+        return self.surface
+
+
+def hud_fonts():
+    """Title, bar, small, label and value fonts (shared through gfx.fonts)"""
+    return (sysfont("bahnschrift", 32, bold=True, italic=True),
+            sysfont("arial", 17, bold=True),
+            sysfont("arial", 12),
+            sysfont("arial", 13),
+            sysfont("arial", 18, bold=True))
+
+
+def prebake_hud():
+    """HUD fonts and digit atlases (warm-up); chrome is per level, built with the scene"""
+    _, bar_font, small_font, _, value_font = hud_fonts()
+    sysfont("Russo One", 21)
+    atlas(bar_font, FOCUS_DIGITS)
+    atlas(small_font, PROGRESS_DIGITS)
+    atlas(value_font, SCORE_DIGITS)
+    atlas(value_font, REPELS_DIGITS)
+
 
 class HUD:
+    """
+    Game header: title, focus bar, target progress and stats panel.
+    Static chrome is drawn once per level; the focus bar is re-rendered
+    only when focus changes and numbers are drawn from glyph atlases.
+    """
     def __init__(self, scene):
-        # HUD sederhana atau kosong
         self.scene = scene
-        self.font = pygame.font.SysFont("arial", 16)
-    
+        (self.title_font, self.bar_font, self.small_font, self.label_font,
+         self.value_font) = hud_fonts()
+
+        self.chrome = self.build_chrome()
+        self.titles = {}  # pulse step -> judul; semua langkah di-cache
+        self.focus_fill = Bound(scene.get_focus_level, self.render_focus_fill)
+        self.focus_digits = atlas(self.bar_font, FOCUS_DIGITS)
+        self.progress_digits = atlas(self.small_font, PROGRESS_DIGITS)
+        self.score_digits = atlas(self.value_font, SCORE_DIGITS)
+        self.repels_digits = atlas(self.value_font, REPELS_DIGITS)
+
+        # Overlay putih untuk denyut fokus rendah, alpha diatur per frame
+        self.pulse_overlay = new_surface((BAR_WIDTH, BAR_HEIGHT), alpha=False)
+        self.pulse_overlay.fill((255, 255, 255))
+
+    # ===============================
+    # STATIC CHROME
+    # ===============================
+    def build_chrome(self):
+        scene = self.scene
+        chrome = new_surface((WIDTH, PANEL_Y + PANEL_HEIGHT))
+
+        # Top bar background
+        for y in range(80):
+            alpha = 180 - int(y * 0.5)
+            pygame.draw.line(chrome, (20, 30, 40, alpha), (0, y), (WIDTH, y))
+
+        subtitle = sysfont("Russo One", 21).render("Protect Your Focus", True, (200, 200, 220))
+        chrome.blit(subtitle, (30, 55))
+
+        # Label + wadah focus bar
+        chrome.blit(self.bar_font.render("Focus", True, (240, 240, 240)), (BAR_X - 55, BAR_Y + 3))
+        bar_container = pygame.Rect(BAR_X - 3, BAR_Y - 3, BAR_WIDTH + 6, BAR_HEIGHT + 6)
+        pygame.draw.rect(chrome, (40, 50, 70), bar_container, border_radius=6)
+        pygame.draw.rect(chrome, (80, 90, 110), bar_container, 2, border_radius=6)
+
+        # Progress bar kecil (latar)
+        pygame.draw.rect(chrome, (60, 60, 80),
+                         (PROGRESS_X, PROGRESS_Y, PROGRESS_WIDTH, PROGRESS_HEIGHT))
+
+        # Stats panel dengan efek depth
+        panel_bg = new_surface((PANEL_WIDTH, PANEL_HEIGHT))
+        for y in range(PANEL_HEIGHT):
+            alpha = 120 + int(30 * (y / PANEL_HEIGHT))
+            pygame.draw.line(panel_bg, (30, 40, 50, alpha), (0, y), (PANEL_WIDTH, y))
+        pygame.draw.rect(panel_bg, (255, 255, 255, 40),
+                         (0, 0, PANEL_WIDTH, PANEL_HEIGHT), 2, border_radius=8)
+        pygame.draw.rect(panel_bg, (0, 0, 0, 60),
+                         (2, 2, PANEL_WIDTH - 4, PANEL_HEIGHT - 4), 1, border_radius=6)
+        chrome.blit(panel_bg, (PANEL_X, PANEL_Y))
+
+        # Label grid 2x2; Level dan Plants tetap selama level
+        labels = ["Score", "Level", "Repels", "Plants"]
+        static_values = {1: (f"{scene.level_id}", (255, 180, 180)), 3: ("3", (180, 180, 255))}
+        for i, label in enumerate(labels):
+            col, row = i % 2, i // 2
+            cell_x = PANEL_X + col * CELL_WIDTH
+            cell_y = PANEL_Y + row * CELL_HEIGHT
+
+            label_text = self.label_font.render(label, True, (200, 200, 220))
+            chrome.blit(label_text, label_text.get_rect(center=self.label_center(i)))
+            if i in static_values:
+                value, color = static_values[i]
+                value_text = self.value_font.render(value, True, color)
+                chrome.blit(value_text, value_text.get_rect(center=self.value_center(i)))
+
+            # Garis pemisah
+            if col == 0:
+                pygame.draw.line(chrome, (255, 255, 255),
+                                 (cell_x + CELL_WIDTH - 1, cell_y + 5),
+                                 (cell_x + CELL_WIDTH - 1, cell_y + CELL_HEIGHT - 5), 1)
+            if row == 0:
+                pygame.draw.line(chrome, (255, 255, 255),
+                                 (cell_x + 5, cell_y + CELL_HEIGHT - 1),
+                                 (cell_x + CELL_WIDTH - 5, cell_y + CELL_HEIGHT - 1), 1)
+        return chrome
+
+    @staticmethod
+    def label_center(i):
+        col, row = i % 2, i // 2
+        return (PANEL_X + col * CELL_WIDTH + CELL_WIDTH // 2,
+                PANEL_Y + row * CELL_HEIGHT + CELL_HEIGHT // 2 - 10)
+
+    @staticmethod
+    def value_center(i):
+        col, row = i % 2, i // 2
+        return (PANEL_X + col * CELL_WIDTH + CELL_WIDTH // 2,
+                PANEL_Y + row * CELL_HEIGHT + CELL_HEIGHT // 2 + 12)
+
+    # ===============================
+    # BOUND RENDERERS
+    # ===============================
+    def title_step(self):
+        pulse = (math.sin(self.scene.pulse_timer * 1.5) + 1) * 0.5
+        return int(pulse * (TITLE_STEPS - 1) + 0.5)
+
+    def render_title(self, step):
+        pulse = step / (TITLE_STEPS - 1)
+        title_color = (int(180 + 50 * pulse), int(220 + 20 * pulse), 255)
+        return self.title_font.render("DISTRACTION GARDEN", True, title_color)
+
+    def render_focus_fill(self, focus_percent):
+        fill_width = max(0, int((focus_percent / 100) * BAR_WIDTH))
+        if fill_width <= 0:
+            return None
+        if focus_percent > 70:
+            color_start, color_end = (80, 220, 120), (120, 255, 160)
+        elif focus_percent > 40:
+            color_start, color_end = (250, 200, 80), (255, 220, 100)
+        else:
+            color_start, color_end = (220, 70, 60), (255, 100, 90)
+
+        fill = new_surface((fill_width, BAR_HEIGHT), alpha=False)
+        for i in range(fill_width):
+            ratio = i / fill_width
+            color = tuple(int(a + (b - a) * ratio) for a, b in zip(color_start, color_end))
+            pygame.draw.line(fill, color, (i, 0), (i, BAR_HEIGHT - 1))
+        pygame.draw.rect(fill, (255, 255, 255), (0, 0, fill_width, BAR_HEIGHT), 1, border_radius=4)
+        return fill
+
+    # ===============================
+    # DRAW
+    # ===============================
     def draw(self, screen):
-        # Kosongkan karena sudah ada draw_game_header()
-        pass  # Tidak menggambar apa-apa
\ No newline at end of file
+        scene = self.scene
+        screen.blit(self.chrome, (0, 0))
+        step = self.title_step()
+        title = self.titles.get(step)
+        if title is None:
+            title = self.titles[step] = self.render_title(step)
+        screen.blit(title, (25, 15))
+
+        # Focus bar
+        focus_percent = scene.get_focus_level()
+        fill = self.focus_fill.get()
+        if fill is not None:
+            screen.blit(fill, (BAR_X, BAR_Y))
+            # Pulse effect saat fokus rendah
+            if focus_percent < 30:
+                pulse_alpha = int(100 * (0.5 + 0.5 * math.sin(scene.pulse_timer * 4)))
+                self.pulse_overlay.set_alpha(pulse_alpha)
+                screen.blit(self.pulse_overlay, (BAR_X, BAR_Y),
+                            (0, 0, fill.get_width(), BAR_HEIGHT))
+        self.focus_digits.draw(screen, f"{focus_percent}%", (BAR_X + BAR_WIDTH + 15, BAR_Y + 2))
+
+        # Progress score (target)
+        self.progress_digits.draw(screen, f"Target: {scene.player.score}/{scene.target_score}",
+                                  (BAR_X, BAR_Y + BAR_HEIGHT + 8))
+        progress_ratio = min(1.0, scene.player.score / scene.target_score)
+        if progress_ratio > 0:
+            progress_color = (100, 200, 100) if progress_ratio >= 1.0 else (100, 150, 255)
+            pygame.draw.rect(screen, progress_color,
+                             (PROGRESS_X, PROGRESS_Y, int(PROGRESS_WIDTH * progress_ratio),
+                              PROGRESS_HEIGHT))
+
+        # Nilai stats yang berubah
+        self.score_digits.draw(screen, str(scene.player.score), self.value_center(0), "center")
+        self.repels_digits.draw(screen, str(scene.repels), self.value_center(2), "center")
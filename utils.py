@@ -1,32 +1,23 @@
-import os, json, time
+import os
 
-DATA_DIR = "data"
-LEADERBOARD_FILE = os.path.join(DATA_DIR, "leaderboard.txt")
-
-def ensure_data_dir():
-    if not os.path.exists(DATA_DIR):
-        os.makedirs(DATA_DIR)
+def atomic_write(path, lines, mode="w"):
+    """Write lines (bytes chunks with mode="wb") to a temp file next to path, fsync, then rename over path"""
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, mode) as f:
+        f.writelines(lines)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 def save_stats_json(stats):
-    ensure_data_dir()
-    path = os.path.join(DATA_DIR, f"stats_{int(time.time())}.json")
-    with open(path, "w") as f:
-        json.dump(stats, f, indent=2)
-    return path
+    # Dulu satu file JSON per sesi; sekarang satu baris di stats store
+    from stats_store import store
+    db = store()
+    db.add(stats)
+    db.flush()  # langsung ditulis: mati listrik/crash tidak menghilangkan sesi
+    return db.path
 
-def append_leaderboard(name, score):
-    ensure_data_dir()
-    entries = []
-    if os.path.exists(LEADERBOARD_FILE):
-        with open(LEADERBOARD_FILE,"r") as f:
-            for line in f:
-                try:
-                    entries.append(json.loads(line.strip()))
-                except:
-                    pass
-    entries.append({"name": name, "score": score, "ts": int(time.time())})
-    entries = sorted(entries, key=lambda x: x["score"], reverse=True)[:10]
-    with open(LEADERBOARD_FILE,"w") as f:
-        for e in entries:
-            f.write(json.dumps(e) + "\n")
-    return entries
+def append_leaderboard(name, score, level=None):
+    # Top-N per level dengan log append-only dan penulisan atomik
+    from leaderboard import board
+    return board().submit(name, score, level)
@@ -0,0 +1,166 @@
+# warmup.py
+"""
+Builds the caches of the first level while the menus are idle.
+
+Without it the first GameScene and QuestionScene hitch: game modules
+(and NumPy) are imported and sprites, fonts and the question vignette are
+built on demand. Tasks that don't touch pygame surfaces (imports,
+question data) run on a worker thread; the rest run on the game thread
+from step(), which Game.run calls after each frame flip until
+WARMUP_BUDGET_MS of work has been done. Game prepares the warm-up at
+startup; the first step() (after the first frame) starts the worker.
+Scenes check ready()/progress() before starting a level.
+"""
+import threading
+import time
+from collections import deque
+
+from settings import WARMUP_BUDGET_MS
+
+
+# ===============================
+# TASKS
+# ===============================
+def import_game_modules():
+    import scenes.game_scene  # ikut: entities, HUD, QuestionScene, NumPy
+
+
+def load_questions():
+    from scenes.question_scene import load_questions
+    load_questions()
+
+
+def bug_sprites():
+    from entities.bug import prebake_bug_sprites
+    prebake_bug_sprites()
+
+
+def plant_sprites(level):
+    def task():
+        from entities.plant import plant_frames
+        plant_frames(level)
+    task.__name__ = f"plant_sprites_{level}"
+    return task
+
+
+def plant_arcs():
+    from entities.plant import ARC_STEPS, growth_arc
+    for step in range(1, ARC_STEPS):
+        growth_arc(step / ARC_STEPS)
+
+
+def hud_assets():
+    from ui.hud import prebake_hud
+    prebake_hud()
+
+
+def question_assets(size):
+    def task():
+        from scenes.question_scene import prebake_question_assets
+        prebake_question_assets(size)
+    task.__name__ = "question_assets"
+    return task
+
+
+def default_tasks(screen_size):
+    """(worker tasks, game-thread tasks) for the first level"""
+    worker = [import_game_modules, load_questions]
+    frame = [bug_sprites, plant_sprites(1), plant_sprites(2), plant_sprites(3), plant_arcs,
+             hud_assets, question_assets(screen_size)]
+    return worker, frame
+
+
+# ===============================
+# SCHEDULER
+# ===============================
+class Warmup:
+    def __init__(self, worker_tasks, frame_tasks, budget_ms=WARMUP_BUDGET_MS):
+        self.worker_tasks = list(worker_tasks)
+        self.frame_tasks = deque(frame_tasks)
+        self.budget = budget_ms / 1000.0
+        self.total = len(self.worker_tasks) + len(self.frame_tasks)
+        # Tiap counter hanya ditulis satu thread
+        self.worker_count = 0
+        self.frame_count = 0
+        self.timings = {}  # task name -> ms
+        self.started = None
+        self.finished = None
+        self.worker_done = threading.Event()
+        self.thread = None
+
+    def run_task(self, task):
+        start = time.perf_counter()
+        try:
+            task()
+        except Exception:
+            # Cache yang gagal dibangun dibuat lagi saat dipakai; menu jangan tertahan
+            import traceback  # tidak ikut startup
+            traceback.print_exc()
+        self.timings[task.__name__] = (time.perf_counter() - start) * 1000.0
+
+    def run_worker(self):
+        for task in self.worker_tasks:
+            self.run_task(task)
+            self.worker_count += 1
+        self.worker_done.set()
+
+    def step(self):
+        """Run game-thread tasks for up to one frame budget (at least one task)"""
+        if self.thread is None:
+            # Worker baru mulai setelah frame pertama, supaya tidak berebut GIL dengannya
+            self.started = time.perf_counter()
+            self.thread = threading.Thread(target=self.run_worker, name="warmup", daemon=True)
+            self.thread.start()
+        if not self.frame_tasks:
+            return
+        if not self.worker_done.is_set():
+            return  # task frame memakai modul yang sedang diimport worker
+        deadline = time.perf_counter() + self.budget
+        while self.frame_tasks:
+            self.run_task(self.frame_tasks.popleft())
+            self.frame_count += 1
+            if time.perf_counter() >= deadline:
+                break
+        if not self.frame_tasks:
+            self.finished = time.perf_counter()
+
+    def ready(self):
+        return self.worker_done.is_set() and not self.frame_tasks
+
+    def progress(self):
+        return (self.worker_count + self.frame_count) / self.total if self.total else 1.0
+
+    def overlay_lines(self):
+        if self.finished is not None:
+            return [f"warmup done in {(self.finished - self.started) * 1000:.0f} ms  "
+                    f"(work {sum(self.timings.values()):.0f} ms)"]
+        return [f"warmup {self.worker_count + self.frame_count}/{self.total}"]
+
+
+_warmup = None
+
+
+def prepare(screen_size):
+    """Set up the warm-up of the first level's caches (once); step() runs it"""
+    global _warmup
+    if _warmup is None:
+        _warmup = Warmup(*default_tasks(screen_size))
+    return _warmup
+
+
+def step():
+    if _warmup is not None:
+        _warmup.step()
+
+
+def ready():
+    """True when a level can start with hot caches (or no warm-up was prepared)"""
+    return _warmup is None or _warmup.ready()
+
+
+def progress():
+    return 1.0 if _warmup is None else _warmup.progress()
+
+
+def overlay_lines():
+    return _warmup.overlay_lines() if _warmup is not None else []